@@ -1,26 +1,38 @@
 # -*- encoding: utf -*-
 
 from supriya.tools import *
-from supriya.tools.bindingtools import bind
-from supriya.tools.nonrealtimetools import Session
-from supriya.tools.servertools import (
-    AddAction, Buffer, BufferGroup, Bus, BusGroup, Group, Server, Synth,
-    )
-from supriya.tools.soundfiletools import (
-    HeaderFormat, SampleFormat, SoundFile,
-    )
-from supriya.tools.synthdeftools import (
-    CalculationRate, DoneAction, Op, Range, SynthDef, SynthDefBuilder,
-    )
 from supriya.tools.systemtools import (
-    Assets, SupriyaConfiguration,
+    LazyImportManager, SupriyaConfiguration,
     )
 from abjad.tools.topleveltools import (
     graph, new,
     )
-from supriya import synthdefs
 
 __version__ = 0.1
 
 supriya_configuration = SupriyaConfiguration()
 del SupriyaConfiguration
+
+LazyImportManager.import_names(globals(), {
+    'AddAction': ('supriya.tools.servertools', 'AddAction'),
+    'Assets': ('supriya.tools.systemtools', 'Assets'),
+    'Buffer': ('supriya.tools.servertools', 'Buffer'),
+    'BufferGroup': ('supriya.tools.servertools', 'BufferGroup'),
+    'Bus': ('supriya.tools.servertools', 'Bus'),
+    'BusGroup': ('supriya.tools.servertools', 'BusGroup'),
+    'CalculationRate': ('supriya.tools.synthdeftools', 'CalculationRate'),
+    'DoneAction': ('supriya.tools.synthdeftools', 'DoneAction'),
+    'Group': ('supriya.tools.servertools', 'Group'),
+    'HeaderFormat': ('supriya.tools.soundfiletools', 'HeaderFormat'),
+    'Op': ('supriya.tools.synthdeftools', 'Op'),
+    'Range': ('supriya.tools.synthdeftools', 'Range'),
+    'SampleFormat': ('supriya.tools.soundfiletools', 'SampleFormat'),
+    'Server': ('supriya.tools.servertools', 'Server'),
+    'Session': ('supriya.tools.nonrealtimetools', 'Session'),
+    'SoundFile': ('supriya.tools.soundfiletools', 'SoundFile'),
+    'Synth': ('supriya.tools.servertools', 'Synth'),
+    'SynthDef': ('supriya.tools.synthdeftools', 'SynthDef'),
+    'SynthDefBuilder': ('supriya.tools.synthdeftools', 'SynthDefBuilder'),
+    'bind': ('supriya.tools.bindingtools', 'bind'),
+    'synthdefs': ('supriya.synthdefs', None),
+    })
@@ -1,10 +1,9 @@
 # -*- encoding: utf-8 -*-
-from abjad.tools import systemtools as abjad_systemtools
+from supriya.tools.systemtools.LazyImportManager import LazyImportManager
 
 
-abjad_systemtools.ImportManager.import_structured_package(
+LazyImportManager.import_structured_package(
     __path__[0],
     globals(),
     delete_systemtools=False,
     )
-del(abjad_systemtools)
@@ -5,9 +5,9 @@ Tools for interacting with and modeling objects on the SuperCollider
 **scsynth** synthesis server.
 """
 
-from abjad.tools import systemtools
+from supriya.tools.systemtools.LazyImportManager import LazyImportManager
 
-systemtools.ImportManager.import_structured_package(
+LazyImportManager.import_structured_package(
     __path__[0],
     globals(),
     )
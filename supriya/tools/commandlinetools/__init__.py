@@ -4,9 +4,9 @@
 Tools for Supriya's project maintenance scripts.
 """
 
-from abjad.tools import systemtools
+from supriya.tools.systemtools.LazyImportManager import LazyImportManager
 
-systemtools.ImportManager.import_structured_package(
+LazyImportManager.import_structured_package(
     __path__[0],
     globals(),
     )
@@ -64,10 +64,18 @@ class Buffer(SessionObject):
 
     ### PRIVATE METHODS ###
 
+    def _get_event(self, item, offset):
+        events = self._events.get(item, ())
+        index = bisect.bisect_left(events, (offset,))
+        if index < len(events) and events[index][0] == offset:
+            return events[index][1]
+        return None
+
     @SessionObject.require_offset
     def _set_event(self, item, value, offset=None):
         if offset < 0 or self.duration < offset:
             return
+        self.session._index_event(offset, self, item)
         events = self._events.setdefault(item, [])
         new_event = (offset, value)
         if not events:
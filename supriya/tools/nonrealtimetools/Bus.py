@@ -77,7 +77,7 @@ class Bus(SessionObject):
         events = self._events
         if not events:
             return 0.
-        index = bisect.bisect_left(events, (offset, 0.))
+        index = bisect.bisect_left(events, (offset,))
         if len(events) <= index:
             old_offset, value = events[-1]
         else:
@@ -110,16 +110,11 @@ class Bus(SessionObject):
 
     def _set_at_offset(self, offset, value):
         assert self.calculation_rate == synthdeftools.CalculationRate.CONTROL
+        self.session._index_event(offset, self)
         events = self._events
         event = (offset, value)
-        if not events:
-            events.append(event)
-            return
-        index = bisect.bisect_left(events, event)
-        if len(events) <= index:
-            events.append(event)
-        old_offset, _ = events[index]
-        if old_offset == offset:
+        index = bisect.bisect_left(events, (offset,))
+        if index < len(events) and events[index][0] == offset:
             events[index] = event
         else:
             events.insert(index, event)
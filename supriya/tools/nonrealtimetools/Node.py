@@ -94,18 +94,15 @@ class Node(SessionObject):
                 settings[key] = value
         else:
             for key, events in self._events.items():
-                events = events[:]
-                for i, (event_offset, value) in enumerate(events):
-                    # TODO: This is dreadfully inefficient.
-                    if id_mapping and value in id_mapping:
-                        value = id_mapping[value]
-                        events[i] = (event_offset, value)
-                index = bisect.bisect_left(events, (offset, 0.))
+                index = bisect.bisect_left(events, (offset,))
                 if len(events) <= index:
                     continue
                 event_offset, value = events[index]
-                if offset == event_offset:
-                    settings[key] = value
+                if offset != event_offset:
+                    continue
+                if id_mapping and value in id_mapping:
+                    value = id_mapping[value]
+                settings[key] = value
         return settings
 
     def _fixup_duration(self, new_duration):
@@ -130,8 +127,14 @@ class Node(SessionObject):
                 continue
             event = (split_offset, events[-1][-1])
             right_events.setdefault(name, []).insert(0, event)
+        self.session._unindex_events(self, self._get_event_offsets())
+        self.session._unindex_events(new_node, new_node._get_event_offsets())
         self._events = left_events
         new_node._events = right_events
+        for node in (self, new_node):
+            for name, offsets in node._get_event_offsets().items():
+                for offset in offsets:
+                    self.session._index_event(offset, node, name)
 
     def _fixup_node_actions(self, new_node, start_offset, stop_offset):
         for offset in sorted(self.session.states):
@@ -154,13 +157,13 @@ class Node(SessionObject):
         """
         events = self._events.get(item)
         if hasattr(self, 'synthdef'):
-            default = self.synthdef.parameters[item].value
+            default = self.synthdef._parameter_defaults[item]
             default = self._synth_kwargs.get(item, default)
         else:
             default = None
         if not events:
             return default
-        index = bisect.bisect_left(events, (offset, 0.))
+        index = bisect.bisect_left(events, (offset,))
         if len(events) <= index:
             old_offset, value = events[-1]
         else:
@@ -173,23 +176,24 @@ class Node(SessionObject):
         _, value = events[index]
         return value
 
+    def _get_event_offsets(self):
+        return {
+            name: [offset for offset, _ in events]
+            for name, events in self._events.items()
+            }
+
     def _set_at_offset(self, offset, item, value):
         """
         Relative to Synth start offset.
         """
         if offset < self.start_offset or self.stop_offset <= offset:
             return
+        self.session._index_event(offset, self, item)
         events = self._events.setdefault(item, [])
         new_event = (offset, value)
-        if not events:
-            events.append(new_event)
-            return
-        index = bisect.bisect_left(events, new_event)
-        if len(events) <= index:
-            events.append(new_event)
-        old_offset, old_value = events[index]
-        if old_offset == offset:
-            events[index] = (offset, value)
+        index = bisect.bisect_left(events, (offset,))
+        if index < len(events) and events[index][0] == offset:
+            events[index] = new_event
         else:
             events.insert(index, new_event)
 
@@ -371,6 +375,7 @@ class Node(SessionObject):
         from supriya.tools import nonrealtimetools
         if self.duration == new_duration:
             return
+        self.session._flush_transitions()
         if new_duration < self.duration:
             split_offset = self.start_offset + new_duration
             with self.session.at(split_offset):
@@ -416,6 +421,7 @@ class Node(SessionObject):
         ):
         assert self.session.active_moments
         state = self.session.active_moments[-1].state
+        self.session._flush_transitions()
         self.session._apply_transitions(state.offset)
         shards = self._split(
             offset,
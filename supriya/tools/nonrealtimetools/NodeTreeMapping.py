@@ -0,0 +1,161 @@
+# -*- encoding: utf-8 -*-
+import collections
+from supriya.tools.systemtools.SupriyaObject import SupriyaObject
+
+
+class NodeTreeMapping(SupriyaObject, collections.MutableMapping):
+    """
+    A copy-on-write mapping, for non-realtime node trees.
+
+    Copies share a base dictionary, treated as immutable, and each store
+    only the keys changed against it. Copying costs time proportional to
+    the number of changed keys, until the changes outgrow
+    ``_maximum_change_ratio`` of the base and are merged into a new base.
+
+    ::
+
+        >>> from supriya.tools import nonrealtimetools
+        >>> mapping_one = nonrealtimetools.NodeTreeMapping({'a': None})
+        >>> mapping_two = mapping_one.copy()
+        >>> mapping_two['b'] = ('a',)
+        >>> del(mapping_two['a'])
+        >>> sorted(mapping_one.items())
+        [('a', None)]
+
+    ::
+
+        >>> sorted(mapping_two.items())
+        [('b', ('a',))]
+
+    ::
+
+        >>> mapping_one == mapping_two
+        False
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Session Internals'
+
+    __slots__ = (
+        '_base',
+        '_changes',
+        '_length',
+        )
+
+    _deleted = object()
+
+    _maximum_change_ratio = 0.25
+
+    _missing = object()
+
+    ### INITIALIZER ###
+
+    def __init__(self, items=None):
+        self._base = {}
+        self._changes = {}
+        self._length = 0
+        if items is not None:
+            self.update(items)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        value = self._changes.get(key, self._missing)
+        if value is self._missing:
+            return key in self._base
+        return value is not self._deleted
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if key in self._base:
+            self._changes[key] = self._deleted
+        else:
+            del(self._changes[key])
+        self._length -= 1
+
+    def __eq__(self, expr):
+        if isinstance(expr, type(self)):
+            if self._length != expr._length:
+                return False
+            elif self._base is not expr._base:
+                return self._flatten() == expr._flatten()
+            for changes in (self._changes, expr._changes):
+                for key in changes:
+                    value_one = self.get(key, self._missing)
+                    value_two = expr.get(key, self._missing)
+                    if value_one != value_two:
+                        return False
+            return True
+        elif isinstance(expr, collections.Mapping):
+            return self._flatten() == dict(expr.items())
+        return NotImplemented
+
+    def __getitem__(self, key):
+        value = self._changes.get(key, self._missing)
+        if value is self._missing:
+            return self._base[key]
+        elif value is self._deleted:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return iter(self._flatten())
+
+    def __len__(self):
+        return self._length
+
+    def __ne__(self, expr):
+        result = self.__eq__(expr)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self._flatten())
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._length += 1
+        self._changes[key] = value
+
+    ### PRIVATE METHODS ###
+
+    def _flatten(self):
+        if not self._changes:
+            return self._base.copy()
+        result = self._base.copy()
+        for key, value in self._changes.items():
+            if value is self._deleted:
+                del(result[key])
+            else:
+                result[key] = value
+        return result
+
+    ### PUBLIC METHODS ###
+
+    def copy(self):
+        """
+        Copies mapping, sharing its base.
+
+        Returns new mapping.
+        """
+        maximum_change_count = len(self._base) * self._maximum_change_ratio
+        if maximum_change_count < len(self._changes):
+            self._base = self._flatten()
+            self._changes = {}
+        mapping = type(self)()
+        mapping._base = self._base
+        mapping._changes = self._changes.copy()
+        mapping._length = self._length
+        return mapping
+
+    def get(self, key, default=None):
+        value = self._changes.get(key, self._missing)
+        if value is self._missing:
+            return self._base.get(key, default)
+        elif value is self._deleted:
+            return default
+        return value
@@ -0,0 +1,278 @@
+# -*- encoding: utf-8 -*-
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from supriya.tools.systemtools.SupriyaObject import SupriyaObject
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class RenderCache(SupriyaObject):
+    """
+    A persistent, content-addressed cache of non-realtime renders.
+
+    ::
+
+        >>> import tempfile
+        >>> from supriya.tools import nonrealtimetools
+        >>> cache_directory = tempfile.mkdtemp()
+        >>> render_cache = nonrealtimetools.RenderCache(
+        ...     cache_directory=cache_directory,
+        ...     maximum_size=2 ** 30,
+        ...     )
+
+    Pass a render cache to ``Session.render()`` to retrieve renders whose
+    score, input and render options match an earlier render, from any
+    project or render directory, instead of running scsynth again.
+
+    Cached files are described by a JSON manifest recording each file's
+    size, MD5 digest, render time and last access. Files are checked
+    against their digest when retrieved. When `maximum_size` is set, the
+    least recently accessed files are evicted to keep the cache within it,
+    along with any of the cache's own files the manifest no longer records.
+    Other files in the cache directory are left alone.
+
+    Updates to the manifest hold a lock file, so caches in several
+    processes may share one directory.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Session Internals'
+
+    __slots__ = (
+        '_cache_directory',
+        '_lock',
+        '_maximum_size',
+        )
+
+    _lock_file_name = 'manifest.lock'
+
+    _manifest_file_name = 'manifest.json'
+
+    # Render keys are MD5 digests. Other files are never the cache's own.
+    _owned_file_name_pattern = re.compile(
+        r'^([0-9a-f]{32}(\.\w+)?|manifest\.json\.\d+\.\d+)$')
+
+    ### INITIALIZER ###
+
+    def __init__(self, cache_directory=None, maximum_size=None):
+        from supriya import supriya_configuration
+        if cache_directory is None:
+            cache_directory = supriya_configuration.render_cache_directory
+        self._cache_directory = os.path.abspath(
+            os.path.expanduser(cache_directory))
+        if not os.path.exists(self._cache_directory):
+            os.makedirs(self._cache_directory)
+        self._lock = threading.RLock()
+        if maximum_size is not None:
+            maximum_size = int(maximum_size)
+            assert 0 < maximum_size
+        self._maximum_size = maximum_size
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._read_manifest()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._read_manifest())
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _build_digest(file_path):
+        md5 = hashlib.md5()
+        with open(file_path, 'rb') as file_pointer:
+            for chunk in iter(lambda: file_pointer.read(2 ** 16), b''):
+                md5.update(chunk)
+        return md5.hexdigest()
+
+    def _evict(self, manifest, maximum_size):
+        # Cache files missing from the manifest can never be retrieved.
+        file_names = set(entry['file_name'] for entry in manifest.values())
+        for file_name in os.listdir(self.cache_directory):
+            if (
+                file_name in file_names or
+                not self._owned_file_name_pattern.match(file_name)
+                ):
+                continue
+            file_path = os.path.join(self.cache_directory, file_name)
+            if os.path.isfile(file_path) and not os.path.islink(file_path):
+                os.remove(file_path)
+        total_size = sum(entry['size'] for entry in manifest.values())
+        entries = sorted(
+            manifest.items(),
+            key=lambda item: item[1]['last_access'],
+            )
+        for key, entry in entries:
+            if total_size <= maximum_size:
+                break
+            self._remove_entry(manifest, key)
+            total_size -= entry['size']
+
+    @contextlib.contextmanager
+    def _locked(self):
+        # Serializes manifest updates across threads, then across processes.
+        lock_file_path = os.path.join(
+            self.cache_directory, self._lock_file_name)
+        with self._lock:
+            with open(lock_file_path, 'a') as file_pointer:
+                if fcntl is not None:
+                    fcntl.flock(file_pointer.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(file_pointer.fileno(), fcntl.LOCK_UN)
+
+    def _read_manifest(self):
+        if not os.path.exists(self.manifest_file_path):
+            return {}
+        try:
+            with open(self.manifest_file_path, 'r') as file_pointer:
+                return json.load(file_pointer)
+        except ValueError:
+            return {}
+
+    def _remove_entry(self, manifest, key):
+        entry = manifest.pop(key)
+        file_path = os.path.join(self.cache_directory, entry['file_name'])
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def _write_manifest(self, manifest):
+        # Replace the manifest atomically, as other processes may share it.
+        temporary_file_path = '{}.{}.{}'.format(
+            self.manifest_file_path,
+            os.getpid(),
+            threading.current_thread().ident,
+            )
+        with open(temporary_file_path, 'w') as file_pointer:
+            json.dump(manifest, file_pointer, indent=4, sort_keys=True)
+        if os.name == 'nt' and os.path.exists(self.manifest_file_path):
+            os.remove(self.manifest_file_path)
+        os.rename(temporary_file_path, self.manifest_file_path)
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        """
+        Removes all cached files.
+
+        Returns none.
+        """
+        with self._locked():
+            manifest = self._read_manifest()
+            for key in list(manifest):
+                self._remove_entry(manifest, key)
+            self._write_manifest(manifest)
+
+    def evict(self, maximum_size=None):
+        """
+        Evicts least recently accessed files until the cache holds at most
+        `maximum_size` bytes, defaulting to the cache's maximum size.
+
+        Returns none.
+        """
+        if maximum_size is None:
+            maximum_size = self.maximum_size
+        if maximum_size is None:
+            return
+        with self._locked():
+            manifest = self._read_manifest()
+            self._evict(manifest, maximum_size)
+            self._write_manifest(manifest)
+
+    def retrieve(self, key, output_file_path):
+        """
+        Copies the file cached under `key` to `output_file_path`.
+
+        Cached files which are missing or fail their digest check are
+        evicted.
+
+        Returns true if a file was retrieved, otherwise false.
+        """
+        with self._locked():
+            manifest = self._read_manifest()
+            entry = manifest.get(key)
+            if entry is None:
+                return False
+            file_path = os.path.join(self.cache_directory, entry['file_name'])
+            if (
+                not os.path.exists(file_path) or
+                os.path.getsize(file_path) != entry['size'] or
+                self._build_digest(file_path) != entry['digest']
+                ):
+                self._remove_entry(manifest, key)
+                self._write_manifest(manifest)
+                return False
+            shutil.copyfile(file_path, output_file_path)
+            entry['last_access'] = time.time()
+            self._write_manifest(manifest)
+            return True
+
+    def store(self, key, file_path, render_time=None):
+        """
+        Copies `file_path` into the cache under `key`.
+
+        Returns none.
+        """
+        _, extension = os.path.splitext(file_path)
+        file_name = '{}{}'.format(key, extension)
+        cache_file_path = os.path.join(self.cache_directory, file_name)
+        with self._locked():
+            shutil.copyfile(file_path, cache_file_path)
+            manifest = self._read_manifest()
+            manifest[key] = {
+                'digest': self._build_digest(cache_file_path),
+                'file_name': file_name,
+                'last_access': time.time(),
+                'render_time': render_time,
+                'size': os.path.getsize(cache_file_path),
+                }
+            if self.maximum_size is not None:
+                self._evict(manifest, self.maximum_size)
+            self._write_manifest(manifest)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def cache_directory(self):
+        """
+        Directory holding the cached files and their manifest.
+        """
+        return self._cache_directory
+
+    @property
+    def manifest(self):
+        """
+        Manifest of cached files, keyed by render key.
+
+        Returns dictionary.
+        """
+        with self._lock:
+            return self._read_manifest()
+
+    @property
+    def manifest_file_path(self):
+        """
+        Path of the manifest file.
+        """
+        return os.path.join(self.cache_directory, self._manifest_file_name)
+
+    @property
+    def maximum_size(self):
+        """
+        Maximum size of the cache in bytes, or none if unbounded.
+        """
+        return self._maximum_size
@@ -74,11 +74,14 @@ class Session(OscMixin):
     __documentation_section__ = 'Non-realtime Session'
 
     __slots__ = (
+        '_active_batches',
         '_active_moments',
         '_audio_input_bus_group',
         '_audio_output_bus_group',
         '_buffers',
         '_buses',
+        '_deferred_offsets',
+        '_events_by_offset',
         '_input',
         '_name',
         '_nodes',
@@ -86,6 +89,7 @@ class Session(OscMixin):
         '_options',
         '_root_node',
         '_session_ids',
+        '_stale_offset',
         '_states',
         '_transcript',
         )
@@ -121,10 +125,14 @@ class Session(OscMixin):
             input_bus_channel_count=input_bus_channel_count,
             output_bus_channel_count=output_bus_channel_count,
             )
+        self._active_batches = []
         self._active_moments = []
+        self._deferred_offsets = set()
+        self._stale_offset = None
         self._session_ids = {}
         self._states = {}
         self._buffers = timetools.TimespanCollection()
+        self._events_by_offset = {}
         self._nodes = timetools.TimespanCollection()
         self._offsets = []
         self._root_node = nonrealtimetools.RootNode(self)
@@ -164,16 +172,16 @@ class Session(OscMixin):
         old_state = self._find_state_before(offset)
         state = old_state._clone(offset)
         self.states[offset] = state
-        self.offsets.insert(
-            self.offsets.index(old_state.offset) + 1,
-            offset,
-            )
+        bisect.insort(self.offsets, offset)
         return state
 
     def _apply_transitions(self, offsets, chain=True):
         from supriya.tools import nonrealtimetools
         if nonrealtimetools.DoNotPropagate._stack:
             return
+        elif self._active_batches:
+            self._defer_transitions(offsets, chain=chain)
+            return
         queue = PriorityQueue()
         try:
             for offset in offsets:
@@ -188,6 +196,13 @@ class Session(OscMixin):
             previous_offset = offset
             state = self._find_state_at(offset, clone_if_missing=False)
             if state is None:
+                # A state removed here may have changed its successor's input.
+                next_state = self._find_state_after(
+                    offset,
+                    with_node_tree=True,
+                    )
+                if next_state is not None and chain:
+                    queue.put(next_state.offset)
                 continue
             previous_state = self._find_state_before(
                 offset, with_node_tree=True)
@@ -436,11 +451,17 @@ class Session(OscMixin):
         self,
         id_mapping,
         ):
+        from supriya.tools import nonrealtimetools
         buffer_settings = {}
-        for buffer_ in sorted(self._buffers, key=lambda x: id_mapping[x]):
-            for event_type, events in buffer_._events.items():
-                for offset, payload in events:
-                    payload = payload.copy()
+        for offset, session_objects in self._events_by_offset.items():
+            buffers = [
+                _ for _ in session_objects
+                if isinstance(_, nonrealtimetools.Buffer) and
+                _ in id_mapping
+                ]
+            for buffer_ in sorted(buffers, key=lambda x: id_mapping[x]):
+                for event_type in session_objects[buffer_]:
+                    payload = buffer_._get_event(event_type, offset).copy()
                     for key, value in payload.items():
                         try:
                             if value in id_mapping:
@@ -464,25 +485,41 @@ class Session(OscMixin):
         return buffer_settings
 
     def _collect_bus_settings(self, id_mapping):
+        from supriya.tools import nonrealtimetools
         bus_settings = {}
-        for bus in self._buses:
-            if bus.calculation_rate != synthdeftools.CalculationRate.CONTROL:
-                continue
-            bus_id = id_mapping[bus]
-            for offset, value in bus._events:
+        for offset, session_objects in self._events_by_offset.items():
+            for bus in session_objects:
+                if not isinstance(bus, nonrealtimetools.Bus):
+                    continue
+                elif bus not in self._buses:
+                    continue
+                bus_id = id_mapping[bus]
+                value = bus._get_at_offset(offset)
                 bus_settings.setdefault(offset, {})[bus_id] = value
         return bus_settings
 
-    def _collect_durated_objects(self, offset, is_last_offset):
+    def _collect_durated_objects(
+        self,
+        offset,
+        is_last_offset,
+        overlap_buffers=None,
+        overlap_nodes=None,
+        ):
         state = self._find_state_at(offset, clone_if_missing=True)
         start_buffers, start_nodes = state.start_buffers, state.start_nodes
         stop_buffers = state.stop_buffers.copy()
         stop_nodes = state.stop_nodes.copy()
+        if overlap_buffers is None:
+            overlap_buffers = self.buffers.find_timespans_overlapping_offset(
+                offset)
+        if overlap_nodes is None:
+            overlap_nodes = self.nodes.find_timespans_overlapping_offset(
+                offset)
         if is_last_offset:
-            stop_buffers.update(state.overlap_buffers)
-            stop_nodes.update(state.overlap_nodes)
-        all_buffers = set(self.buffers.find_timespans_overlapping_offset(offset))
-        all_nodes = set(self.nodes.find_timespans_overlapping_offset(offset))
+            stop_buffers.update(overlap_buffers)
+            stop_nodes.update(overlap_nodes)
+        all_buffers = set(overlap_buffers)
+        all_nodes = set(overlap_nodes)
         all_buffers.update(stop_buffers)
         all_nodes.update(stop_nodes)
         return (
@@ -510,7 +547,7 @@ class Session(OscMixin):
                     synth_kwargs = source.synth_kwargs
                     if source in node_settings:
                         synth_kwargs.update(node_settings.pop(source))
-                    if 'duration' in source.synthdef.parameter_names:
+                    if 'duration' in source.synthdef._parameter_name_set:
                         # need to propagate in session rendering timespan
                         # as many nodes have "infinite" duration
                         node_duration = source.duration
@@ -531,8 +568,7 @@ class Session(OscMixin):
             free_ids, gate_ids = [], []
             for node in stop_nodes:
                 node_id = id_mapping[node]
-                if hasattr(node, 'synthdef') and \
-                    'gate' in node.synthdef.parameter_names:
+                if hasattr(node, 'synthdef') and node.synthdef.has_gate:
                     gate_ids.append(node_id)
                 elif node.duration:
                     free_ids.append(node_id)
@@ -551,7 +587,14 @@ class Session(OscMixin):
         return requests
 
     def _collect_node_settings(self, offset, state, id_mapping):
+        from supriya.tools import nonrealtimetools
         result = collections.OrderedDict()
+        changed_nodes = set(
+            _ for _ in self._events_by_offset.get(offset, ())
+            if isinstance(_, nonrealtimetools.Node)
+            )
+        if not changed_nodes:
+            return result
         if state.nodes_to_children is None:
             # Current state is sparse;
             # Use previous non-sparse state's nodes to order settings.
@@ -559,16 +602,13 @@ class Session(OscMixin):
                 offset,
                 with_node_tree=True,
                 )
-            iterator = state._iterate_nodes(
-                self.root_node,
-                state.nodes_to_children,
-                )
-        else:
-            iterator = state._iterate_nodes(
-                self.root_node,
-                state.nodes_to_children,
-                )
+        iterator = state._iterate_nodes(
+            self.root_node,
+            state.nodes_to_children,
+            )
         for node in iterator:
+            if node not in changed_nodes:
+                continue
             settings = node._collect_settings(
                 offset,
                 id_mapping=id_mapping,
@@ -638,13 +678,20 @@ class Session(OscMixin):
         is_last_offset,
         offset,
         visited_synthdefs,
+        overlap_buffers=None,
+        overlap_nodes=None,
         ):
         requests = []
         (
             all_buffers, all_nodes,
             start_buffers, start_nodes,
             stop_buffers, stop_nodes
-            ) = self._collect_durated_objects(offset, is_last_offset)
+            ) = self._collect_durated_objects(
+                offset,
+                is_last_offset,
+                overlap_buffers=overlap_buffers,
+                overlap_nodes=overlap_nodes,
+                )
         state = self._find_state_at(offset, clone_if_missing=True)
         node_actions = state.transitions
         node_settings = self._collect_node_settings(offset, state, id_mapping)
@@ -707,6 +754,21 @@ class Session(OscMixin):
             requests.append(request)
         return requests
 
+    def _defer_transitions(self, offsets, chain=True):
+        try:
+            offsets = list(offsets)
+        except TypeError:
+            offsets = [offsets]
+        self._deferred_offsets.update(offsets)
+        offset = min(offsets)
+        if not chain:
+            # Only State._clone() propagates without chaining, and cloned
+            # states fall within the stale range anyway.
+            if self._stale_offset is None or offset < self._stale_offset:
+                self._stale_offset = offset
+            return
+        self._sweep_transitions(offset)
+
     def _find_state_after(self, offset, with_node_tree=None):
         index = bisect.bisect(self.offsets, offset)
         if with_node_tree:
@@ -728,10 +790,7 @@ class Session(OscMixin):
             old_state = self._find_state_before(offset, with_node_tree=True)
             state = old_state._clone(offset)
             self.states[offset] = state
-            self.offsets.insert(
-                self.offsets.index(old_state.offset) + 1,
-                offset,
-            )
+            bisect.insort(self.offsets, offset)
         return state
 
     def _find_state_before(self, offset, with_node_tree=None):
@@ -752,6 +811,10 @@ class Session(OscMixin):
             return None
         return self.states[self.offsets[index]]
 
+    def _flush_transitions(self):
+        if self._stale_offset is not None:
+            self._sweep_transitions(float('inf'))
+
     def _get_next_session_id(self, kind='node'):
         default = 0
         if kind == 'node':
@@ -760,12 +823,19 @@ class Session(OscMixin):
         self._session_ids[kind] += 1
         return session_id
 
+    def _index_event(self, offset, session_object, item=None):
+        session_objects = self._events_by_offset.setdefault(offset, {})
+        session_objects.setdefault(session_object, set()).add(item)
+
     def _iterate_state_pairs(
         self,
         offset,
         reverse=False,
         with_node_tree=None,
         ):
+        # Iterating callers rewrite later states from their node trees, which
+        # are stale past the batch's stale offset.
+        self._flush_transitions()
         if reverse:
             state_two = self._find_state_at(
                 offset,
@@ -827,8 +897,12 @@ class Session(OscMixin):
         from supriya.tools import nonrealtimetools
         offset = float('-inf')
         state = nonrealtimetools.State(self, offset)
-        state._nodes_to_children = {self.root_node: ()}
-        state._nodes_to_parents = {self.root_node: None}
+        state._nodes_to_children = nonrealtimetools.NodeTreeMapping({
+            self.root_node: (),
+            })
+        state._nodes_to_parents = nonrealtimetools.NodeTreeMapping({
+            self.root_node: None,
+            })
         self.states[offset] = state
         self.offsets.append(offset)
         offset = 0
@@ -841,14 +915,69 @@ class Session(OscMixin):
         if state is None:
             return
         assert state.is_sparse
-        self.offsets.remove(offset)
+        del(self.offsets[bisect.bisect_left(self.offsets, offset)])
         del(self.states[offset])
         return state
 
+    def _unindex_events(self, session_object, items_to_offsets):
+        for item, offsets in items_to_offsets.items():
+            for offset in offsets:
+                session_objects = self._events_by_offset.get(offset)
+                if session_objects is None:
+                    continue
+                items = session_objects.get(session_object)
+                if items is None:
+                    continue
+                items.discard(item)
+                if not items:
+                    del(session_objects[session_object])
+                if not session_objects:
+                    del(self._events_by_offset[offset])
+
+    def _sweep_transitions(self, stop_offset):
+        from supriya.tools import nonrealtimetools
+        start_offset = stop_offset
+        if self._stale_offset is not None:
+            start_offset = min(self._stale_offset, stop_offset)
+        previous_state = self._find_state_before(
+            start_offset,
+            with_node_tree=True,
+            )
+        start_index = bisect.bisect_left(self.offsets, start_offset)
+        stop_index = bisect.bisect_right(self.offsets, stop_offset)
+        for offset in self.offsets[start_index:stop_index]:
+            state = self.states[offset]
+            if (
+                state.nodes_to_children is None and
+                offset not in self._deferred_offsets
+                ):
+                continue
+            self._deferred_offsets.discard(offset)
+            if previous_state is None:
+                previous_state = state
+                continue
+            nodes_to_children, nodes_to_parents = \
+                nonrealtimetools.State._apply_transitions(
+                    state.transitions,
+                    previous_state.nodes_to_children,
+                    previous_state.nodes_to_parents,
+                    state.stop_nodes,
+                    )
+            if nodes_to_children != state.nodes_to_children:
+                state._nodes_to_children = nodes_to_children
+                state._nodes_to_parents = nodes_to_parents
+            previous_state = state
+        if stop_offset == float('inf'):
+            self._deferred_offsets.clear()
+            self._stale_offset = None
+        else:
+            self._stale_offset = stop_offset
+
     def _to_non_xrefd_osc_bundles(
         self,
         duration=None,
         ):
+        self._flush_transitions()
         id_mapping = self._build_id_mapping()
         if self.duration == float('inf'):
             assert duration is not None and 0 < duration < float('inf')
@@ -865,7 +994,11 @@ class Session(OscMixin):
         osc_bundles = []
         buffer_open_states = {}
         visited_synthdefs = set()
-        for offset in offsets:
+        buffer_sweep = self.buffers.iterate_offset_sweep(offsets)
+        node_sweep = self.nodes.iterate_offset_sweep(offsets)
+        for buffer_sweep_item, node_sweep_item in zip(buffer_sweep, node_sweep):
+            offset, overlap_buffers = buffer_sweep_item[0], buffer_sweep_item[-1]
+            overlap_nodes = node_sweep_item[-1]
             osc_messages = []
             if offset == duration:
                 is_last_offset = True
@@ -878,6 +1011,8 @@ class Session(OscMixin):
                 is_last_offset,
                 offset,
                 visited_synthdefs,
+                overlap_buffers=overlap_buffers,
+                overlap_nodes=overlap_nodes,
                 )
             osc_messages.extend(_.to_osc_message(True) for _ in requests)
             if is_last_offset:
@@ -904,6 +1039,27 @@ class Session(OscMixin):
             state = self._add_state_at(offset)
         return nonrealtimetools.Moment(self, offset, state, propagate)
 
+    def batch(self):
+        """
+        Defers propagation of node hierarchy changes until the batch exits.
+
+        ::
+
+            >>> session = nonrealtimetools.Session()
+            >>> with session.batch():
+            ...     with session.at(0):
+            ...         group = session.add_group(duration=10)
+            ...     with session.at(5):
+            ...         synth = group.add_synth(duration=10)
+            ...
+            >>> synth.get_parent(offset=7) is group
+            True
+
+        Returns session batch.
+        """
+        from supriya.tools import nonrealtimetools
+        return nonrealtimetools.SessionBatch(self)
+
     @SessionObject.require_offset
     def add_buffer(
         self,
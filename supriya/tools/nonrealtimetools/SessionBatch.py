@@ -0,0 +1,71 @@
+# -*- encoding: utf-8 -*-
+from supriya.tools.nonrealtimetools.SessionObject import SessionObject
+
+
+class SessionBatch(SessionObject):
+    """
+    A batch of non-realtime session edits.
+
+    ::
+
+        >>> from supriya.tools import nonrealtimetools
+        >>> session = nonrealtimetools.Session()
+        >>> with session.batch():
+        ...     for i in range(4):
+        ...         with session.at(i):
+        ...             synth = session.add_synth(duration=2)
+        ...
+
+    ::
+
+        >>> print(session.to_strings())
+        0.0:
+            NODE TREE 0 group
+                1000 da0982184cc8fa54cf9d288a0fe1f6ca
+        1.0:
+            NODE TREE 0 group
+                1001 da0982184cc8fa54cf9d288a0fe1f6ca
+                1000 da0982184cc8fa54cf9d288a0fe1f6ca
+        2.0:
+            NODE TREE 0 group
+                1002 da0982184cc8fa54cf9d288a0fe1f6ca
+                1001 da0982184cc8fa54cf9d288a0fe1f6ca
+        3.0:
+            NODE TREE 0 group
+                1003 da0982184cc8fa54cf9d288a0fe1f6ca
+                1002 da0982184cc8fa54cf9d288a0fe1f6ca
+        4.0:
+            NODE TREE 0 group
+                1003 da0982184cc8fa54cf9d288a0fe1f6ca
+        5.0:
+            NODE TREE 0 group
+
+    Within a batch, node hierarchy changes propagate forward only as far as
+    the offset being edited. States after it are brought up to date by the
+    next edit reaching them, or in one forward sweep when the outermost
+    batch exits.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Session Internals'
+
+    __slots__ = (
+        '_session',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, session):
+        SessionObject.__init__(self, session)
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        self.session._active_batches.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.session._active_batches.pop()
+        if not self.session._active_batches:
+            self.session._flush_transitions()
@@ -30,6 +30,13 @@ class SessionObject(SupriyaObject):
         assert isinstance(session, prototype)
         self._session = session
 
+    ### SPECIAL METHODS ###
+
+    # Session objects key every node tree mapping. Hashing by identity
+    # directly, rather than through SupriyaObject.__hash__, keeps those
+    # lookups out of the interpreter.
+    __hash__ = object.__hash__
+
     ### PRIVATE METHODS ###
 
     def _get_format_specification(self):
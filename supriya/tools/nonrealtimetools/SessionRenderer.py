@@ -1,8 +1,16 @@
 # -*- encoding: utf-8 -*-
+import collections
 import hashlib
 import os
 import struct
 import subprocess
+import tempfile
+import threading
+import time
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 from abjad.tools.systemtools import TemporaryDirectoryChange
 from supriya.tools import servertools
 from supriya.tools import soundfiletools
@@ -13,6 +21,16 @@ from supriya.tools.systemtools import Trellis
 class SessionRenderer(SupriyaObject):
     """
     Renders non-realtime sessions as audio files.
+
+    Sessions nested as inputs or buffer sources are rendered first. With a
+    `process_count` greater than one, independent sessions at the same
+    depth of the dependency trellis are rendered concurrently, by at most
+    `process_count` scsynth processes. Each session's transcript lines are
+    appended as they are produced, so lines of concurrent renders
+    interleave, while levels still appear in dependency order.
+
+    With a `render_cache`, sessions rendered before with the same score,
+    input and options are retrieved from the cache rather than rendered.
     """
 
     ### CLASS VARIABLES ###
@@ -20,6 +38,7 @@ class SessionRenderer(SupriyaObject):
     __documentation_section__ = 'Session Internals'
 
     __slots__ = (
+        '_render_times',
         '_session',
         '_transcript',
         )
@@ -27,6 +46,7 @@ class SessionRenderer(SupriyaObject):
     ### INITIALIZER ###
 
     def __init__(self, session):
+        self._render_times = collections.OrderedDict()
         self._session = session
         self._transcript = []
 
@@ -54,28 +74,27 @@ class SessionRenderer(SupriyaObject):
                 osc_message._contents = tuple(contents)
         return osc_bundles
 
-    def _build_datagram(self, osc_bundles):
-        datagrams = []
-        for osc_bundle in osc_bundles:
-            datagram = osc_bundle.to_datagram(realtime=False)
-            size = len(datagram)
-            size = struct.pack('>i', size)
-            datagrams.append(size)
-            datagrams.append(datagram)
-        datagram = b''.join(datagrams)
-        return datagram
+    def _build_datagram_hash(self, osc_bundles, file_pointer=None):
+        md5 = hashlib.md5()
+        datagram_size = 0
+        for datagram in self._iterate_datagrams(osc_bundles):
+            md5.update(datagram)
+            datagram_size += len(datagram)
+            if file_pointer is not None:
+                file_pointer.write(datagram)
+        return md5, datagram_size
 
     def _build_file_path(
         self,
-        datagram,
+        datagram_hash,
         input_file_path,
         session,
         sample_rate=44100,
         header_format=soundfiletools.HeaderFormat.AIFF,
         sample_format=soundfiletools.SampleFormat.INT24,
         ):
-        md5 = hashlib.md5()
-        hash_values = [datagram]
+        md5 = datagram_hash.copy()
+        hash_values = []
         if input_file_path is not None:
             hash_values.append(input_file_path)
         for value in (
@@ -124,6 +143,33 @@ class SessionRenderer(SupriyaObject):
         command = ' '.join(parts)
         return command
 
+    def _build_render_cache_key(
+        self,
+        input_file_path,
+        output_file_path,
+        session_file_path,
+        server_options,
+        ):
+        # Session file names already hash the score and the output format,
+        # but only the input's path. Its contents, server options and the
+        # output extension remain.
+        from supriya.tools import nonrealtimetools
+        _, extension = os.path.splitext(output_file_path)
+        md5 = hashlib.md5()
+        values = [
+            os.path.basename(session_file_path),
+            server_options.as_options_string(realtime=False),
+            extension.lower(),
+            ]
+        if input_file_path:
+            input_file_path = os.path.expanduser(input_file_path)
+            if os.path.exists(input_file_path):
+                values.append(nonrealtimetools.RenderCache._build_digest(
+                    input_file_path))
+        for value in values:
+            md5.update(value.encode())
+        return md5.hexdigest()
+
     def _collect_prerender_data(
         self,
         session,
@@ -152,9 +198,63 @@ class SessionRenderer(SupriyaObject):
                             x, compiled_sessions, trellis)
                     trellis.add(x, parent=session)
 
+    def _collect_prerender_tuple(
+        self,
+        session,
+        compiled_sessions,
+        session_file_paths,
+        datagram_directory=None,
+        render_path='',
+        sample_rate=44100,
+        header_format=soundfiletools.HeaderFormat.AIFF,
+        sample_format=soundfiletools.SampleFormat.INT24,
+        ):
+        input_, osc_bundles = compiled_sessions[session]
+        osc_bundles = self._build_bundles(
+            osc_bundles,
+            session_file_paths,
+            header_format=header_format,
+            )
+        input_file_path = session_file_paths.get(input_, input_)
+        if input_file_path and input_file_path.startswith(render_path):
+            input_file_path = os.path.relpath(
+                input_file_path, render_path)
+        # File names hash the datagram, so it is written to a temporary file
+        # in the same pass, and renamed once rendering reaches its level.
+        datagram_file_path = None
+        if datagram_directory is None:
+            datagram_hash, _ = self._build_datagram_hash(osc_bundles)
+        else:
+            with tempfile.NamedTemporaryFile(
+                delete=False,
+                dir=datagram_directory,
+                suffix='.osc',
+                ) as file_pointer:
+                datagram_file_path = file_pointer.name
+                datagram_hash, _ = self._build_datagram_hash(
+                    osc_bundles, file_pointer)
+        session_file_paths[session] = self._build_file_path(
+            datagram_hash,
+            input_file_path,
+            session,
+            header_format=header_format,
+            sample_format=sample_format,
+            sample_rate=sample_rate,
+            )
+        session_file_path = session_file_paths[session]
+        prerender_tuple = (
+            datagram_file_path,
+            input_file_path,
+            osc_bundles,
+            session,
+            session_file_path,
+            )
+        return prerender_tuple
+
     def _collect_prerender_tuples(
         self,
         session,
+        datagram_directory=None,
         duration=None,
         render_path='',
         sample_rate=44100,
@@ -171,38 +271,28 @@ class SessionRenderer(SupriyaObject):
             trellis,
             duration=duration,
             )
-        assert trellis.is_acyclic()
-        for i, session in enumerate(trellis):
-            input_, osc_bundles = compiled_sessions[session]
-            osc_bundles = self._build_bundles(
-                osc_bundles,
-                session_file_paths,
-                header_format=header_format,
-                )
-            input_file_path = session_file_paths.get(input_, input_)
-            if input_file_path and input_file_path.startswith(render_path):
-                input_file_path = os.path.relpath(
-                    input_file_path, render_path)
-            datagram = self._build_datagram(osc_bundles)
-            session_file_paths[session] = self._build_file_path(
-                datagram,
-                input_file_path,
-                session,
-                header_format=header_format,
-                sample_format=sample_format,
-                sample_rate=sample_rate,
-                )
-            session_file_path = session_file_paths[session]
-            prerender_tuple = (
-                datagram,
-                input_file_path,
-                osc_bundles,
-                session,
-                session_file_path,
-                )
-            prerender_tuples.append(prerender_tuple)
+        for level in trellis.levels():
+            prerender_tuples.append([])
+            for session in level:
+                prerender_tuple = self._collect_prerender_tuple(
+                    session,
+                    compiled_sessions,
+                    session_file_paths,
+                    datagram_directory=datagram_directory,
+                    render_path=render_path,
+                    sample_rate=sample_rate,
+                    header_format=header_format,
+                    sample_format=sample_format,
+                    )
+                prerender_tuples[-1].append(prerender_tuple)
         return prerender_tuples
 
+    def _iterate_datagrams(self, osc_bundles):
+        for osc_bundle in osc_bundles:
+            datagram = osc_bundle.to_datagram(realtime=False)
+            yield struct.pack('>i', len(datagram))
+            yield datagram
+
     def _render_datagram(
         self,
         session,
@@ -212,6 +302,7 @@ class SessionRenderer(SupriyaObject):
         sample_rate=44100,
         header_format=soundfiletools.HeaderFormat.AIFF,
         sample_format=soundfiletools.SampleFormat.INT24,
+        render_cache=None,
         **kwargs
         ):
         from supriya import new
@@ -224,6 +315,18 @@ class SessionRenderer(SupriyaObject):
             return 0
         old_server_options = session._options
         new_server_options = new(old_server_options, **kwargs)
+        if render_cache is not None:
+            render_cache_key = self._build_render_cache_key(
+                input_file_path,
+                output_file_path,
+                session_file_path,
+                new_server_options,
+                )
+            if render_cache.retrieve(render_cache_key, output_file_path):
+                self.transcript.append(
+                    '    Retrieved {} from render cache.'.format(
+                        os.path.relpath(session_file_path)))
+                return 0
         command = self._build_render_command(
             input_file_path,
             output_file_path,
@@ -234,25 +337,110 @@ class SessionRenderer(SupriyaObject):
             sample_format=sample_format,
             )
         self.transcript.append('    Command: {}'.format(command))
+        start_time = time.time()
         exit_code = subprocess.call(command, shell=True)
+        render_time = time.time() - start_time
+        self._render_times[session_file_path] = render_time
         self.transcript.append('    Rendered {} with exit code {}.'.format(
             os.path.relpath(session_file_path), exit_code))
+        if (
+            render_cache is not None and
+            not exit_code and
+            os.path.exists(output_file_path)
+            ):
+            render_cache.store(
+                render_cache_key,
+                output_file_path,
+                render_time=render_time,
+                )
         return exit_code
 
-    def _write_datagram(self, file_path, datagram):
+    def _render_level(self, jobs, process_count=1, **kwargs):
+        # Identical sessions share file paths, so each path renders once.
+        # Sequential renders skip repeats anyway, as their output exists.
+        grouped_indices = collections.OrderedDict()
+        for index, job in enumerate(jobs):
+            output_file_path = job[3]
+            grouped_indices.setdefault(output_file_path, []).append(index)
+        is_parallel = 1 < process_count and 1 < len(grouped_indices)
+        exit_codes = [None] * len(jobs)
+        exceptions = []
+
+        def render_job(index):
+            (
+                datagram_file_path,
+                input_file_path,
+                osc_bundles,
+                output_file_path,
+                session,
+                session_file_path,
+                ) = jobs[index]
+            self._write_datagram(
+                session_file_path,
+                datagram_file_path,
+                )
+            exit_codes[index] = self._render_datagram(
+                session,
+                input_file_path,
+                output_file_path,
+                session_file_path,
+                **kwargs
+                )
+
+        def run_worker():
+            while True:
+                try:
+                    index = job_queue.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    render_job(index)
+                except Exception as exception:
+                    exceptions.append(exception)
+
+        if not is_parallel:
+            for index in range(len(jobs)):
+                render_job(index)
+            return exit_codes
+        job_queue = queue.Queue()
+        for indices in grouped_indices.values():
+            job_queue.put(indices[0])
+        workers = []
+        for _ in range(min(process_count, len(grouped_indices))):
+            worker = threading.Thread(target=run_worker)
+            worker.start()
+            workers.append(worker)
+        for worker in workers:
+            worker.join()
+        if exceptions:
+            raise exceptions[0]
+        for indices in grouped_indices.values():
+            for index in indices[1:]:
+                exit_codes[index] = exit_codes[indices[0]]
+        return exit_codes
+
+    def _write_datagram(
+        self,
+        file_path,
+        datagram_file_path,
+        ):
         self.transcript.append(
             'Writing {}.'.format(os.path.relpath(file_path)))
+        # File paths hash the datagram they hold, so a file of the expected
+        # size needs no rereading. Interrupted writes leave a shorter file.
         should_write = True
         if os.path.exists(file_path):
-            with open(file_path, 'rb') as file_pointer:
-                if file_pointer.read() == datagram:
-                    should_write = False
+            datagram_size = os.path.getsize(datagram_file_path)
+            if os.path.getsize(file_path) == datagram_size:
+                should_write = False
         if should_write:
-            with open(file_path, 'wb') as file_pointer:
-                file_pointer.write(datagram)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            os.rename(datagram_file_path, file_path)
             self.transcript.append(
                 '    Wrote {}.'.format(os.path.relpath(file_path)))
         else:
+            os.remove(datagram_file_path)
             self.transcript.append(
                 '    Skipped {}. OSC file already exists.'.format(
                     os.path.relpath(file_path)))
@@ -289,12 +477,12 @@ class SessionRenderer(SupriyaObject):
             sample_rate=sample_rate,
             )
         (
-            datagram,
+            _,
             input_file_path,
             osc_bundles,
             session,
             session_file_path,
-            ) = prerender_tuples[-1]
+            ) = prerender_tuples[-1][-1]
         return osc_bundles
 
     def render(
@@ -303,6 +491,8 @@ class SessionRenderer(SupriyaObject):
         debug=None,
         duration=None,
         header_format=soundfiletools.HeaderFormat.AIFF,
+        process_count=1,
+        render_cache=None,
         render_path=None,
         sample_format=soundfiletools.SampleFormat.INT24,
         sample_rate=44100,
@@ -310,47 +500,78 @@ class SessionRenderer(SupriyaObject):
         ):
         from supriya import supriya_configuration
         render_path = render_path or supriya_configuration.output_directory
+        process_count = int(process_count)
+        assert 0 < process_count
         self.transcript[:] = []
+        self.render_times.clear()
         original_output_file_path = output_file_path
         prerender_tuples = self._collect_prerender_tuples(
             self.session,
+            datagram_directory=os.path.abspath(render_path),
             duration=duration,
             header_format=header_format,
             sample_format=sample_format,
             sample_rate=sample_rate,
             )
         assert prerender_tuples, prerender_tuples
-        for i, prerender_tuple in enumerate(prerender_tuples):
-            (
-                datagram,
-                input_file_path,
-                osc_bundles,
-                session,
-                session_file_path,
-                ) = prerender_tuple
-            extension = header_format.name.lower()
-            if i < len(prerender_tuples) - 1 or not output_file_path:
-                output_file_path, _ = os.path.splitext(session_file_path)
-                output_file_path = '{}.{}'.format(output_file_path, extension)
-            else:
-                output_file_path = original_output_file_path
-            if input_file_path and input_file_path.endswith('.osc'):
-                input_file_path, _ = os.path.splitext(input_file_path)
-                input_file_path = '{}.{}'.format(input_file_path, extension)
+        extension = header_format.name.lower()
+        try:
             with TemporaryDirectoryChange(directory=render_path):
-                self._write_datagram(session_file_path, datagram)
-                exit_code = self._render_datagram(
-                    session,
-                    input_file_path,
-                    output_file_path,
-                    session_file_path,
-                    header_format=header_format,
-                    sample_format=sample_format,
-                    sample_rate=sample_rate,
-                    **kwargs
-                    )
-            if exit_code:
-                raise Exception(exit_code)
+                for i, level in enumerate(prerender_tuples):
+                    jobs = []
+                    for prerender_tuple in level:
+                        (
+                            datagram_file_path,
+                            input_file_path,
+                            osc_bundles,
+                            session,
+                            session_file_path,
+                            ) = prerender_tuple
+                        if (
+                            i < len(prerender_tuples) - 1 or
+                            not original_output_file_path
+                            ):
+                            output_file_path, _ = os.path.splitext(
+                                session_file_path)
+                            output_file_path = '{}.{}'.format(
+                                output_file_path, extension)
+                        else:
+                            output_file_path = original_output_file_path
+                        if (
+                            input_file_path and
+                            input_file_path.endswith('.osc')
+                            ):
+                            input_file_path, _ = os.path.splitext(
+                                input_file_path)
+                            input_file_path = '{}.{}'.format(
+                                input_file_path, extension)
+                        jobs.append((
+                            datagram_file_path,
+                            input_file_path,
+                            osc_bundles,
+                            output_file_path,
+                            session,
+                            session_file_path,
+                            ))
+                    exit_codes = self._render_level(
+                        jobs,
+                        header_format=header_format,
+                        process_count=process_count,
+                        render_cache=render_cache,
+                        sample_format=sample_format,
+                        sample_rate=sample_rate,
+                        **kwargs
+                        )
+                    for exit_code in exit_codes:
+                        if exit_code:
+                            raise Exception(exit_code)
+        finally:
+            # Repeated sessions and failed renders leave datagrams unmoved.
+            for level in prerender_tuples:
+                for prerender_tuple in level:
+                    datagram_file_path = prerender_tuple[0]
+                    if os.path.exists(datagram_file_path):
+                        os.remove(datagram_file_path)
         if not os.path.isabs(output_file_path) and render_path:
             output_file_path = os.path.join(
                 render_path,
@@ -360,6 +581,16 @@ class SessionRenderer(SupriyaObject):
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def render_times(self):
+        """
+        Wall time in seconds of each scsynth render of the last render call,
+        keyed by session file path.
+
+        Sessions skipped because their output already existed are omitted.
+        """
+        return self._render_times
+
     @property
     def session(self):
         return self._session
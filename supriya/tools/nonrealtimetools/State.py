@@ -71,11 +71,11 @@ class State(SessionObject):
         if nodes_to_children is not None:
             nodes_to_children = nodes_to_children.copy()
         else:
-            nodes_to_children = {}
+            nodes_to_children = nonrealtimetools.NodeTreeMapping()
         if nodes_to_parents is not None:
             nodes_to_parents = nodes_to_parents.copy()
         else:
-            nodes_to_parents = {}
+            nodes_to_parents = nonrealtimetools.NodeTreeMapping()
         transitions = transitions or {}
         for node, action in transitions.items():
             action.apply_transform(nodes_to_children, nodes_to_parents)
@@ -51,3 +51,33 @@ class TestCase(TestCase):
                     )
                 )
             ]
+
+    def test_02(self):
+        r'''Setting a bus twice at one offset keeps the last value.'''
+        session = nonrealtimetools.Session()
+        bus = session.add_bus()
+        with session.at(0):
+            bus.set_(-1)
+        with session.at(1):
+            bus.set_(0.25)
+            bus.set_(0.75)
+            assert bus.get() == 0.75
+        with session.at(0):
+            bus.set_(-0.5)
+            assert bus.get() == -0.5
+        assert bus._events == [(0, -0.5), (1, 0.75)]
+        assert session.to_osc_bundles() == [
+            osctools.OscBundle(
+                timestamp=0.0,
+                contents=(
+                    osctools.OscMessage('/c_set', 0, -0.5),
+                    )
+                ),
+            osctools.OscBundle(
+                timestamp=1.0,
+                contents=(
+                    osctools.OscMessage('/c_set', 0, 0.75),
+                    osctools.OscMessage(0),
+                    )
+                ),
+            ]
@@ -0,0 +1,73 @@
+# -*- encoding: utf-8 -*-
+from supriya.tools import nonrealtimetools
+from nonrealtimetools_testbase import TestCase
+
+
+class TestCase(TestCase):
+
+    def test_copy(self):
+        mapping_one = nonrealtimetools.NodeTreeMapping({'a': None, 'b': ()})
+        mapping_two = mapping_one.copy()
+        assert mapping_two._base is mapping_one._base
+        mapping_two['c'] = ('a',)
+        del(mapping_two['a'])
+        mapping_one['b'] = ('c',)
+        assert mapping_one == {'a': None, 'b': ('c',)}
+        assert mapping_two == {'b': (), 'c': ('a',)}
+        assert len(mapping_one) == 2
+        assert len(mapping_two) == 2
+        assert 'a' not in mapping_two
+        assert mapping_two.get('a', 1) == 1
+        assert mapping_two.pop('c') == ('a',)
+        assert sorted(mapping_two) == ['b']
+        mapping_two['a'] = None
+        assert mapping_two == {'a': None, 'b': ()}
+        with self.assertRaises(KeyError):
+            del(mapping_two['c'])
+
+    def test_equality(self):
+        mapping_one = nonrealtimetools.NodeTreeMapping({'a': None, 'b': ()})
+        mapping_two = mapping_one.copy()
+        assert mapping_one == mapping_two
+        mapping_two['a'] = ('b',)
+        assert mapping_one != mapping_two
+        mapping_two['a'] = None
+        assert mapping_one == mapping_two
+        mapping_three = nonrealtimetools.NodeTreeMapping({'a': None, 'b': ()})
+        assert mapping_three._base is not mapping_one._base
+        assert mapping_one == mapping_three
+
+    def test_rebase(self):
+        mapping_one = nonrealtimetools.NodeTreeMapping()
+        for i in range(8):
+            mapping_one[i] = None
+        mapping_one = mapping_one.copy()
+        base = mapping_one._base
+        mapping_one[0] = (1,)
+        mapping_two = mapping_one.copy()
+        assert mapping_two._base is base
+        assert mapping_two._changes == {0: (1,)}
+        for i in range(8, 12):
+            mapping_two[i] = None
+        mapping_three = mapping_two.copy()
+        assert mapping_three._base is not base
+        assert mapping_three._changes == {}
+        assert mapping_three == mapping_two
+        assert len(mapping_three) == 12
+
+    def test_session(self):
+        session = nonrealtimetools.Session()
+        with session.at(0):
+            group = session.add_group(duration=10)
+            for _ in range(8):
+                group.add_group(duration=10)
+        with session.at(5):
+            synth = group.add_synth(duration=1)
+        state_one = session.states[5]
+        state_two = session.states[6]
+        assert synth.get_parent(offset=5) is group
+        assert state_one.nodes_to_children._base is \
+            state_two.nodes_to_children._base
+        assert state_one.nodes_to_children[group][0] is synth
+        assert synth not in state_two.nodes_to_children
+        assert synth not in state_two.nodes_to_children[group]
@@ -0,0 +1,172 @@
+# -*- encoding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import threading
+import time
+from supriya.tools import nonrealtimetools
+from supriya.tools import servertools
+from nonrealtimetools_testbase import TestCase
+
+
+class TestCase(TestCase):
+
+    def setUp(self):
+        super(TestCase, self).setUp()
+        self.cache_directory = tempfile.mkdtemp()
+        self.render_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_directory)
+        shutil.rmtree(self.render_directory)
+        super(TestCase, self).tearDown()
+
+    def write_file(self, name, contents):
+        file_path = os.path.join(self.render_directory, name)
+        with open(file_path, 'wb') as file_pointer:
+            file_pointer.write(contents)
+        return file_path
+
+    def test_store_and_retrieve(self):
+        render_cache = nonrealtimetools.RenderCache(self.cache_directory)
+        file_path = self.write_file('one.aiff', b'abc')
+        render_cache.store('one', file_path, render_time=1.5)
+        assert 'one' in render_cache
+        entry = render_cache.manifest['one']
+        assert entry['file_name'] == 'one.aiff'
+        assert entry['render_time'] == 1.5
+        assert entry['size'] == 3
+        output_file_path = os.path.join(self.render_directory, 'two.aiff')
+        assert render_cache.retrieve('one', output_file_path)
+        with open(output_file_path, 'rb') as file_pointer:
+            assert file_pointer.read() == b'abc'
+        assert not render_cache.retrieve('two', output_file_path)
+        # The manifest is shared with other caches on the same directory.
+        other_cache = nonrealtimetools.RenderCache(self.cache_directory)
+        assert 'one' in other_cache
+
+    def test_integrity(self):
+        render_cache = nonrealtimetools.RenderCache(self.cache_directory)
+        file_path = self.write_file('one.aiff', b'abc')
+        render_cache.store('one', file_path)
+        cached_file_path = os.path.join(self.cache_directory, 'one.aiff')
+        with open(cached_file_path, 'wb') as file_pointer:
+            file_pointer.write(b'abd')
+        output_file_path = os.path.join(self.render_directory, 'two.aiff')
+        assert not render_cache.retrieve('one', output_file_path)
+        assert not os.path.exists(output_file_path)
+        assert not os.path.exists(cached_file_path)
+        assert 'one' not in render_cache
+
+    def test_eviction(self):
+        render_cache = nonrealtimetools.RenderCache(
+            self.cache_directory,
+            maximum_size=10,
+            )
+        for name in ('one', 'two', 'three'):
+            file_path = self.write_file(name + '.aiff', b'abcd')
+            render_cache.store(name, file_path)
+            time.sleep(0.01)
+        assert sorted(render_cache.manifest) == ['three', 'two']
+        output_file_path = os.path.join(self.render_directory, 'out.aiff')
+        assert render_cache.retrieve('two', output_file_path)
+        file_path = self.write_file('four.aiff', b'abcd')
+        render_cache.store('four', file_path)
+        assert sorted(render_cache.manifest) == ['four', 'two']
+        assert sorted(os.listdir(self.cache_directory)) == [
+            'four.aiff', 'manifest.json', 'manifest.lock', 'two.aiff',
+            ]
+        render_cache.evict(maximum_size=4)
+        assert sorted(render_cache.manifest) == ['four']
+        render_cache.clear()
+        assert len(render_cache) == 0
+
+    def test_orphans(self):
+        render_cache = nonrealtimetools.RenderCache(
+            self.cache_directory,
+            maximum_size=10,
+            )
+        orphan_file_path = os.path.join(
+            self.cache_directory, '{}.aiff'.format('0' * 32))
+        unrelated_file_path = os.path.join(self.cache_directory, 'notes.txt')
+        subdirectory_path = os.path.join(self.cache_directory, '1' * 32)
+        for file_path in (orphan_file_path, unrelated_file_path):
+            with open(file_path, 'wb') as file_pointer:
+                file_pointer.write(b'abcdefgh')
+        os.mkdir(subdirectory_path)
+        render_cache.store('one', self.write_file('one.aiff', b'abcd'))
+        assert not os.path.exists(orphan_file_path)
+        assert os.path.exists(unrelated_file_path)
+        assert os.path.isdir(subdirectory_path)
+        assert sorted(render_cache.manifest) == ['one']
+        render_cache.evict(maximum_size=1)
+        assert os.path.exists(unrelated_file_path)
+        assert os.path.isdir(subdirectory_path)
+        assert not render_cache.manifest
+
+    def test_concurrent_stores(self):
+        def store(index):
+            # Each cache has its own in-process lock, as in separate processes.
+            render_cache = nonrealtimetools.RenderCache(self.cache_directory)
+            for i in range(10):
+                name = '{}-{}'.format(index, i)
+                render_cache.store(name, file_paths[index])
+        file_paths = [
+            self.write_file('{}.aiff'.format(i), b'abc') for i in range(8)
+            ]
+        threads = [
+            threading.Thread(target=store, args=(i,)) for i in range(8)
+            ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        render_cache = nonrealtimetools.RenderCache(self.cache_directory)
+        assert len(render_cache) == 80
+
+    def test_input_contents(self):
+        session = nonrealtimetools.Session()
+        renderer = nonrealtimetools.SessionRenderer(session)
+        input_file_path = self.write_file('input.aiff', b'abc')
+        keys = []
+        for contents in (b'abc', b'abd', b'abc'):
+            self.write_file('input.aiff', contents)
+            keys.append(renderer._build_render_cache_key(
+                input_file_path,
+                'output.aiff',
+                'session.osc',
+                servertools.ServerOptions(),
+                ))
+        assert keys[0] != keys[1]
+        assert keys[0] == keys[2]
+
+    def test_render(self):
+        session = nonrealtimetools.Session()
+        with session.at(0):
+            session.add_synth(duration=1)
+        renderer = nonrealtimetools.SessionRenderer(session)
+        (
+            _,
+            input_file_path,
+            osc_bundles,
+            _,
+            session_file_path,
+            ) = renderer._collect_prerender_tuples(session)[-1][-1]
+        key = renderer._build_render_cache_key(
+            input_file_path,
+            'output.aiff',
+            session_file_path,
+            servertools.ServerOptions(),
+            )
+        render_cache = nonrealtimetools.RenderCache(self.cache_directory)
+        render_cache.store(key, self.write_file('cached.aiff', b'abc'))
+        exit_code, output_file_path = session.render(
+            'output.aiff',
+            render_cache=render_cache,
+            render_path=self.render_directory,
+            )
+        assert exit_code == 0
+        assert session.transcript[-1] == \
+            '    Retrieved {} from render cache.'.format(session_file_path)
+        with open(output_file_path, 'rb') as file_pointer:
+            assert file_pointer.read() == b'abc'
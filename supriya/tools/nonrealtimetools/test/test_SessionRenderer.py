@@ -0,0 +1,66 @@
+# -*- encoding: utf-8 -*-
+import hashlib
+import os
+from supriya.tools import nonrealtimetools
+from nonrealtimetools_testbase import TestCase
+
+
+class TestCase(TestCase):
+
+    def build_session(self):
+        session = nonrealtimetools.Session()
+        with session.at(0):
+            synth = session.add_synth(duration=10)
+        for offset in range(1, 10):
+            with session.at(offset):
+                synth['frequency'] = offset * 110
+        return session
+
+    def test__build_datagram_hash(self):
+        session = self.build_session()
+        renderer = nonrealtimetools.SessionRenderer(session)
+        osc_bundles = session.to_osc_bundles()
+        datagram = session.to_datagram()
+        md5, datagram_size = renderer._build_datagram_hash(osc_bundles)
+        assert md5.hexdigest() == hashlib.md5(datagram).hexdigest()
+        assert datagram_size == len(datagram)
+        assert b''.join(renderer._iterate_datagrams(osc_bundles)) == datagram
+        file_path = os.path.join(self.output_directory, 'session.osc')
+        with open(file_path, 'wb') as file_pointer:
+            written_md5, _ = renderer._build_datagram_hash(
+                osc_bundles, file_pointer)
+        assert written_md5.hexdigest() == md5.hexdigest()
+        with open(file_path, 'rb') as file_pointer:
+            assert file_pointer.read() == datagram
+
+    def test__write_datagram(self):
+        session = self.build_session()
+        renderer = nonrealtimetools.SessionRenderer(session)
+        datagram = session.to_datagram()
+        file_path = os.path.join(self.output_directory, 'session.osc')
+        datagram_file_path = os.path.join(self.output_directory, 'datagram')
+
+        def write_datagram_file(datagram):
+            with open(datagram_file_path, 'wb') as file_pointer:
+                file_pointer.write(datagram)
+
+        write_datagram_file(datagram)
+        renderer._write_datagram(file_path, datagram_file_path)
+        assert not os.path.exists(datagram_file_path)
+        with open(file_path, 'rb') as file_pointer:
+            assert file_pointer.read() == datagram
+        write_datagram_file(datagram)
+        renderer._write_datagram(file_path, datagram_file_path)
+        assert not os.path.exists(datagram_file_path)
+        with open(file_path, 'wb') as file_pointer:
+            file_pointer.write(datagram[:-4])
+        write_datagram_file(datagram)
+        renderer._write_datagram(file_path, datagram_file_path)
+        assert not os.path.exists(datagram_file_path)
+        with open(file_path, 'rb') as file_pointer:
+            assert file_pointer.read() == datagram
+        assert [line.split()[0] for line in renderer.transcript] == [
+            'Writing', 'Wrote',
+            'Writing', 'Skipped',
+            'Writing', 'Wrote',
+            ]
@@ -0,0 +1,190 @@
+# -*- encoding: utf-8 -*-
+import random
+from supriya.tools import nonrealtimetools
+from nonrealtimetools_testbase import TestCase
+
+
+class TestCase(TestCase):
+
+    def build_session(self, session):
+        with session.at(0):
+            group_one = session.add_group(duration=20)
+            group_two = session.add_group(duration=15)
+        for i in range(12):
+            with session.at(i):
+                target = group_one if i % 2 else group_two
+                target.add_synth(duration=3)
+        with session.at(5):
+            synth = group_one.add_synth(duration=10)
+        with session.at(8):
+            group_two.move_node(synth)
+        with session.at(10):
+            group_one.split()
+        with session.at(2):
+            session.add_group(duration=4).delete()
+        synth.set_duration(6)
+        return session
+
+    def build_random_session(self, session, seed):
+        rng = random.Random(seed)
+        nodes = []
+        groups = [session.root_node]
+        with session.at(0):
+            # Keep the root node occupied, as deleting its only child fails.
+            session.add_synth(duration=30)
+        for _ in range(12):
+            choice = rng.random()
+            live = [_ for _ in nodes if _ in session.nodes]
+            synths = [
+                _ for _ in live
+                if isinstance(_, nonrealtimetools.Synth)
+                ]
+            if choice < 0.35 or not live:
+                offset = rng.randint(0, 10)
+                parent = rng.choice(groups)
+                if parent is not session.root_node and not (
+                    parent.start_offset <= offset < parent.stop_offset
+                    ):
+                    parent = session.root_node
+                with session.at(offset):
+                    if rng.random() < 0.4:
+                        node = parent.add_group(duration=rng.randint(1, 8))
+                        groups.append(node)
+                    else:
+                        node = parent.add_synth(duration=rng.randint(1, 8))
+                nodes.append(node)
+            elif choice < 0.5:
+                node = rng.choice(live)
+                if node.duration < 2:
+                    continue
+                offset = rng.randint(
+                    int(node.start_offset) + 1,
+                    int(node.stop_offset) - 1,
+                    )
+                with session.at(offset):
+                    shards = node.split()
+                for shard in shards[1:]:
+                    nodes.append(shard)
+                    if isinstance(shard, nonrealtimetools.Group):
+                        groups.append(shard)
+            elif choice < 0.65:
+                if synths:
+                    rng.choice(synths).delete()
+            elif choice < 0.8:
+                if not synths:
+                    continue
+                node = rng.choice(synths)
+                offset = rng.randint(
+                    int(node.start_offset),
+                    int(node.stop_offset) - 1,
+                    )
+                targets = [
+                    _ for _ in groups
+                    if _ is session.root_node or (
+                        _ in session.nodes and
+                        _.start_offset <= offset < _.stop_offset
+                        )
+                    ]
+                with session.at(offset):
+                    rng.choice(targets).move_node(
+                        node,
+                        add_action=rng.choice(['ADD_TO_HEAD', 'ADD_TO_TAIL']),
+                        )
+            elif choice < 0.9:
+                rng.choice(live).set_duration(rng.randint(1, 8))
+            elif synths:
+                node = rng.choice(synths)
+                offset = rng.randint(
+                    int(node.start_offset),
+                    int(node.stop_offset) - 1,
+                    )
+                with session.at(offset):
+                    node['amplitude'] = rng.random()
+        return session
+
+    def test_01(self):
+        session_one = self.build_session(nonrealtimetools.Session())
+        session_two = nonrealtimetools.Session()
+        with session_two.batch():
+            self.build_session(session_two)
+            assert session_two._stale_offset is not None
+        assert session_two._stale_offset is None
+        assert not session_two._deferred_offsets
+        assert session_one.offsets == session_two.offsets
+        assert session_one.to_strings() == session_two.to_strings()
+        assert session_one.to_lists() == session_two.to_lists()
+
+    def test_02(self):
+        session = nonrealtimetools.Session()
+        with session.batch():
+            with session.at(0):
+                group = session.add_group(duration=10)
+            with session.batch():
+                with session.at(5):
+                    synth = group.add_synth(duration=10)
+            assert session._active_batches
+            assert synth.get_parent(offset=7) is group
+            with session.at(1):
+                session.add_group(add_action='ADD_TO_HEAD')
+        assert not session._active_batches
+        assert session.to_strings() == self.normalize('''
+            0.0:
+                NODE TREE 0 group
+                    1000 group
+            1.0:
+                NODE TREE 0 group
+                    1002 group
+                    1000 group
+            5.0:
+                NODE TREE 0 group
+                    1002 group
+                    1000 group
+                        1001 da0982184cc8fa54cf9d288a0fe1f6ca
+            10.0:
+                NODE TREE 0 group
+                    1002 group
+            inf:
+                NODE TREE 0 group
+            ''')
+
+    def test_03(self):
+        r'''Deleting inside a batch sees states past the stale offset.'''
+        def build(session):
+            with session.at(0):
+                synth = session.add_synth(duration=5)
+            with session.at(1):
+                synth.split()
+            with session.at(2):
+                synth['amplitude'] = 0.5
+            with session.at(5):
+                synth = session.add_synth(duration=2)
+            with session.at(4):
+                synth.delete()
+        session_one = nonrealtimetools.Session()
+        build(session_one)
+        session_two = nonrealtimetools.Session()
+        with session_two.batch():
+            build(session_two)
+        assert session_one.to_strings() == session_two.to_strings()
+        assert session_one.to_lists() == session_two.to_lists()
+
+    def test_04(self):
+        r'''Randomized adds, splits, deletes, moves, duration changes and
+        settings build identically with and without batching.
+        '''
+        compared_count = 0
+        for seed in range(100):
+            try:
+                expected = self.build_random_session(
+                    nonrealtimetools.Session(), seed)
+            except Exception:
+                # Some random edits are invalid even without batching.
+                continue
+            session = nonrealtimetools.Session()
+            with session.batch():
+                self.build_random_session(session, seed)
+            assert session.offsets == expected.offsets, seed
+            assert session.to_strings() == expected.to_strings(), seed
+            assert session.to_lists() == expected.to_lists(), seed
+            compared_count += 1
+        assert 90 <= compared_count
@@ -1,5 +1,10 @@
 # -*- encoding: utf-8 -*-
+import collections
 import os
+import threading
+import time
+import unittest
+from abjad.tools import systemtools
 from supriya import supriya_configuration
 from supriya.tools import nonrealtimetools
 from supriya.tools import soundfiletools
@@ -8,6 +13,40 @@ from supriya.tools import ugentools
 from nonrealtimetools_testbase import TestCase
 
 
+class RecordingSessionRenderer(nonrealtimetools.SessionRenderer):
+    """
+    Records writes and renders, producing empty output files.
+    """
+
+    def __init__(self, session):
+        nonrealtimetools.SessionRenderer.__init__(self, session)
+        self.lock = threading.Lock()
+        self.rendered_paths = collections.Counter()
+        self.written_paths = collections.Counter()
+
+    def _render_datagram(
+        self,
+        session,
+        input_file_path,
+        output_file_path,
+        session_file_path,
+        **kwargs
+        ):
+        with self.lock:
+            self.rendered_paths[output_file_path] += 1
+        time.sleep(0.05)
+        if not os.path.exists(output_file_path):
+            with open(output_file_path, 'wb'):
+                pass
+        return 0
+
+    def _write_datagram(self, file_path, datagram_file_path):
+        with self.lock:
+            self.written_paths[file_path] += 1
+        nonrealtimetools.SessionRenderer._write_datagram(
+            self, file_path, datagram_file_path)
+
+
 class TestCase(TestCase):
 
     def _build_dc_synthdef(self, channel_count=1):
@@ -687,3 +726,98 @@ class TestCase(TestCase):
             '    Command: scsynth -N 73b90e1467ddd06f4afa06dff1f5cb41.osc _ output.aiff 44100 aiff int24',
             '    Rendered 73b90e1467ddd06f4afa06dff1f5cb41.osc with exit code 0.',
             ]
+
+    @unittest.skipIf(
+        not systemtools.IOManager.find_executable(
+            supriya_configuration.scsynth_path),
+        'No scsynth',
+        )
+    def test_09(self):
+        """
+        Independent Session DiskIn inputs, rendered concurrently.
+        """
+        inner_sessions = [
+            self._make_session(multiplier=multiplier)
+            for multiplier in (0.125, 0.25, 0.5)
+            ]
+        outer_session = nonrealtimetools.Session(name='outer-session')
+        diskin_synthdef = self._build_diskin_synthdef(channel_count=8)
+        with outer_session.at(0):
+            for inner_session in inner_sessions:
+                buffer_ = outer_session.cue_soundfile(
+                    inner_session,
+                    duration=10,
+                    )
+                outer_session.add_synth(
+                    synthdef=diskin_synthdef,
+                    buffer_id=buffer_,
+                    duration=10,
+                    )
+        renderer = nonrealtimetools.SessionRenderer(outer_session)
+        exit_code, transcript, _ = renderer.render(
+            self.output_file_path,
+            process_count=3,
+            render_path=self.output_directory,
+            )
+        self.assert_ok(exit_code, 10., 44100, 8)
+        assert self._sample(self.output_file_path) == {
+            0.0: [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            0.21: [0.21875] * 8,
+            0.41: [0.4375] * 8,
+            0.61: [0.65625] * 8,
+            0.81: [0.875] * 8,
+            0.99: [0.875] * 8,
+            }
+        assert len(renderer.render_times) == 4
+        assert len(transcript) == 20
+        # Lines of concurrent renders interleave, but stay in order per
+        # session, and the outer session renders last.
+        for session_file_path in renderer.render_times:
+            lines = [x for x in transcript if session_file_path in x]
+            assert len(lines) == 5
+            assert lines[0].startswith('Writing')
+            assert lines[2].startswith('Rendering')
+        assert transcript[-2].endswith('_ output.aiff 44100 aiff int24')
+        exit_code, transcript, _ = renderer.render(
+            self.output_file_path,
+            process_count=3,
+            render_path=self.output_directory,
+            )
+        assert not renderer.render_times
+        assert len(transcript) == 16
+
+    def test_10(self):
+        """
+        Identical sessions in one level render once, even concurrently.
+        """
+        inner_sessions = [
+            self._make_session(multiplier=0.5)
+            for _ in range(2)
+            ]
+        inner_sessions.append(self._make_session(multiplier=0.25))
+        outer_session = nonrealtimetools.Session(name='outer-session')
+        diskin_synthdef = self._build_diskin_synthdef(channel_count=8)
+        with outer_session.at(0):
+            for inner_session in inner_sessions:
+                buffer_ = outer_session.cue_soundfile(
+                    inner_session,
+                    duration=10,
+                    )
+                outer_session.add_synth(
+                    synthdef=diskin_synthdef,
+                    buffer_id=buffer_,
+                    duration=10,
+                    )
+        renderer = RecordingSessionRenderer(outer_session)
+        exit_code, _, _ = renderer.render(
+            self.output_file_path,
+            process_count=3,
+            render_path=self.output_directory,
+            )
+        assert exit_code == 0
+        assert len(renderer.rendered_paths) == 3
+        assert set(renderer.rendered_paths.values()) == {1}
+        assert len(renderer.written_paths) == 3
+        assert set(renderer.written_paths.values()) == {1}
+        file_names = os.listdir(self.output_directory)
+        assert len([_ for _ in file_names if _.endswith('.osc')]) == 3
@@ -0,0 +1,77 @@
+# -*- encoding: utf-8 -*-
+from supriya.tools import nonrealtimetools
+from nonrealtimetools_testbase import TestCase
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class TestCase(TestCase):
+
+    def build_automated_session(self, synth_count, step_count):
+        session = nonrealtimetools.Session()
+        with session.at(0):
+            bus = session.add_bus()
+            synths = [
+                session.add_synth(duration=step_count + 1)
+                for _ in range(synth_count)
+                ]
+        for step in range(1, step_count + 1):
+            with session.at(step):
+                synth = synths[step % synth_count]
+                synth['amplitude'] = 1.0 / step
+                synth['frequency'] = step
+                bus.set_(step)
+        return session, bus, synths
+
+    def test_index(self):
+        session, bus, synths = self.build_automated_session(2, 4)
+        assert sorted(session._events_by_offset) == [1, 2, 3, 4]
+        assert session._events_by_offset[1] == {
+            bus: set([None]),
+            synths[1]: set(['amplitude', 'frequency']),
+            }
+        with session.at(2.5):
+            old_synth, new_synth = synths[0].split()
+        assert session._events_by_offset[2.5] == {
+            new_synth: set(['amplitude', 'frequency']),
+            }
+        assert session._events_by_offset[4] == {
+            bus: set([None]),
+            new_synth: set(['amplitude', 'frequency']),
+            }
+        assert session.to_lists()[-2] == [4.0, [
+            ['/c_set', 0, 4.0],
+            ['/n_set', 1002, 'amplitude', 0.25, 'frequency', 4],
+            ]]
+
+    def test_visits(self):
+        synth_count, step_count = 20, 200
+        session, _, _ = self.build_automated_session(synth_count, step_count)
+        collect_settings = nonrealtimetools.Node._collect_settings
+        with mock.patch.object(
+            nonrealtimetools.Node,
+            '_collect_settings',
+            autospec=True,
+            side_effect=collect_settings,
+            ) as patched:
+            osc_bundles = session.to_osc_bundles()
+        assert len(osc_bundles) == step_count + 2
+        # Only the one synth automated at each offset is visited.
+        assert patched.call_count == step_count
+
+    def test_repeated_settings(self):
+        r'''Setting a node control twice at one offset keeps the last value.
+        '''
+        session = nonrealtimetools.Session()
+        with session.at(0):
+            synth = session.add_synth(duration=3)
+        with session.at(1):
+            synth['amplitude'] = 0.25
+            synth['amplitude'] = 0.75
+            assert synth['amplitude'] == 0.75
+        assert synth._events['amplitude'] == [(1, 0.75)]
+        assert session.to_lists()[1] == [1.0, [
+            ['/n_set', 1000, 'amplitude', 0.75],
+            ]]
@@ -86,7 +86,9 @@ class OscBundle(OscMixin):
         )
 
     _bundle_prefix = b'#bundle\x00'
+    _header_struct = struct.Struct('>8s8s')
     _immediately = struct.pack('>q', 1)
+    _length_struct = struct.Struct('>i')
 
     ### INITIALIZER ###
 
@@ -107,6 +109,24 @@ class OscBundle(OscMixin):
 
     ### PRIVATE METHODS ###
 
+    def _compile(self, parts, realtime=True):
+        from supriya.tools import osctools
+        date = OscBundle._write_date(self._timestamp, realtime=realtime)
+        parts.append((OscBundle._header_struct, (self._bundle_prefix, date)))
+        size = OscBundle._header_struct.size
+        for content in self.contents:
+            length_part = [OscBundle._length_struct, None]
+            parts.append(length_part)
+            if isinstance(content, osctools.OscMessage):
+                struct_, values = content._compile()
+                parts.append((struct_, values))
+                content_length = struct_.size
+            else:
+                content_length = content._compile(parts)
+            length_part[1] = (content_length,)
+            size += OscBundle._length_struct.size + content_length
+        return size
+
     @staticmethod
     def _get_ntp_delta():
         import time
@@ -195,15 +215,14 @@ class OscBundle(OscMixin):
         return datagram
 
     def to_datagram(self, realtime=True):
-        from supriya.tools import osctools
-        datagram = OscBundle._bundle_prefix
-        datagram += OscBundle._write_date(self._timestamp, realtime=realtime)
-        for content in self.contents:
-            content_datagram = content.to_datagram()
-            content_length = len(content_datagram)
-            datagram += osctools.OscMessage._write_int(content_length)
-            datagram += content_datagram
-        return datagram
+        parts = []
+        size = self._compile(parts, realtime=realtime)
+        datagram = bytearray(size)
+        offset = 0
+        for struct_, values in parts:
+            struct_.pack_into(datagram, offset, *values)
+            offset += struct_.size
+        return bytes(datagram)
 
     def to_list(self):
         result = [self.timestamp]
@@ -18,11 +18,15 @@ class OscController(SupriyaObject):
     __slots__ = (
         '_debug_osc',
         '_debug_udp',
+        '_dispatch_worker_count',
         '_incoming_message_queue',
         '_listener',
+        '_overflow_policy',
+        '_queue_size',
         '_server',
         '_socket_instance',
         '_timeout',
+        '_zero_copy',
         )
 
     class CleanableQueue(queue.Queue):
@@ -45,16 +49,24 @@ class OscController(SupriyaObject):
         self,
         debug_osc=False,
         debug_udp=False,
+        dispatch_worker_count=0,
+        overflow_policy='block',
+        queue_size=1024,
         server=None,
         timeout=2,
+        zero_copy=False,
         ):
         self._debug_osc = bool(debug_osc)
         self._debug_udp = bool(debug_udp)
+        self._dispatch_worker_count = int(dispatch_worker_count)
+        self._overflow_policy = overflow_policy
+        self._queue_size = int(queue_size)
         self._server = server
         assert 0 < int(timeout)
         self._timeout = int(timeout)
         self._socket_instance = None
         self._listener = None
+        self._zero_copy = bool(zero_copy)
 
     ### SPECIAL METHODS ###
 
@@ -74,6 +86,10 @@ class OscController(SupriyaObject):
             client=self,
             debug_osc=self.debug_osc,
             debug_udp=self.debug_udp,
+            dispatch_worker_count=self.dispatch_worker_count,
+            overflow_policy=self.overflow_policy,
+            queue_size=self.queue_size,
+            zero_copy=self.zero_copy,
             )
         self._listener.start()
         self._socket_instance.bind(('', 0))
@@ -136,10 +152,22 @@ class OscController(SupriyaObject):
         if self.listener is not None:
             self.listener.debug_udp = self.debug_udp
 
+    @property
+    def dispatch_worker_count(self):
+        return self._dispatch_worker_count
+
     @property
     def listener(self):
         return self._listener
 
+    @property
+    def overflow_policy(self):
+        return self._overflow_policy
+
+    @property
+    def queue_size(self):
+        return self._queue_size
+
     @property
     def server(self):
         return self._server
@@ -151,3 +179,7 @@ class OscController(SupriyaObject):
     @property
     def timeout(self):
         return self._timeout
+
+    @property
+    def zero_copy(self):
+        return self._zero_copy
@@ -34,20 +34,133 @@ class OscDispatcher(SupriyaObject):
         >>> dispatcher.unregister_callback(osc_callback)
         >>> dispatcher(message)
 
+    Address patterns without wildcards resolve through a dictionary lookup.
+    Address patterns with OSC 1.0 wildcards (``?``, ``*``, ``[...]`` and
+    ``{...,...}``) are stored in a trie keyed by address part, so only
+    patterns whose leading parts match an incoming address are tested.
+    Callbacks with an argument template are further indexed by the first
+    value of their template.
+
+    ::
+
+        >>> callback = osctools.OscCallback(
+        ...     address_pattern='/n_{go,end}',
+        ...     argument_template=(1000,),
+        ...     procedure=lambda x: print('NODE:', x.address),
+        ...     )
+        >>> dispatcher.register_callback(callback)
+        >>> dispatcher(osctools.OscMessage('/n_go', 1000, 1, -1, -1, 0))
+        NODE: /n_go
+        >>> dispatcher(osctools.OscMessage('/n_go', 1001, 1, -1, -1, 0))
+        >>> dispatcher(osctools.OscMessage('/n_end', 1000, 1, -1, -1, 0))
+        NODE: /n_end
+
     """
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
-        '_address_map',
-        '_regex_map',
+        '_callback_count',
+        '_exact_map',
+        '_trie',
         )
 
+    _wildcard_characters = frozenset('?*[]{}')
+
+    class CallbackIndex(object):
+
+        __slots__ = (
+            '_by_first_argument',
+            '_callbacks',
+            '_unindexed',
+            )
+
+        def __init__(self):
+            self._by_first_argument = {}
+            self._callbacks = {}
+            self._unindexed = []
+
+        def __len__(self):
+            return len(self._callbacks)
+
+        def _get_key(self, osc_callback):
+            template = osc_callback.argument_template
+            if not template:
+                return None
+            try:
+                hash(template[0])
+            except TypeError:
+                return None
+            return template[0],
+
+        def add(self, osc_callback, order):
+            if osc_callback in self._callbacks:
+                return
+            self._callbacks[osc_callback] = order
+            key = self._get_key(osc_callback)
+            if key is None:
+                self._unindexed.append(osc_callback)
+            else:
+                self._by_first_argument.setdefault(key[0], []).append(
+                    osc_callback)
+
+        def collect(self, message, candidates):
+            contents = message.contents
+            if not contents or not self._by_first_argument:
+                osc_callbacks = list(self._callbacks)
+            else:
+                osc_callbacks = list(self._unindexed)
+                try:
+                    osc_callbacks.extend(
+                        self._by_first_argument.get(contents[0], ()))
+                except TypeError:
+                    for values in list(self._by_first_argument.values()):
+                        osc_callbacks.extend(values)
+            for osc_callback in osc_callbacks:
+                order = self._callbacks.get(osc_callback)
+                if order is not None:
+                    candidates.append((order, osc_callback))
+
+        def remove(self, osc_callback):
+            if osc_callback not in self._callbacks:
+                return False
+            del(self._callbacks[osc_callback])
+            key = self._get_key(osc_callback)
+            if key is None:
+                self._unindexed.remove(osc_callback)
+            else:
+                osc_callbacks = self._by_first_argument[key[0]]
+                osc_callbacks.remove(osc_callback)
+                if not osc_callbacks:
+                    del(self._by_first_argument[key[0]])
+            return True
+
+    class TrieNode(object):
+
+        __slots__ = (
+            'callback_index',
+            'children',
+            'wildcard_children',
+            )
+
+        def __init__(self):
+            self.callback_index = None
+            self.children = {}
+            self.wildcard_children = {}
+
+        def is_empty(self):
+            return (
+                not self.callback_index and
+                not self.children and
+                not self.wildcard_children
+                )
+
     ### INITIALIZER ###
 
     def __init__(self):
-        self._address_map = {}
-        self._regex_map = {}
+        self._callback_count = 0
+        self._exact_map = {}
+        self._trie = self.TrieNode()
 
     ### SPECIAL METHODS ###
 
@@ -61,11 +174,17 @@ class OscDispatcher(SupriyaObject):
         """
         from supriya.tools import osctools
         assert isinstance(message, osctools.OscMessage)
-        callbacks = []
-        for regex in self._regex_map:
-            if regex.match(message.address):
-                callbacks.extend(self._regex_map[regex])
-        for callback in callbacks:
+        candidates = []
+        callback_index = self._exact_map.get(message.address)
+        if callback_index is not None:
+            callback_index.collect(message, candidates)
+        if not self._trie.is_empty() and isinstance(message.address, str):
+            for callback_index in self._find_trie_callback_indices(
+                message.address):
+                callback_index.collect(message, candidates)
+        if 1 < len(candidates):
+            candidates.sort(key=lambda x: x[0])
+        for _, callback in candidates:
             if callback.argument_template:
                 is_valid = True
                 generator = zip(message.contents, callback.argument_template)
@@ -79,12 +198,88 @@ class OscDispatcher(SupriyaObject):
             if callback.is_one_shot:
                 self.unregister_callback(callback)
 
+    ### PRIVATE METHODS ###
+
+    def _find_trie_callback_indices(self, address):
+        nodes = [self._trie]
+        for part in address.split('/'):
+            next_nodes = []
+            for node in nodes:
+                child = node.children.get(part)
+                if child is not None:
+                    next_nodes.append(child)
+                for regex, child in tuple(node.wildcard_children.values()):
+                    if regex.match(part):
+                        next_nodes.append(child)
+            if not next_nodes:
+                return ()
+            nodes = next_nodes
+        return [node.callback_index for node in nodes if node.callback_index]
+
+    @staticmethod
+    def _is_wildcard_pattern(pattern):
+        if not isinstance(pattern, str):
+            return False
+        return not OscDispatcher._wildcard_characters.isdisjoint(pattern)
+
+    @staticmethod
+    def _translate_address_pattern(pattern):
+        result = []
+        index = 0
+        while index < len(pattern):
+            character = pattern[index]
+            index += 1
+            if character == '?':
+                result.append('[^/]')
+            elif character == '*':
+                result.append('[^/]*')
+            elif character == '[':
+                stop = pattern.index(']', index)
+                contents = pattern[index:stop]
+                index = stop + 1
+                negate = contents.startswith('!')
+                if negate:
+                    contents = contents[1:]
+                contents = ''.join(
+                    '\\' + x if x in '\\^]' else x
+                    for x in contents
+                    )
+                if negate:
+                    result.append('[^/' + contents + ']')
+                else:
+                    result.append('[' + contents + ']')
+            elif character == '{':
+                stop = pattern.index('}', index)
+                alternatives = pattern[index:stop].split(',')
+                index = stop + 1
+                result.append('(?:{})'.format(
+                    '|'.join(re.escape(x) for x in alternatives)))
+            else:
+                result.append(re.escape(character))
+        return ''.join(result)
+
     ### PUBLIC METHODS ###
 
     @staticmethod
     def compile_address_pattern(pattern):
-        pattern = pattern.replace('.', '\.')
-        pattern = pattern.replace('*', '[.\w|\+]*')
+        """
+        Compiles OSC address `pattern` into a regular expression.
+
+        ::
+
+            >>> regex = osctools.OscDispatcher.compile_address_pattern(
+            ...     '/n_{go,end}/[!a-c]?*')
+            >>> bool(regex.match('/n_go/d12'))
+            True
+
+        ::
+
+            >>> bool(regex.match('/n_end/a12'))
+            False
+
+        Returns compiled regular expression.
+        """
+        pattern = OscDispatcher._translate_address_pattern(pattern)
         pattern += '$'
         pattern = re.compile(pattern)
         return pattern
@@ -97,16 +292,30 @@ class OscDispatcher(SupriyaObject):
         """
         from supriya.tools import osctools
         assert isinstance(osc_callback, osctools.OscCallback)
-        if osc_callback.address_pattern in self._address_map:
-            regex = self._address_map[osc_callback.address_pattern]
+        address_pattern = osc_callback.address_pattern
+        if not self._is_wildcard_pattern(address_pattern):
+            callback_index = self._exact_map.get(address_pattern)
+            if callback_index is None:
+                callback_index = self.CallbackIndex()
+                self._exact_map[address_pattern] = callback_index
         else:
-            regex = self.compile_address_pattern(osc_callback.address_pattern)
-            self._address_map[osc_callback.address_pattern] = regex
-        if regex not in self._regex_map:
-            self._regex_map[regex] = []
-        osc_callbacks = self._regex_map[regex]
-        if osc_callback not in osc_callbacks:
-            osc_callbacks.append(osc_callback)
+            node = self._trie
+            for part in address_pattern.split('/'):
+                if self._is_wildcard_pattern(part):
+                    if part not in node.wildcard_children:
+                        regex = self.compile_address_pattern(part)
+                        node.wildcard_children[part] = (
+                            regex, self.TrieNode())
+                    node = node.wildcard_children[part][1]
+                else:
+                    if part not in node.children:
+                        node.children[part] = self.TrieNode()
+                    node = node.children[part]
+            if node.callback_index is None:
+                node.callback_index = self.CallbackIndex()
+            callback_index = node.callback_index
+        callback_index.add(osc_callback, self._callback_count)
+        self._callback_count += 1
 
     def unregister_callback(self, osc_callback):
         """
@@ -116,15 +325,37 @@ class OscDispatcher(SupriyaObject):
         """
         from supriya.tools import osctools
         assert isinstance(osc_callback, osctools.OscCallback)
-        if osc_callback.address_pattern not in self._address_map:
-            return
-        regex = self._address_map[osc_callback.address_pattern]
-        if regex not in self._regex_map:
+        address_pattern = osc_callback.address_pattern
+        if not self._is_wildcard_pattern(address_pattern):
+            callback_index = self._exact_map.get(address_pattern)
+            if callback_index is None:
+                return
+            callback_index.remove(osc_callback)
+            if not callback_index:
+                del(self._exact_map[address_pattern])
             return
-        osc_callbacks = self._regex_map[regex]
-        if osc_callback not in osc_callbacks:
+        path = []
+        node = self._trie
+        for part in address_pattern.split('/'):
+            if part in node.wildcard_children:
+                children = node.wildcard_children
+                child = children[part][1]
+            elif part in node.children:
+                children = node.children
+                child = children[part]
+            else:
+                return
+            path.append((children, part))
+            node = child
+        if node.callback_index is None:
             return
-        osc_callbacks.remove(osc_callback)
-        if not osc_callbacks:
-            del(self._regex_map[regex])
-            del(self._address_map[osc_callback.address_pattern])
+        node.callback_index.remove(osc_callback)
+        if not node.callback_index:
+            node.callback_index = None
+        for children, part in reversed(path):
+            child = children[part]
+            if isinstance(child, tuple):
+                child = child[1]
+            if not child.is_empty():
+                break
+            del(children[part])
@@ -1,5 +1,10 @@
 # -*- encoding: utf-8 -*-
 from __future__ import print_function
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+import select
 import socket
 import sys
 import threading
@@ -9,9 +14,41 @@ from supriya.tools.systemtools.SupriyaObject import SupriyaObject
 
 class OscListener(SupriyaObject, threading.Thread):
     """
-    An OSC listener
+    An OSC listener.
+
+    When `zero_copy` is true, datagrams are received into a preallocated
+    ring of `ring_size` buffers and parsed in place. Blobs in received
+    messages are then memoryviews into the ring, which remain valid until
+    `ring_size - 1` further datagrams have arrived. Callbacks which need to
+    keep a blob beyond that must copy it.
+
+    When `dispatch_worker_count` is greater than zero, the listener drains
+    every pending datagram from the socket in one pass into a queue of at
+    most `queue_size` messages, and that many worker threads dispatch
+    messages from the queue. A slow callback then no longer stalls the
+    socket. Workers dispatch concurrently, so with more than one worker
+    messages may be dispatched out of order.
+
+    `overflow_policy` decides what happens when the queue is full:
+
+    -   ``'block'``: the listener waits for the workers, leaving further
+        datagrams in the kernel's socket buffer.
+    -   ``'drop_newest'``: the incoming message is discarded.
+    -   ``'drop_oldest'``: the oldest queued message is discarded.
+
+    Dropped messages are counted in `dropped_count`.
     """
 
+    ### CLASS VARIABLES ###
+
+    _maximum_datagram_size = 2 ** 13
+
+    _overflow_policies = (
+        'block',
+        'drop_newest',
+        'drop_oldest',
+        )
+
     ### INITIALIZER ###
 
     def __init__(
@@ -19,7 +56,12 @@ class OscListener(SupriyaObject, threading.Thread):
         client=None,
         debug_osc=False,
         debug_udp=False,
+        dispatch_worker_count=0,
+        overflow_policy='block',
+        queue_size=1024,
+        ring_size=16,
         timeout=1,
+        zero_copy=False,
         ):
         threading.Thread.__init__(self)
         self.debug_osc = bool(debug_osc)
@@ -28,18 +70,136 @@ class OscListener(SupriyaObject, threading.Thread):
         self.setDaemon(True)
         self.running = False
         self.timeout = int(timeout)
+        self.zero_copy = bool(zero_copy)
+        ring_size = int(ring_size)
+        assert 0 < ring_size
+        dispatch_worker_count = int(dispatch_worker_count)
+        assert 0 <= dispatch_worker_count
+        queue_size = int(queue_size)
+        assert 0 < queue_size
+        assert overflow_policy in self._overflow_policies
+        if self.zero_copy and dispatch_worker_count:
+            # Queued messages must not have their buffers recycled.
+            if ring_size <= queue_size + dispatch_worker_count + 1:
+                message = 'With zero_copy, ring_size ({}) must exceed'
+                message += ' queue_size + dispatch_worker_count + 1 ({}).'
+                message = message.format(
+                    ring_size,
+                    queue_size + dispatch_worker_count + 1,
+                    )
+                raise ValueError(message)
+        self._buffers = None
+        self._buffer_index = 0
+        if self.zero_copy:
+            self._buffers = tuple(
+                bytearray(self._maximum_datagram_size)
+                for _ in range(ring_size)
+                )
+        self._dispatch_worker_count = dispatch_worker_count
+        self._dispatch_workers = []
+        self._overflow_policy = overflow_policy
+        self._queue = None
+        if dispatch_worker_count:
+            self._queue = queue.Queue(maxsize=queue_size)
+        self._dropped_count = 0
+        self._maximum_queue_depth = 0
+        self._received_count = 0
 
     ### SPECIAL METHODS ###
 
     def __del__(self):
         self.quit()
 
+    ### PRIVATE METHODS ###
+
+    def _dispatch(self, message):
+        if self.debug_osc:
+            if message.address != '/status.reply':
+                print('RECV', message.to_list())
+                if self.debug_udp:
+                    for line in str(message).splitlines():
+                        print('    ' + line)
+        self.client.server._osc_dispatcher(message)
+        self.client.server._response_dispatcher(message)
+
+    def _drain(self):
+        # The socket has a timeout, so poll it rather than wait on it.
+        socket_instance = self.client.socket_instance
+        while self.running:
+            readable, _, _ = select.select([socket_instance], [], [], 0)
+            if not readable:
+                return
+            message = self.get_message()
+            if message is None:
+                return
+            self._enqueue(message)
+
+    def _enqueue(self, message):
+        if self._overflow_policy == 'block':
+            self._queue.put(message)
+        elif self._overflow_policy == 'drop_newest':
+            try:
+                self._queue.put_nowait(message)
+            except queue.Full:
+                self._dropped_count += 1
+        else:
+            while True:
+                try:
+                    self._queue.put_nowait(message)
+                    break
+                except queue.Full:
+                    try:
+                        self._queue.get_nowait()
+                        self._dropped_count += 1
+                    except queue.Empty:
+                        pass
+        depth = self._queue.qsize()
+        if self._maximum_queue_depth < depth:
+            self._maximum_queue_depth = depth
+        self._received_count += 1
+
+    def _get_message_zero_copy(self):
+        from supriya.tools import osctools
+        buffer_ = self._buffers[self._buffer_index]
+        try:
+            size, address = self.client.socket_instance.recvfrom_into(buffer_)
+        except socket.timeout:
+            return None
+        if not size:
+            return None
+        self._buffer_index = (self._buffer_index + 1) % len(self._buffers)
+        datagram = memoryview(buffer_)[:size]
+        message = osctools.OscMessage.from_datagram(datagram)
+        return message
+
+    def _run_dispatch_worker(self):
+        while self.running:
+            try:
+                message = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                self._dispatch(message)
+            except:
+                sys.stderr.write('Exception in dispatch worker thread:\n')
+                traceback.print_exc()
+
+    def _start_dispatch_workers(self):
+        for i in range(self._dispatch_worker_count):
+            worker = threading.Thread(target=self._run_dispatch_worker)
+            worker.setDaemon(True)
+            worker.start()
+            self._dispatch_workers.append(worker)
+
     ### PUBLIC METHODS ###
 
     def get_message(self):
         from supriya.tools import osctools
+        if self.zero_copy:
+            return self._get_message_zero_copy()
         try:
-            data, address = self.client.socket_instance.recvfrom(2 ** 13)
+            data, address = self.client.socket_instance.recvfrom(
+                self._maximum_datagram_size)
             if data:
                 message = osctools.OscMessage.from_datagram(data)
                 return message
@@ -51,25 +211,53 @@ class OscListener(SupriyaObject, threading.Thread):
         self.running = False
         if wait:
             self.join(2)
+            for worker in self._dispatch_workers:
+                worker.join(2)
 
     def run(self):
         self.running = True
         self.client.socket_instance.settimeout(0.5)
-        osc_dispatcher = self.client.server._osc_dispatcher
-        response_dispatcher = self.client.server._response_dispatcher
+        if self._queue is not None:
+            self._start_dispatch_workers()
         try:
             while self.running:
                 message = self.get_message()
                 if message is None:
                     continue
-                if self.debug_osc:
-                    if message.address != '/status.reply':
-                        print('RECV', message.to_list())
-                        if self.debug_udp:
-                            for line in str(message).splitlines():
-                                print('    ' + line)
-                osc_dispatcher(message)
-                response_dispatcher(message)
+                if self._queue is None:
+                    self._received_count += 1
+                    self._dispatch(message)
+                    continue
+                self._enqueue(message)
+                self._drain()
         except:
             sys.stderr.write('Exception in listener thread:\n')
             traceback.print_exc()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def dispatch_worker_count(self):
+        return self._dispatch_worker_count
+
+    @property
+    def dropped_count(self):
+        return self._dropped_count
+
+    @property
+    def maximum_queue_depth(self):
+        return self._maximum_queue_depth
+
+    @property
+    def overflow_policy(self):
+        return self._overflow_policy
+
+    @property
+    def queue_depth(self):
+        if self._queue is None:
+            return 0
+        return self._queue.qsize()
+
+    @property
+    def received_count(self):
+        return self._received_count
@@ -31,6 +31,20 @@ class OscMessage(OscMixin):
         '_contents',
         )
 
+    _cache_size = 1024
+
+    _constant_type_tags = {
+        'F': False,
+        'N': None,
+        'T': True,
+        }
+
+    _decoding_plans = {}
+
+    _fixed_width_type_tags = frozenset('dfi')
+
+    _structs = {}
+
     ### INITIALIZER ###
 
     def __init__(
@@ -70,199 +84,149 @@ class OscMessage(OscMixin):
 
     ### PRIVATE METHODS ###
 
-    @staticmethod
-    def _decode_array(type_tags, type_tag_offset, payload, payload_offset):
-        assert type_tags[type_tag_offset] == '['
-        array = []
-        type_tag_offset += 1
-        while type_tags[type_tag_offset] != ']':
-            result, type_tag_offset, payload_offset = \
-                OscMessage._decode_value(
-                    type_tags,
-                    type_tag_offset,
-                    payload,
-                    payload_offset,
-                    )
-            array.append(result)
-        assert type_tags[type_tag_offset] == ']'
-        array = tuple(array)
-        type_tag_offset += 1
-        return array, type_tag_offset, payload_offset
-
-    @staticmethod
-    def _decode_blob(type_tags, type_tag_offset, payload, payload_offset):
-        assert type_tags[type_tag_offset] == 'b'
-        length = payload[payload_offset:payload_offset + 4]
-        length = struct.unpack('>i', length)
-        length = length[0]
-        payload_offset += 4
-        total_length = length + (-length % 4)
-        result = payload[payload_offset:payload_offset + length]
-        type_tag_offset += 1
-        payload_offset += total_length
-        return result, type_tag_offset, payload_offset
-
-    @staticmethod
-    def _decode_boolean(type_tags, type_tag_offset, payload, payload_offset):
-        type_tag = type_tags[type_tag_offset]
-        assert type_tag in ('T', 'F')
-        if type_tag == 'T':
-            result = True
-        elif type_tag == 'F':
-            result = False
-        type_tag_offset += 1
-        return result, type_tag_offset, payload_offset
-
-    @staticmethod
-    def _decode_double(type_tags, type_tag_offset, payload, payload_offset):
-        assert type_tags[type_tag_offset] == 'd'
-        result, payload_offset = OscMessage._read_double(
-            payload,
-            payload_offset,
-            )
-        type_tag_offset += 1
-        return result, type_tag_offset, payload_offset
-
-    @staticmethod
-    def _decode_float(type_tags, type_tag_offset, payload, payload_offset):
-        assert type_tags[type_tag_offset] == 'f'
-        result, payload_offset = OscMessage._read_float(
-            payload,
-            payload_offset,
-            )
-        type_tag_offset += 1
-        return result, type_tag_offset, payload_offset
-
-    @staticmethod
-    def _decode_int(type_tags, type_tag_offset, payload, payload_offset):
-        assert type_tags[type_tag_offset] == 'i'
-        result, payload_offset = OscMessage._read_int(
-            payload,
-            payload_offset,
-            )
-        type_tag_offset += 1
-        return result, type_tag_offset, payload_offset
-
-    @staticmethod
-    def _decode_none(type_tags, type_tag_offset, payload, payload_offset):
-        assert type_tags[type_tag_offset] == 'N'
-        result = None
-        type_tag_offset += 1
-        return result, type_tag_offset, payload_offset
-
-    @staticmethod
-    def _decode_string(type_tags, type_tag_offset, payload, payload_offset):
-        assert type_tags[type_tag_offset] == 's'
-        result, payload_offset = OscMessage._read_string(
-            payload,
-            payload_offset,
-            )
-        type_tag_offset += 1
-        return result, type_tag_offset, payload_offset
-
-    @staticmethod
-    def _decode_value(type_tags, type_tag_offset, payload, payload_offset):
-        type_tag = type_tags[type_tag_offset]
-        type_tag_mapping = {
-            'N': OscMessage._decode_none,
-            'T': OscMessage._decode_boolean,
-            'F': OscMessage._decode_boolean,
-            'd': OscMessage._decode_double,
-            'i': OscMessage._decode_int,
-            'f': OscMessage._decode_float,
-            's': OscMessage._decode_string,
-            'b': OscMessage._decode_blob,
-            '[': OscMessage._decode_array,
-            }
-        procedure = type_tag_mapping[type_tag]
-        result, type_tag_offset, payload_offset = \
-            procedure(type_tags, type_tag_offset, payload, payload_offset)
-        return result, type_tag_offset, payload_offset
-
-    @staticmethod
-    def _encode_array(array):
-        assert isinstance(array, collections.Sequence)
-        type_tags = '['
-        encoded_value = b''
-        for value in array:
-            sub_type_tags, sub_encoded_value = OscMessage._encode_value(value)
-            type_tags += sub_type_tags
-            encoded_value += sub_encoded_value
-        type_tags += ']'
-        return type_tags, encoded_value
-
-    @staticmethod
-    def _encode_blob(value):
-        assert isinstance(value, (bytearray, bytes))
-        type_tags = 'b'
-        encoded_value = OscMessage._write_int(len(value))
-        encoded_value += value
-        if len(encoded_value) % 4:
-            difference = 4 - (len(encoded_value) % 4)
-            padding = b'\x00' * difference
-            encoded_value += padding
-        return type_tags, encoded_value
-
-    @staticmethod
-    def _encode_boolean(value):
-        assert value in (True, False)
-        if value:
-            type_tags = 'T'
+    def _compile(self):
+        type_tags = [',']
+        format_ = []
+        values = []
+        for value in self.contents:
+            OscMessage._compile_value(value, type_tags, format_, values)
+        header_format = ['>']
+        header_values = []
+        if isinstance(self.address, str):
+            OscMessage._compile_string(
+                self.address, header_format, header_values)
         else:
-            type_tags = 'F'
-        encoded_value = None
-        return type_tags, encoded_value
-
-    @staticmethod
-    def _encode_float(value):
-        assert isinstance(value, float)
-        type_tags = 'f'
-        encoded_value = OscMessage._write_float(value)
-        return type_tags, encoded_value
-
-    @staticmethod
-    def _encode_int(value):
-        assert isinstance(value, int)
-        type_tags = 'i'
-        encoded_value = OscMessage._write_int(value)
-        return type_tags, encoded_value
+            header_format.append('i')
+            header_values.append(self.address)
+        OscMessage._compile_string(
+            ''.join(type_tags), header_format, header_values)
+        struct_ = OscMessage._get_struct(''.join(header_format + format_))
+        return struct_, header_values + values
 
     @staticmethod
-    def _encode_none():
-        type_tags = 'N'
-        encoded_value = None
-        return type_tags, encoded_value
+    def _compile_string(value, format_, values):
+        encoded_value = value.encode('utf-8')
+        length = len(encoded_value)
+        format_.append('{}s'.format(length + 4 - (length % 4)))
+        values.append(encoded_value)
 
     @staticmethod
-    def _encode_string(value):
-        assert isinstance(value, str)
-        type_tags = 's'
-        encoded_value = value.encode('utf-8')
-        padding_length = 4 - (len(encoded_value) % 4)
-        padding = b'\x00' * padding_length
-        encoded_value += padding
-        return type_tags, encoded_value
+    def _compile_type_tags(type_tags, index=1):
+        # Runs of fixed-width values decode through a single struct.
+        plan = []
+        format_ = []
+        while index < len(type_tags):
+            type_tag = type_tags[index]
+            if type_tag in OscMessage._fixed_width_type_tags:
+                format_.append(type_tag)
+                index += 1
+                continue
+            if format_:
+                struct_ = OscMessage._get_struct('>' + ''.join(format_))
+                plan.append(('fixed', struct_))
+                format_ = []
+            if type_tag == ']':
+                return tuple(plan), index + 1
+            elif type_tag == '[':
+                subplan, index = OscMessage._compile_type_tags(
+                    type_tags, index + 1)
+                plan.append(('[', subplan))
+                continue
+            elif type_tag in OscMessage._constant_type_tags:
+                plan.append((
+                    'constant',
+                    OscMessage._constant_type_tags[type_tag],
+                    ))
+            elif type_tag in ('b', 's'):
+                plan.append((type_tag, None))
+            else:
+                message = 'Cannot decode type tag {!r}'.format(type_tag)
+                raise ValueError(message)
+            index += 1
+        if format_:
+            struct_ = OscMessage._get_struct('>' + ''.join(format_))
+            plan.append(('fixed', struct_))
+        return tuple(plan), index
 
     @staticmethod
-    def _encode_value(value):
-        if isinstance(value, bytearray):
-            type_tags, encoded_value = OscMessage._encode_blob(value)
+    def _compile_value(value, type_tags, format_, values):
+        if isinstance(value, (bytearray, memoryview)):
+            if isinstance(value, memoryview):
+                value = value.tobytes()
+            length = len(value)
+            type_tags.append('b')
+            format_.append('i{}s'.format(length + (-length % 4)))
+            values.append(length)
+            values.append(value)
         elif isinstance(value, str):
-            type_tags, encoded_value = OscMessage._encode_string(value)
+            type_tags.append('s')
+            OscMessage._compile_string(value, format_, values)
         elif isinstance(value, bool):
-            type_tags, encoded_value = OscMessage._encode_boolean(value)
+            if value:
+                type_tags.append('T')
+            else:
+                type_tags.append('F')
         elif isinstance(value, float):
-            type_tags, encoded_value = OscMessage._encode_float(value)
+            type_tags.append('f')
+            format_.append('f')
+            values.append(value)
         elif isinstance(value, int):
-            type_tags, encoded_value = OscMessage._encode_int(value)
+            type_tags.append('i')
+            format_.append('i')
+            values.append(value)
         elif value is None:
-            type_tags, encoded_value = OscMessage._encode_none()
+            type_tags.append('N')
         elif isinstance(value, collections.Sequence):
-            type_tags, encoded_value = OscMessage._encode_array(value)
+            type_tags.append('[')
+            for x in value:
+                OscMessage._compile_value(x, type_tags, format_, values)
+            type_tags.append(']')
         else:
             message = 'Cannot encode {!r}'.format(value)
             raise TypeError(message)
-        return type_tags, encoded_value
+
+    @staticmethod
+    def _decode_plan(plan, payload, payload_offset, contents):
+        for kind, argument in plan:
+            if kind == 'fixed':
+                contents.extend(argument.unpack_from(payload, payload_offset))
+                payload_offset += argument.size
+            elif kind == 's':
+                result, payload_offset = OscMessage._read_string(
+                    payload,
+                    payload_offset,
+                    )
+                contents.append(result)
+            elif kind == 'constant':
+                contents.append(argument)
+            elif kind == 'b':
+                length, payload_offset = OscMessage._read_int(
+                    payload,
+                    payload_offset,
+                    )
+                result = payload[payload_offset:payload_offset + length]
+                contents.append(result)
+                payload_offset += length + (-length % 4)
+            elif kind == '[':
+                array = []
+                payload_offset = OscMessage._decode_plan(
+                    argument,
+                    payload,
+                    payload_offset,
+                    array,
+                    )
+                contents.append(tuple(array))
+        return payload_offset
+
+    @staticmethod
+    def _get_decoding_plan(type_tags):
+        plan = OscMessage._decoding_plans.get(type_tags)
+        if plan is None:
+            if len(OscMessage._decoding_plans) >= OscMessage._cache_size:
+                OscMessage._decoding_plans.clear()
+            plan, _ = OscMessage._compile_type_tags(type_tags)
+            OscMessage._decoding_plans[type_tags] = plan
+        return plan
 
     def _get_format_specification(self):
         from abjad.tools import systemtools
@@ -273,51 +237,51 @@ class OscMessage(OscMixin):
             )
 
     @staticmethod
-    def _read_double(payload, payload_offset):
-        result = payload[payload_offset:payload_offset + 8]
-        result = struct.unpack('>d', result)
-        result = result[0]
-        payload_offset += 8
-        return result, payload_offset
-
-    @staticmethod
-    def _read_float(payload, payload_offset):
-        result = payload[payload_offset:payload_offset + 4]
-        result = struct.unpack('>f', result)
-        result = result[0]
-        payload_offset += 4
-        return result, payload_offset
+    def _get_struct(format_):
+        struct_ = OscMessage._structs.get(format_)
+        if struct_ is None:
+            if len(OscMessage._structs) >= OscMessage._cache_size:
+                OscMessage._structs.clear()
+            struct_ = struct.Struct(format_)
+            OscMessage._structs[format_] = struct_
+        return struct_
 
     @staticmethod
     def _read_int(payload, payload_offset):
-        result = payload[payload_offset:payload_offset + 4]
-        result = struct.unpack('>i', result)
-        result = result[0]
+        result = struct.unpack_from('>i', payload, payload_offset)[0]
         payload_offset += 4
         return result, payload_offset
 
     @staticmethod
     def _read_string(payload, payload_offset):
-        offset = 0
-        while payload[payload_offset + offset] != 0:
-            offset += 1
-        if (offset % 4) == 0:
-            offset += 4
+        if isinstance(payload, memoryview):
+            # Strings are null-padded to 4-byte boundaries, so only the last
+            # word has a null last byte. Index in place to find that word.
+            null = b'\x00'[0]
+            size = len(payload)
+            length = 0
+            while (
+                payload_offset + length + 3 < size and
+                payload[payload_offset + length + 3] != null
+                ):
+                length += 4
+            while True:
+                if size <= payload_offset + length:
+                    raise ValueError('Unterminated string')
+                elif payload[payload_offset + length] == null:
+                    break
+                length += 1
+            result = payload[payload_offset:payload_offset + length].tobytes()
         else:
-            offset += -offset % 4
-        result = payload[payload_offset:payload_offset + offset]
-        result = result.replace(b'\x00', b'')
+            length = payload.index(b'\x00', payload_offset) - payload_offset
+            result = payload[payload_offset:payload_offset + length]
         result = result.decode('utf-8')
         if sys.version_info[0] == 2:
             if all(ord(x) < 256 for x in result):
                 result = str(result)
-        payload_offset += offset
+        payload_offset += length + 4 - (length % 4)
         return result, payload_offset
 
-    @staticmethod
-    def _write_float(value):
-        return struct.pack('>f', value)
-
     @staticmethod
     def _write_int(value):
         return struct.pack('>i', value)
@@ -325,43 +289,41 @@ class OscMessage(OscMixin):
     ### PUBLIC METHODS ###
 
     def to_datagram(self):
-        # address can be a string or (in SuperCollider) an int
-        datagram = OscMessage._encode_value(self.address)[1]
-        if self.contents is None:
-            return datagram
-        encoded_type_tags = ','
-        encoded_contents = b''
-        for argument in self.contents:
-            type_tags, encoded_value = OscMessage._encode_value(argument)
-            encoded_type_tags += type_tags
-            if encoded_value is not None:
-                encoded_contents += encoded_value
-        encoded_type_tags = OscMessage._encode_string(encoded_type_tags)[1]
-        datagram += encoded_type_tags
-        datagram += encoded_contents
-        datagram = bytes(datagram)
-        return datagram
+        struct_, values = self._compile()
+        return struct_.pack(*values)
 
     @staticmethod
     def from_datagram(datagram):
-        datagram = bytearray(datagram)
-        contents = []
-        offset = 0
-        address, offset = OscMessage._read_string(datagram, offset)
+        """
+        Decodes `datagram` into an OSC message.
+
+        ::
+
+            >>> datagram = osctools.OscMessage('/b_setn', 1, 2, 3).to_datagram()
+            >>> osctools.OscMessage.from_datagram(datagram)
+            OscMessage('/b_setn', 1, 2, 3)
+
+        When `datagram` is a memoryview, it is parsed in place and blobs are
+        returned as views into it, rather than as copies:
+
+        ::
+
+            >>> message = osctools.OscMessage('/blob', bytearray(b'abc'))
+            >>> view = memoryview(bytearray(message.to_datagram()))
+            >>> blob = osctools.OscMessage.from_datagram(view).contents[0]
+            >>> blob.obj is view.obj
+            True
+
+        Returns OSC message.
+        """
+        if not isinstance(datagram, memoryview):
+            datagram = bytearray(datagram)
+        address, offset = OscMessage._read_string(datagram, 0)
         type_tags, offset = OscMessage._read_string(datagram, offset)
         assert type_tags[0] == ','
-        payload = datagram[offset:]
-        payload_offset = 0
-        type_tag_offset = 1
-        while type_tag_offset < len(type_tags):
-            result, type_tag_offset, payload_offset = \
-                OscMessage._decode_value(
-                    type_tags,
-                    type_tag_offset,
-                    payload,
-                    payload_offset
-                    )
-            contents.append(result)
+        contents = []
+        plan = OscMessage._get_decoding_plan(type_tags)
+        OscMessage._decode_plan(plan, datagram, offset, contents)
         osc_message = OscMessage(address, *contents)
         return osc_message
 
@@ -0,0 +1,123 @@
+# -*- encoding: utf-8 -*-
+import pytest
+from supriya.tools import osctools
+
+
+@pytest.mark.parametrize('pattern,address,expected', [
+    ('/n_go', '/n_go', True),
+    ('/n_go', '/n_end', False),
+    ('/n_?o', '/n_go', True),
+    ('/n_?o', '/n_goo', False),
+    ('/*', '/okay', True),
+    ('/*', '/ok/ay', False),
+    ('/*/set', '/c/set', True),
+    ('/*_set', '/n_set', True),
+    ('/n_[a-h]o', '/n_go', True),
+    ('/n_[a-f]o', '/n_go', False),
+    ('/n_[!a-f]o', '/n_go', True),
+    ('/n_[!a-h]o', '/n_go', False),
+    ('/n_{go,end}', '/n_go', True),
+    ('/n_{go,end}', '/n_end', True),
+    ('/n_{go,end}', '/n_off', False),
+    ('/b_{set,setn}', '/b_setn', True),
+    ('/a.b', '/a.b', True),
+    ('/a.b', '/axb', False),
+    ('/a+*', '/a+b', True),
+    ])
+def test_OscDispatcher_01(pattern, address, expected):
+    received = []
+    dispatcher = osctools.OscDispatcher()
+    callback = osctools.OscCallback(
+        address_pattern=pattern,
+        procedure=received.append,
+        )
+    dispatcher.register_callback(callback)
+    message = osctools.OscMessage(address, 1)
+    dispatcher(message)
+    assert bool(received) == expected
+    assert bool(dispatcher.compile_address_pattern(pattern).match(address)) \
+        == expected
+
+
+def test_OscDispatcher_02():
+    r'''Argument templates are indexed by their first value.
+    '''
+    received = []
+    dispatcher = osctools.OscDispatcher()
+    for node_id in range(1000, 1100):
+        callback = osctools.OscCallback(
+            address_pattern='/tr',
+            argument_template=(node_id, 0),
+            procedure=lambda x, node_id=node_id: received.append(node_id),
+            )
+        dispatcher.register_callback(callback)
+    catch_all = osctools.OscCallback(
+        address_pattern='/tr',
+        procedure=lambda x: received.append('all'),
+        )
+    dispatcher.register_callback(catch_all)
+    dispatcher(osctools.OscMessage('/tr', 1050, 0, 0.5))
+    assert received == [1050, 'all']
+    del(received[:])
+    dispatcher(osctools.OscMessage('/tr', 1050, 1, 0.5))
+    assert received == ['all']
+    del(received[:])
+    dispatcher(osctools.OscMessage('/tr', 2000, 0, 0.5))
+    assert received == ['all']
+
+
+def test_OscDispatcher_03():
+    r'''Callbacks run in registration order, whether matched exactly or by
+    wildcard.
+    '''
+    received = []
+    dispatcher = osctools.OscDispatcher()
+    patterns = ['/n_*', '/n_go', '/{n,g}_go', '/n_go']
+    for i, pattern in enumerate(patterns):
+        dispatcher.register_callback(osctools.OscCallback(
+            address_pattern=pattern,
+            procedure=lambda x, i=i: received.append(i),
+            ))
+    dispatcher(osctools.OscMessage('/n_go', 1000))
+    assert received == [0, 1, 2, 3]
+
+
+def test_OscDispatcher_04():
+    r'''Unregistering prunes the index.
+    '''
+    received = []
+    dispatcher = osctools.OscDispatcher()
+    callbacks = [
+        osctools.OscCallback(
+            address_pattern=pattern,
+            procedure=received.append,
+            )
+        for pattern in ('/a/*/c', '/a/b/?', '/a', '/a/b/c')
+        ]
+    for callback in callbacks:
+        dispatcher.register_callback(callback)
+    dispatcher(osctools.OscMessage('/a/b/c'))
+    assert len(received) == 3
+    for callback in callbacks:
+        dispatcher.unregister_callback(callback)
+    assert dispatcher._exact_map == {}
+    assert dispatcher._trie.is_empty()
+    dispatcher(osctools.OscMessage('/a/b/c'))
+    assert len(received) == 3
+
+
+def test_OscDispatcher_05():
+    received = []
+    dispatcher = osctools.OscDispatcher()
+    callback = osctools.OscCallback(
+        address_pattern='/n_{go,end}',
+        argument_template=(1000,),
+        is_one_shot=True,
+        procedure=received.append,
+        )
+    dispatcher.register_callback(callback)
+    dispatcher(osctools.OscMessage('/n_go', 1001))
+    dispatcher(osctools.OscMessage('/n_go', 1000))
+    dispatcher(osctools.OscMessage('/n_end', 1000))
+    assert received == [osctools.OscMessage('/n_go', 1000)]
+    assert dispatcher._trie.is_empty()
@@ -0,0 +1,149 @@
+# -*- encoding: utf-8 -*-
+import select
+import socket
+import threading
+import time
+import unittest
+from supriya.tools import osctools
+
+
+class Server(object):
+
+    def __init__(self):
+        self.messages = []
+        self.event = threading.Event()
+        self.event.set()
+        self._response_dispatcher = lambda message: None
+
+    def _osc_dispatcher(self, message):
+        self.event.wait()
+        self.messages.append(message)
+
+
+class CountingSocket(socket.socket):
+
+    receive_count = 0
+
+    def recvfrom(self, *args):
+        self.receive_count += 1
+        return socket.socket.recvfrom(self, *args)
+
+
+class Client(object):
+
+    def __init__(self):
+        self.server = Server()
+        self.socket_instance = CountingSocket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket_instance.bind(('127.0.0.1', 0))
+
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.address = self.client.socket_instance.getsockname()
+        self.listener = None
+
+    def tearDown(self):
+        self.client.server.event.set()
+        if self.listener is not None:
+            self.listener.quit(wait=True)
+        self.client.socket_instance.close()
+        self.sender.close()
+
+    def send(self, count, start=0):
+        for i in range(start, start + count):
+            message = osctools.OscMessage('/tr', 1000, i, 0.5)
+            self.sender.sendto(message.to_datagram(), self.address)
+
+    def wait_for(self, predicate, timeout=5):
+        start_time = time.time()
+        while not predicate():
+            assert time.time() - start_time < timeout
+            time.sleep(0.01)
+
+    def test_01(self):
+        self.listener = osctools.OscListener(
+            client=self.client,
+            dispatch_worker_count=1,
+            )
+        self.listener.start()
+        self.send(100)
+        self.wait_for(lambda: len(self.client.server.messages) == 100)
+        assert [x.contents[1] for x in self.client.server.messages] == \
+            list(range(100))
+        assert self.listener.received_count == 100
+        assert self.listener.dropped_count == 0
+        assert self.listener.queue_depth == 0
+
+    def test_02(self):
+        self.client.server.event.clear()
+        self.listener = osctools.OscListener(
+            client=self.client,
+            dispatch_worker_count=1,
+            overflow_policy='drop_newest',
+            queue_size=4,
+            )
+        self.listener.start()
+        self.send(1)
+        self.wait_for(lambda: self.listener.received_count == 1)
+        self.wait_for(lambda: self.listener.queue_depth == 0)
+        self.send(19, start=1)
+        self.wait_for(lambda: self.listener.received_count == 20)
+        assert self.listener.maximum_queue_depth == 4
+        self.client.server.event.set()
+        self.wait_for(lambda: self.listener.queue_depth == 0)
+        self.wait_for(lambda: len(self.client.server.messages) == 5)
+        assert self.listener.dropped_count == 15
+        assert [x.contents[1] for x in self.client.server.messages] == \
+            [0, 1, 2, 3, 4]
+
+    def test_03(self):
+        self.client.server.event.clear()
+        self.listener = osctools.OscListener(
+            client=self.client,
+            dispatch_worker_count=1,
+            overflow_policy='drop_oldest',
+            queue_size=4,
+            )
+        self.listener.start()
+        self.send(1)
+        self.wait_for(lambda: self.listener.received_count == 1)
+        self.wait_for(lambda: self.listener.queue_depth == 0)
+        self.send(19, start=1)
+        self.wait_for(lambda: self.listener.received_count == 20)
+        self.client.server.event.set()
+        self.wait_for(lambda: len(self.client.server.messages) == 5)
+        assert self.listener.dropped_count == 15
+        assert [x.contents[1] for x in self.client.server.messages] == \
+            [0, 16, 17, 18, 19]
+
+    def test_04(self):
+        with self.assertRaises(ValueError):
+            osctools.OscListener(
+                client=self.client,
+                dispatch_worker_count=1,
+                queue_size=4,
+                ring_size=4,
+                zero_copy=True,
+                )
+
+    def test_05(self):
+        r'''Draining only receives pending datagrams, never waiting on the
+        socket's timeout.
+        '''
+        self.client.socket_instance.settimeout(60)
+        listener = osctools.OscListener(
+            client=self.client,
+            dispatch_worker_count=1,
+            )
+        listener.running = True
+        listener._drain()
+        assert self.client.socket_instance.receive_count == 0
+        self.send(3)
+        self.wait_for(lambda: select.select(
+            [self.client.socket_instance], [], [], 0)[0])
+        listener._drain()
+        assert listener.received_count == 3
+        assert listener.queue_depth == 3
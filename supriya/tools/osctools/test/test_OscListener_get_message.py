@@ -0,0 +1,72 @@
+# -*- encoding: utf-8 -*-
+import socket
+import unittest
+from supriya.tools import osctools
+
+
+class Client(object):
+
+    def __init__(self):
+        self.socket_instance = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket_instance.bind(('127.0.0.1', 0))
+        self.socket_instance.settimeout(1)
+
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.address = self.client.socket_instance.getsockname()
+
+    def tearDown(self):
+        self.client.socket_instance.close()
+        self.sender.close()
+
+    def send(self, message):
+        self.sender.sendto(message.to_datagram(), self.address)
+
+    def test_01(self):
+        listener = osctools.OscListener(client=self.client)
+        message = osctools.OscMessage('/b_setn', 1, 0, 2, 0.5, 0.25)
+        self.send(message)
+        assert listener.get_message() == message
+
+    def test_02(self):
+        listener = osctools.OscListener(
+            client=self.client,
+            ring_size=2,
+            zero_copy=True,
+            )
+        message = osctools.OscMessage('/blob', bytearray(b'abcde'), 1, 'foo')
+        self.send(message)
+        received = listener.get_message()
+        assert received.address == '/blob'
+        assert received.contents[1:] == (1, 'foo')
+        blob = received.contents[0]
+        assert isinstance(blob, memoryview)
+        assert blob.obj is listener._buffers[0]
+        assert blob.tobytes() == b'abcde'
+
+    def test_03(self):
+        r'''The ring of buffers is reused cyclically.
+        '''
+        listener = osctools.OscListener(
+            client=self.client,
+            ring_size=2,
+            zero_copy=True,
+            )
+        blobs = []
+        for i in range(3):
+            self.send(osctools.OscMessage('/blob', bytearray([i])))
+            blobs.append(listener.get_message().contents[0])
+        assert blobs[0].obj is listener._buffers[0]
+        assert blobs[1].obj is listener._buffers[1]
+        assert blobs[2].obj is listener._buffers[0]
+        assert blobs[1].tobytes() == b'\x01'
+        assert blobs[2].tobytes() == b'\x02'
+
+    def test_04(self):
+        listener = osctools.OscListener(client=self.client, zero_copy=True)
+        self.client.socket_instance.settimeout(0.01)
+        assert listener.get_message() is None
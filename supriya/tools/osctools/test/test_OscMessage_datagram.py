@@ -0,0 +1,108 @@
+# -*- encoding: utf-8 -*-
+import pytest
+from supriya.tools import osctools
+
+
+osc_messages_and_datagrams = [
+    (
+        osctools.OscMessage('/g_new', 0, 0),
+        b'/g_new\x00\x00,ii\x00\x00\x00\x00\x00\x00\x00\x00\x00',
+        ),
+    (
+        osctools.OscMessage(
+            '/n_set', 1000, 'frequency', 443.5, 'amplitude', 0.25),
+        b'/n_set\x00\x00,isfsf\x00\x00\x00\x00\x03\xe8frequency\x00\x00\x00'
+        b'C\xdd\xc0\x00amplitude\x00\x00\x00>\x80\x00\x00',
+        ),
+    (
+        osctools.OscMessage('/x', True, False, None, 1),
+        b'/x\x00\x00,TFNi\x00\x00\x00\x00\x00\x00\x01',
+        ),
+    (
+        osctools.OscMessage('/b_setn', 1, 0, 3, [1.0, 2.0, [3, 'abcd']]),
+        b'/b_setn\x00,iii[ff[is]]\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00'
+        b'\x00\x00\x00\x00\x00\x03?\x80\x00\x00@\x00\x00\x00\x00\x00\x00\x03'
+        b'abcd\x00\x00\x00\x00',
+        ),
+    (
+        osctools.OscMessage('/d_recv', bytearray(b'abcde'), 0),
+        b'/d_recv\x00,bi\x00\x00\x00\x00\x05abcde\x00\x00\x00\x00\x00\x00\x00',
+        ),
+    (
+        osctools.OscMessage('/empty'),
+        b'/empty\x00\x00,\x00\x00\x00',
+        ),
+    (
+        osctools.OscMessage('/s', 'abc', 'abcd', ''),
+        b'/s\x00\x00,sss\x00\x00\x00\x00abc\x00abcd\x00\x00\x00\x00\x00\x00'
+        b'\x00\x00',
+        ),
+    ]
+
+
+@pytest.mark.parametrize('pair', osc_messages_and_datagrams)
+def test_OscMessage_datagram_01(pair):
+    osc_message, datagram = pair
+    assert osc_message.to_datagram() == datagram
+    assert osctools.OscMessage.from_datagram(datagram) == osc_message
+    view = memoryview(bytearray(datagram))
+    assert osctools.OscMessage.from_datagram(view) == osc_message
+
+
+def test_OscMessage_datagram_02():
+    r'''Integer addresses encode as ints.
+    '''
+    osc_message = osctools.OscMessage(23, 1, 2.5, 'foo')
+    datagram = osc_message.to_datagram()
+    assert datagram == (
+        b'\x00\x00\x00\x17,ifs\x00\x00\x00\x00\x00\x00\x00\x01@ \x00\x00'
+        b'foo\x00'
+        )
+
+
+def test_OscMessage_datagram_03():
+    r'''Long homogeneous runs round-trip through a single cached struct.
+    '''
+    contents = [float(x) for x in range(512)]
+    osc_message = osctools.OscMessage('/b_setn', 1, 0, 512, *contents)
+    datagram = osc_message.to_datagram()
+    assert osctools.OscMessage.from_datagram(datagram) == osc_message
+    type_tags = ',iii' + 'f' * 512
+    plan = osctools.OscMessage._get_decoding_plan(type_tags)
+    assert len(plan) == 1
+    assert plan[0][1].size == 4 * 515
+
+
+def test_OscMessage_datagram_04():
+    inner_bundle = osctools.OscBundle(
+        timestamp=10.5,
+        contents=[
+            osctools.OscMessage(
+                '/n_set', 1000, 'frequency', 443.5, 'amplitude', 0.25),
+            ],
+        )
+    outer_bundle = osctools.OscBundle(
+        contents=[osctools.OscMessage('/g_new', 0, 0), inner_bundle],
+        )
+    datagram = outer_bundle.to_datagram()
+    assert datagram == (
+        b'#bundle\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x14/g_new'
+        b'\x00\x00,ii\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00H'
+        b'#bundle\x00\x83\xaa~\x8a\x00\x00\x00\x05\x00\x00\x004/n_set\x00\x00'
+        b',isfsf\x00\x00\x00\x00\x03\xe8frequency\x00\x00\x00C\xdd\xc0\x00'
+        b'amplitude\x00\x00\x00>\x80\x00\x00'
+        )
+    assert osctools.OscBundle.from_datagram(datagram) == outer_bundle
+
+
+def test_OscMessage_datagram_05():
+    r'''Strings in memoryviews must be null-terminated.
+    '''
+    for datagram in (b'/abc', b'/abcdefg', b'/abcdef'):
+        view = memoryview(bytearray(datagram))
+        with pytest.raises(ValueError):
+            osctools.OscMessage.from_datagram(view)
+    view = memoryview(bytearray(b'/abcdef\x00'))
+    assert osctools.OscMessage._read_string(view, 0) == ('/abcdef', 8)
+    view = memoryview(bytearray(b'/abc\x00\x00'))
+    assert osctools.OscMessage._read_string(view, 0) == ('/abc', 8)
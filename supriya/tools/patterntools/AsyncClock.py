@@ -0,0 +1,78 @@
+# -*- encoding: utf-8 -*-
+from __future__ import print_function
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+import time
+from supriya.tools.patterntools.Clock import Clock
+
+
+class AsyncClock(Clock):
+    """
+    A realtime scheduler running on an asyncio event loop.
+
+    Executes procedures as loop callbacks rather than on a scheduler thread.
+    Procedures may be scheduled from any thread.
+
+    ::
+
+        >>> import asyncio  # doctest: +SKIP
+        >>> from supriya.tools import patterntools
+        >>> loop = asyncio.get_event_loop()  # doctest: +SKIP
+        >>> clock = patterntools.AsyncClock(loop=loop)  # doctest: +SKIP
+        >>> manifest = []
+        >>> def procedure(execution_time, scheduled_time):
+        ...     manifest.append(scheduled_time)
+        ...     if len(manifest) < 3:
+        ...         return 0.01
+        ...
+        >>> now = clock.schedule(procedure, 0.01)  # doctest: +SKIP
+        >>> loop.run_until_complete(asyncio.sleep(0.1))  # doctest: +SKIP
+        >>> [round(_ - now, 6) for _ in manifest]  # doctest: +SKIP
+        [0.01, 0.02, 0.03]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_handle',
+        '_loop',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, loop=None):
+        Clock.__init__(self)
+        self._handle = None
+        self._loop = loop
+
+    ### PRIVATE METHODS ###
+
+    def _arm(self):
+        with self._condition:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+            if self._heap:
+                delay = max(0., self._heap[0][0] - time.time())
+                self._handle = self.loop.call_later(delay, self._run)
+
+    def _run(self):
+        with self._condition:
+            self._handle = None
+            self._execute(time.time())
+            self._arm()
+
+    def _wake(self):
+        self.loop.call_soon_threadsafe(self._arm)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def loop(self):
+        assert asyncio is not None, 'asyncio is unavailable.'
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        return self._loop
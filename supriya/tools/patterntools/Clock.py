@@ -1,81 +1,130 @@
 # -*- encoding: utf-8 -*-
 from __future__ import print_function
-try:
-    from queue import PriorityQueue
-except ImportError:
-    from Queue import PriorityQueue
+import heapq
+import itertools
 import time
 import threading
+import traceback
 from supriya.tools.systemtools.SupriyaObject import SupriyaObject
 
 
 class Clock(SupriyaObject):
+    """
+    A realtime scheduler.
+
+    A single scheduler thread sleeps until the earliest scheduled time, then
+    executes every procedure due as one batch. The thread exits when nothing
+    remains scheduled and restarts on demand.
+
+    ::
+
+        >>> from supriya.tools import patterntools
+        >>> clock = patterntools.Clock()
+        >>> sorted(clock.statistics.items())
+        [('event_count', 0), ('late_count', 0), ('maximum_lateness', 0.0), ('mean_lateness', 0.0)]
+
+    """
 
     ### CLASS VARIABLES ###
 
     _default_clock = None
 
+    _lateness_threshold = 0.001
+
     __slots__ = (
-        '_lock',
-        '_queue',
-        '_timer',
+        '_condition',
+        '_counter',
+        '_event_count',
+        '_heap',
+        '_late_count',
+        '_maximum_lateness',
         '_registry',
+        '_thread',
+        '_total_lateness',
         )
 
     ### INITIALIZER ###
 
     def __init__(self):
-        self._lock = threading.RLock()
-        self._queue = PriorityQueue()
-        self._timer = None
+        self._condition = threading.Condition(threading.RLock())
+        self._counter = itertools.count()
+        self._heap = []
         self._registry = {}
+        self._thread = None
+        self.reset_statistics()
 
     ### PRIVATE METHODS ###
 
-    def _execute(self, execution_time):
-        with self._lock:
-            while not self._queue.empty():
-                pair = self._queue.get()
-                if execution_time < pair[0]:
-                    self._queue.put(pair)
+    def _compact(self):
+        # Cancellation is lazy, so drop stale heap entries once they dominate.
+        registry = self._registry
+        self._heap = [
+            entry for entry in self._heap
+            if entry[2] in registry and registry[entry[2]][1] == entry[1]
+            ]
+        heapq.heapify(self._heap)
+
+    def _execute(self, now):
+        heap, registry = self._heap, self._registry
+        while heap and heap[0][0] <= now:
+            scheduled_time, index, registry_key = heapq.heappop(heap)
+            entry = registry.get(registry_key)
+            if entry is None or entry[1] != index:
+                continue
+            procedure = entry[0]
+            del(registry[registry_key])
+            self._track_lateness(time.time() - scheduled_time)
+            try:
+                delta = procedure(scheduled_time, scheduled_time)
+            except Exception:
+                traceback.print_exc()
+                continue
+            if delta is not None:
+                self._push(procedure, scheduled_time + delta, registry_key)
+
+    def _push(self, procedure, scheduled_time, registry_key):
+        index = next(self._counter)
+        self._registry[registry_key] = (procedure, index)
+        heapq.heappush(self._heap, (scheduled_time, index, registry_key))
+        if self._heap[0][1] == index:
+            self._wake()
+
+    def _run(self):
+        with self._condition:
+            while self._thread is threading.current_thread():
+                if not self._heap:
+                    self._thread = None
                     break
-                scheduled_time, registry_key = pair
-                if registry_key not in self._registry:
+                delay = self._heap[0][0] - time.time()
+                if 0 < delay:
+                    self._condition.wait(delay)
                     continue
-                procedure = self._registry[registry_key]
-                delta = procedure(execution_time, scheduled_time)
-                if delta is not None:
-                    rescheduled_time = scheduled_time + delta
-                    self.schedule(
-                        procedure,
-                        rescheduled_time,
-                        absolute=True,
-                        registry_key=registry_key,
-                        )
-            if not self._queue.empty():
-                self._new_timer()
-
-    def _new_timer(self):
-        if self._timer is not None:
-            self._timer.cancel()
-        pair = self._queue.get()
-        self._queue.put(pair)
-        scheduled_time, _ = pair
-        now = time.time()
-        delta = scheduled_time - now
-        self._timer = threading.Timer(
-            delta,
-            self._execute,
-            (scheduled_time,),
-            )
-        self._timer.start()
+                self._execute(time.time())
+
+    def _track_lateness(self, lateness):
+        self._event_count += 1
+        self._total_lateness += lateness
+        if self._lateness_threshold < lateness:
+            self._late_count += 1
+        if self._maximum_lateness < lateness:
+            self._maximum_lateness = lateness
+
+    def _wake(self):
+        if self._thread is not None:
+            self._condition.notify()
+        elif self._heap:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
 
     ### PUBLIC METHODS ###
 
     def cancel(self, registry_key):
-        with self._lock:
+        with self._condition:
             if registry_key in self._registry:
                 self._registry.pop(registry_key)
+                if 2 * len(self._registry) + 64 < len(self._heap):
+                    self._compact()
 
     @classmethod
     def get_default_clock(cls):
@@ -84,12 +133,17 @@ class Clock(SupriyaObject):
         return cls._default_clock
 
     def reset(self):
-        with self._lock:
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
+        with self._condition:
             self._registry.clear()
-            self._queue = PriorityQueue()
+            del(self._heap[:])
+            self._wake()
+
+    def reset_statistics(self):
+        with self._condition:
+            self._event_count = 0
+            self._late_count = 0
+            self._maximum_lateness = 0.
+            self._total_lateness = 0.
 
     def schedule(
         self,
@@ -102,7 +156,7 @@ class Clock(SupriyaObject):
         now = time.time()
         if not absolute:
             scheduled_time += now
-        with self._lock:
+        with self._condition:
             if scheduled_time <= now:
                 delta = procedure(now, scheduled_time)
                 if delta is not None:
@@ -114,7 +168,28 @@ class Clock(SupriyaObject):
                         registry_key=registry_key,
                         )
             else:
-                self._registry[registry_key] = procedure
-                self._queue.put((scheduled_time, registry_key))
-                self._new_timer()
+                self._push(procedure, scheduled_time, registry_key)
         return now
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def statistics(self):
+        """
+        Gets lateness statistics of executed procedures, in seconds.
+
+        Procedures executing more than a millisecond after their scheduled
+        time count as late.
+
+        Returns dictionary.
+        """
+        with self._condition:
+            mean_lateness = 0.
+            if self._event_count:
+                mean_lateness = self._total_lateness / self._event_count
+            return {
+                'event_count': self._event_count,
+                'late_count': self._late_count,
+                'maximum_lateness': self._maximum_lateness,
+                'mean_lateness': mean_lateness,
+                }
@@ -87,7 +87,7 @@ class Event(SupriyaValueObject):
             for i, dictionary in enumerate(expanded_settings):
                 expanded_settings[i] = {
                     key: value for key, value in dictionary.items()
-                    if key in synthdef.parameter_names
+                    if key in synthdef._parameter_name_set
                     }
         return expanded_settings
 
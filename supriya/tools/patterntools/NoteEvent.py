@@ -179,7 +179,7 @@ class NoteEvent(Event):
                     target_node = 1
                 synth_kwargs = {
                     key: value for key, value in dictionary.items()
-                    if key in synthdef.parameter_names
+                    if key in synthdef._parameter_name_set
                     }
                 request = requesttools.SynthNewRequest(
                     add_action=add_action,
@@ -195,7 +195,7 @@ class NoteEvent(Event):
             for node_id, dictionary in zip(node_ids, dictionaries):
                 synth_kwargs = {
                     key: value for key, value in dictionary.items()
-                    if key in synthdef.parameter_names
+                    if key in synthdef._parameter_name_set
                     }
                 request = requesttools.NodeSetRequest(
                     node_id=node_id,
@@ -1,7 +1,6 @@
 # -*- encoding: utf-8 -*-
 import abc
 import collections
-import inspect
 import itertools
 from supriya.tools.systemtools.SupriyaValueObject import SupriyaValueObject
 
@@ -15,10 +14,6 @@ class Pattern(SupriyaValueObject):
 
     __slots__ = ()
 
-    _filename = __file__
-
-    _rngs = {}
-
     ### INITIALIZER ###
 
     @abc.abstractmethod
@@ -93,39 +88,11 @@ class Pattern(SupriyaValueObject):
         return patterntools.Pbinop(self, '-', expr)
 
     def __iter__(self):
-        yield_count = 0
-        should_stop = False
-        state = self._setup_state()
-        iterator = self._iterate(state)
-        try:
-            expr = next(iterator)
-            expr = self._coerce_iterator_output(expr, state)
-        except StopIteration:
-            return
-        exprs = self._handle_first(expr, state)
-        while len(exprs) > 1:
-            expr = exprs.pop(0)
-            should_stop = yield expr
-            yield_count += 1
-            if should_stop:
-                iterator.send(True)
-                exprs[:] = [exprs[0]]
-                break
-        if not should_stop:
-            try:
-                for expr in iterator:
-                    expr = self._coerce_iterator_output(expr, state)
-                    exprs.append(expr)
-                    expr = exprs.pop(0)
-                    should_stop = yield expr
-                    if should_stop:
-                        iterator.send(True)
-                        break
-            except StopIteration:
-                pass
-        exprs.extend(self._handle_last(exprs.pop(), state, yield_count))
-        for expr in exprs:
-            yield expr
+        from supriya.tools import patterntools
+        # Random patterns in one iteration share this stream, passed down to
+        # child patterns through their state.
+        rng = iter(patterntools.RandomNumberGenerator())
+        return self._iterate_with_rng(rng)
 
     ### PRIVATE METHODS ###
 
@@ -158,33 +125,6 @@ class Pattern(SupriyaValueObject):
             return len(value)
         return 1
 
-    @classmethod
-    def _get_rng(cls, seed=None):
-        from supriya.tools import patterntools
-        identifier = None
-        try:
-            stack = inspect.stack()
-            for frame_info in reversed(stack):
-                if frame_info.filename != cls._filename:
-                    continue
-                elif frame_info.function != '__iter__':
-                    continue
-                identifier = id(frame_info.frame)
-                break
-        finally:
-            del(frame_info)
-            del(stack)
-        if identifier in cls._rngs:
-            rng = cls._rngs[identifier]
-        elif identifier is None:
-            rng = iter(patterntools.RandomNumberGenerator(seed or 1))
-        else:
-            rng = cls._rngs.setdefault(
-                identifier,
-                iter(patterntools.RandomNumberGenerator(seed or 1))
-                )
-        return rng, identifier
-
     def _handle_first(self, expr, state=None):
         return [expr]
 
@@ -195,6 +135,41 @@ class Pattern(SupriyaValueObject):
     def _iterate(self, state=None):
         raise NotImplementedError
 
+    def _iterate_with_rng(self, rng):
+        yield_count = 0
+        should_stop = False
+        state = self._setup_state(rng)
+        iterator = self._iterate(state)
+        try:
+            expr = next(iterator)
+            expr = self._coerce_iterator_output(expr, state)
+        except StopIteration:
+            return
+        exprs = self._handle_first(expr, state)
+        while len(exprs) > 1:
+            expr = exprs.pop(0)
+            should_stop = yield expr
+            yield_count += 1
+            if should_stop:
+                iterator.send(True)
+                exprs[:] = [exprs[0]]
+                break
+        if not should_stop:
+            try:
+                for expr in iterator:
+                    expr = self._coerce_iterator_output(expr, state)
+                    exprs.append(expr)
+                    expr = exprs.pop(0)
+                    should_stop = yield expr
+                    if should_stop:
+                        iterator.send(True)
+                        break
+            except StopIteration:
+                pass
+        exprs.extend(self._handle_last(exprs.pop(), state, yield_count))
+        for expr in exprs:
+            yield expr
+
     @classmethod
     def _loop(cls, repetitions=None):
         if repetitions is None:
@@ -225,8 +200,8 @@ class Pattern(SupriyaValueObject):
             result.append(cls._process_recursive(one, two, procedure))
         return result
 
-    def _setup_state(self):
-        return None
+    def _setup_state(self, rng=None):
+        return {'rng': rng}
 
     ### PUBLIC PROPERTIES ###
 
@@ -88,13 +88,13 @@ class Pbind(EventPattern):
 
     ### PRIVATE METHODS ###
 
-    def _coerce_pattern_pairs(self, patterns):
+    def _coerce_pattern_pairs(self, patterns, rng):
         from supriya.tools import patterntools
         patterns = dict(patterns)
         for name, pattern in patterns.items():
             if not isinstance(pattern, patterntools.Pattern):
                 pattern = patterntools.Pseq([pattern], None)
-            patterns[name] = iter(pattern)
+            patterns[name] = pattern._iterate_with_rng(rng)
         return patterns
 
     def _get_format_specification(self):
@@ -110,7 +110,7 @@ class Pbind(EventPattern):
             )
 
     def _iterate(self, state=None):
-        patterns = self._coerce_pattern_pairs(self._patterns)
+        patterns = self._coerce_pattern_pairs(self._patterns, state['rng'])
         while True:
             event = {}
             if self.synthdef:
@@ -31,13 +31,13 @@ class Pbindf(EventPattern):
 
     ### PRIVATE METHODS ###
 
-    def _coerce_pattern_pairs(self, patterns):
+    def _coerce_pattern_pairs(self, patterns, rng):
         from supriya.tools import patterntools
         patterns = dict(patterns)
         for name, pattern in patterns.items():
             if not isinstance(pattern, patterntools.Pattern):
                 pattern = patterntools.Pseq([pattern], None)
-            patterns[name] = iter(pattern)
+            patterns[name] = pattern._iterate_with_rng(rng)
         return patterns
 
     def _get_format_specification(self):
@@ -53,8 +53,8 @@ class Pbindf(EventPattern):
             )
 
     def _iterate(self, state=None):
-        event_pattern = iter(self._event_pattern)
-        patterns = self._coerce_pattern_pairs(self._patterns)
+        event_pattern = self._event_pattern._iterate_with_rng(state['rng'])
+        patterns = self._coerce_pattern_pairs(self._patterns, state['rng'])
         while True:
             try:
                 event = next(event_pattern)
@@ -27,11 +27,11 @@ class Pbinop(Pattern):
         expr_one = self.expr_one
         if not isinstance(expr_one, Pattern):
             expr_one = patterntools.Pseq([expr_one], None)
-        expr_one = iter(expr_one)
+        expr_one = expr_one._iterate_with_rng(state['rng'])
         expr_two = self.expr_two
         if not isinstance(expr_two, Pattern):
             expr_two = patterntools.Pseq([expr_two], None)
-        expr_two = iter(expr_two)
+        expr_two = expr_two._iterate_with_rng(state['rng'])
         operator = self._string_to_operator()
         for one, two in zip(expr_one, expr_two):
             yield self._process_recursive(one, two, operator)
@@ -40,49 +40,6 @@ class Pbus(EventPattern):
         assert 0 <= release_time
         self._release_time = release_time
 
-    ### SPECIAL METHODS ###
-
-    def __iter__(self):
-        yield_count = 0
-        should_stop = False
-        state = self._setup_state()
-        iterator = self._iterate(state)
-        try:
-            expr = next(iterator)
-            expr = self._coerce_iterator_output(expr, state)
-        except StopIteration:
-            return
-        exprs = self._handle_first(expr, state)
-        while len(exprs) > 1:
-            expr = exprs.pop(0)
-            print('    YIELDING (A):', type(expr).__name__, expr.get('uuid'))
-            should_stop = yield expr
-            yield_count += 1
-            if should_stop:
-                print('    SHOULD STOP (A)')
-                iterator.send(True)
-                exprs[:] = [exprs[0]]
-                break
-        if not should_stop:
-            try:
-                for expr in iterator:
-                    expr = self._coerce_iterator_output(expr, state)
-                    exprs.append(expr)
-                    expr = exprs.pop(0)
-                    print('    YIELDING (B):', type(expr).__name__, expr.get('uuid'))
-                    should_stop = yield expr
-                    if should_stop:
-                        print('    SHOULD STOP (B)')
-                        iterator.send(True)
-                        break
-            except StopIteration:
-                pass
-        assert len(exprs) == 1
-        exprs.extend(self._handle_last(exprs.pop(), state, yield_count))
-        for expr in exprs:
-            print('    YIELDING (C):', type(expr).__name__, expr.get('uuid'))
-            yield expr
-
     ### PRIVATE METHODS ###
 
     def _coerce_iterator_output(self, expr, state):
@@ -151,10 +108,52 @@ class Pbus(EventPattern):
         return events
 
     def _iterate(self, state=None):
-        return iter(self.pattern)
+        return self.pattern._iterate_with_rng(state['rng'])
+
+    def _iterate_with_rng(self, rng):
+        yield_count = 0
+        should_stop = False
+        state = self._setup_state(rng)
+        iterator = self._iterate(state)
+        try:
+            expr = next(iterator)
+            expr = self._coerce_iterator_output(expr, state)
+        except StopIteration:
+            return
+        exprs = self._handle_first(expr, state)
+        while len(exprs) > 1:
+            expr = exprs.pop(0)
+            print('    YIELDING (A):', type(expr).__name__, expr.get('uuid'))
+            should_stop = yield expr
+            yield_count += 1
+            if should_stop:
+                print('    SHOULD STOP (A)')
+                iterator.send(True)
+                exprs[:] = [exprs[0]]
+                break
+        if not should_stop:
+            try:
+                for expr in iterator:
+                    expr = self._coerce_iterator_output(expr, state)
+                    exprs.append(expr)
+                    expr = exprs.pop(0)
+                    print('    YIELDING (B):', type(expr).__name__, expr.get('uuid'))
+                    should_stop = yield expr
+                    if should_stop:
+                        print('    SHOULD STOP (B)')
+                        iterator.send(True)
+                        break
+            except StopIteration:
+                pass
+        assert len(exprs) == 1
+        exprs.extend(self._handle_last(exprs.pop(), state, yield_count))
+        for expr in exprs:
+            print('    YIELDING (C):', type(expr).__name__, expr.get('uuid'))
+            yield expr
 
-    def _setup_state(self):
+    def _setup_state(self, rng=None):
         return {
+            'rng': rng,
             'bus_uuid': uuid.uuid4(),
             'link_uuid': uuid.uuid4(),
             'group_uuid': uuid.uuid4(),
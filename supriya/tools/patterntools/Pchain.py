@@ -25,7 +25,7 @@ class Pchain(EventPattern):
     ### PRIVATE METHODS ###
 
     def _iterate(self, state=None):
-        patterns = [iter(_) for _ in self._patterns]
+        patterns = [_._iterate_with_rng(state['rng']) for _ in self._patterns]
         while True:
             try:
                 event = next(patterns[0])
@@ -65,12 +65,12 @@ class Pgpar(Ppar):
         events.insert(0, expr)
         return events
 
-    def _setup_state(self):
+    def _setup_state(self, rng=None):
         queue = PriorityQueue()
         group_uuids = []
         iterators_to_group_uuids = {}
         for index, pattern in enumerate(self._patterns, 1):
-            iterator = iter(pattern)
+            iterator = pattern._iterate_with_rng(rng)
             group_uuid = uuid.uuid4()
             payload = ((0.0, index), iterator)
             queue.put(payload)
@@ -55,7 +55,7 @@ class Pmono(Pbind):
     ### PRIVATE METHODS ###
 
     def _iterate(self, state=None):
-        patterns = self._coerce_pattern_pairs(self._patterns)
+        patterns = self._coerce_pattern_pairs(self._patterns, state['rng'])
         synth_uuid = uuid.uuid4()
         generator = self._iterate_inner(patterns, synth_uuid)
         event_dicts = []
@@ -30,10 +30,11 @@ class Pn(Pattern):
     def _iterate(self, state=None):
         if self.key:
             for _ in self._loop(self._repetitions):
-                for i, x in enumerate(self._pattern):
+                iterator = self._pattern._iterate_with_rng(state['rng'])
+                for i, x in enumerate(iterator):
                     if i == 0:
                         x = new(x, **{self.key: True})
                     yield x
         else:
             for _ in self._loop(self._repetitions):
-                yield from self._pattern
+                yield from self._pattern._iterate_with_rng(state['rng'])
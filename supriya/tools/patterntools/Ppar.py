@@ -107,10 +107,10 @@ class Ppar(EventPattern):
         if not next_event:
             yield previous_event
 
-    def _setup_state(self):
+    def _setup_state(self, rng=None):
         queue = PriorityQueue()
         for index, pattern in enumerate(self._patterns, 1):
-            iterator = iter(pattern)
+            iterator = pattern._iterate_with_rng(rng)
             payload = ((0.0, index), iterator)
             queue.put(payload)
         state = (queue,)
@@ -57,7 +57,7 @@ class Pseq(Pattern):
         for _ in self._loop(self._repetitions):
             for x in self._sequence:
                 if isinstance(x, Pattern):
-                    yield from x
+                    yield from x._iterate_with_rng(state['rng'])
                 else:
                     yield x
 
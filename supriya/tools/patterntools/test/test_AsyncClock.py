@@ -0,0 +1,64 @@
+# -*- encoding: utf-8 -*-
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+import time
+import unittest
+from abjad.tools import systemtools
+from supriya.tools import patterntools
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is unavailable')
+class TestCase(systemtools.TestCase):
+
+    def setUp(self):
+        super(TestCase, self).setUp()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        super(TestCase, self).tearDown()
+
+    def test_01(self):
+        """
+        Interleaved (preempting) events.
+        """
+        manifest = []
+
+        def procedure_a(execution_time, scheduled_time):
+            manifest.append(scheduled_time)
+            if len(manifest) < 6:
+                return 0.25
+
+        def procedure_b(execution_time, scheduled_time):
+            manifest.append(scheduled_time)
+            if len(manifest) < 6:
+                return 0.1
+
+        clock = patterntools.AsyncClock(loop=self.loop)
+        now = clock.schedule(procedure_a)
+        clock.schedule(procedure_b, now + 0.1, absolute=True)
+        self.loop.run_until_complete(asyncio.sleep(0.6, loop=self.loop))
+        assert [round(_ - now, 6) for _ in manifest] == [
+            0.0, 0.1, 0.2, 0.25, 0.3, 0.4, 0.5]
+
+    def test_02(self):
+        """
+        Scheduling from another thread, and resetting.
+        """
+        manifest = []
+
+        def procedure(execution_time, scheduled_time):
+            manifest.append(scheduled_time)
+            return 0.1
+
+        clock = patterntools.AsyncClock(loop=self.loop)
+        now = time.time()
+        self.loop.run_until_complete(self.loop.run_in_executor(
+            None, clock.schedule, procedure, now + 0.1, True))
+        self.loop.run_until_complete(asyncio.sleep(0.25, loop=self.loop))
+        clock.reset()
+        self.loop.run_until_complete(asyncio.sleep(0.2, loop=self.loop))
+        assert [round(_ - now, 6) for _ in manifest] == [0.1, 0.2]
+        assert clock.statistics['event_count'] == 2
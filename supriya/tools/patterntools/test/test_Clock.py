@@ -1,4 +1,5 @@
 # -*- encoding: utf-8 -*-
+import threading
 import time
 import uuid
 from abjad.tools import systemtools
@@ -196,3 +197,54 @@ class TestCase(systemtools.TestCase):
         assert [(round(x - now, 6), round(y - now, 6)) for x, y in manifest] == [
             (0.0, 0.0), (0.001, 0.001), (0.002, 0.002), (0.003, 0.003)
             ]
+
+    def test_14(self):
+        """
+        Many procedures share one scheduler thread.
+        """
+        manifest = []
+        events = [self.Event(manifest, delta=0.05) for _ in range(50)]
+        clock = patterntools.Clock()
+        thread_count = threading.active_count()
+        now = time.time()
+        for i, event in enumerate(events):
+            clock.schedule(event, now + 0.1 + (i * 0.001), absolute=True)
+        assert threading.active_count() == thread_count + 1
+        time.sleep(0.5)
+        assert len(manifest) == 200
+        assert threading.active_count() == thread_count
+        statistics = clock.statistics
+        assert statistics['event_count'] == 200
+        assert 0. <= statistics['mean_lateness'] <= \
+            statistics['maximum_lateness']
+
+    def test_15(self):
+        """
+        Rescheduling by registry key replaces the pending schedule.
+        """
+        manifest = []
+        event = self.Event(manifest, delta=0.25)
+        clock = patterntools.Clock()
+        now = time.time()
+        clock.schedule(event, now + 0.1, absolute=True)
+        clock.schedule(event, now + 0.2, absolute=True)
+        time.sleep(0.3)
+        clock.cancel(event)
+        assert [round(_ - now, 6) for _ in manifest] == [0.2]
+
+    def test_16(self):
+        """
+        Canceled entries are compacted out of the queue.
+        """
+        manifest = []
+        clock = patterntools.Clock()
+        registry_keys = [uuid.uuid4() for _ in range(200)]
+        for registry_key in registry_keys:
+            clock.schedule(
+                self.Event(manifest), 10, registry_key=registry_key)
+        for registry_key in registry_keys[:-1]:
+            clock.cancel(registry_key)
+        assert len(clock._heap) < 100
+        clock.reset()
+        assert not clock._heap
+        assert manifest == []
@@ -0,0 +1,47 @@
+# -*- encoding: utf-8 -*-
+import itertools
+from abjad.tools import systemtools
+from supriya.tools import patterntools
+
+
+class TestCase(systemtools.TestCase):
+
+    def stepwise(self, seed, count):
+        values = []
+        for _ in range(count):
+            seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+            values.append(float(seed) / 0x7FFFFFFF)
+        return values
+
+    def test_iteration(self):
+        for seed in (1, 0, 23, -5, 2 ** 40):
+            generator = patterntools.RandomNumberGenerator(seed)
+            values = list(itertools.islice(generator, 200))
+            assert values == self.stepwise(seed, 200)
+            assert all(type(_) is float for _ in values)
+
+    def test_generate(self):
+        generator = patterntools.RandomNumberGenerator(23)
+        for count in (0, 1, 64, 65, 300):
+            assert generator.generate(count).tolist() == \
+                self.stepwise(23, count)
+
+    def test_shared_stream(self):
+        pattern = patterntools.Pbind(
+            one=patterntools.Pwhite(repetitions=4),
+            two=patterntools.Pwhite(repetitions=4),
+            )
+        values = [(_['one'], _['two']) for _ in pattern]
+        assert sorted(itertools.chain(*values)) == \
+            sorted(self.stepwise(1, 8))
+        assert values == [(_['one'], _['two']) for _ in pattern]
+
+    def test_independent_streams(self):
+        pattern = patterntools.Pseq([
+            patterntools.Pwhite(repetitions=2),
+            patterntools.Pwhite(repetitions=2),
+            ])
+        iterators = [iter(pattern), iter(pattern)]
+        values = [[next(_) for _ in iterators] for _ in range(4)]
+        assert [_[0] for _ in values] == self.stepwise(1, 4)
+        assert [_[1] for _ in values] == self.stepwise(1, 4)
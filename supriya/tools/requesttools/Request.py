@@ -66,10 +66,9 @@ class Request(SupriyaValueObject):
         start_time = time.time()
         timed_out = False
         with self.condition:
-            with server.response_dispatcher.lock:
-                callback = self.response_callback
-                server.register_response_callback(callback)
-                server.send_message(message)
+            callback = self.response_callback
+            server.register_response_callback(callback)
+            server.send_message(message)
             while self.response is None:
                 self.condition.wait(timeout)
                 current_time = time.time()
@@ -82,6 +81,50 @@ class Request(SupriyaValueObject):
             return None
         return self._response
 
+    def communicate_async(
+        self,
+        message=None,
+        server=None,
+        sync=True,
+        timeout=1.0,
+        ):
+        """
+        Communicates with `server`, an ``AsyncServer``, without blocking.
+
+        Returns future resolving to the response, or to none if `sync` is
+        false, the request expects no response, or `timeout` elapses.
+        """
+        import asyncio
+        from supriya.tools import requesttools
+        from supriya.tools import servertools
+        assert isinstance(server, servertools.AsyncServer)
+        assert server.is_running
+        message = message or self.to_osc_message()
+        future = asyncio.Future(loop=server.loop)
+        if not sync or self.response_specification is None:
+            server.send_message(message)
+            future.set_result(None)
+            return future
+        callback = requesttools.RequestCallback(
+            future=future,
+            is_one_shot=True,
+            request=self,
+            response_specification=self.response_specification,
+            )
+
+        def on_timeout():
+            if future.done():
+                return
+            server.unregister_response_callback(callback)
+            print('TIMED OUT:', repr(self))
+            future.set_result(None)
+
+        server.register_response_callback(callback)
+        server.send_message(message)
+        handle = server.loop.call_later(timeout, on_timeout)
+        future.add_done_callback(lambda _: handle.cancel())
+        return future
+
     @abc.abstractmethod
     def to_osc_message(self, with_textual_osc_command=False):
         raise NotImplementedError
@@ -7,6 +7,7 @@ class RequestCallback(SupriyaObject):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_future',
         '_is_one_shot',
         '_request',
         '_response_specification',
@@ -14,10 +15,12 @@ class RequestCallback(SupriyaObject):
 
     def __init__(
         self,
+        future=None,
         is_one_shot=False,
         request=None,
         response_specification=None,
         ):
+        self._future = future
         self._is_one_shot = bool(is_one_shot)
         self._request = request
         self._response_specification = response_specification
@@ -25,6 +28,10 @@ class RequestCallback(SupriyaObject):
     ### SPECIAL METHODS ###
 
     def __call__(self, response):
+        if self.future is not None:
+            if not self.future.done():
+                self.future.set_result(response)
+            return
         self.request.response = response
 
     ### PUBLIC METHODS ###
@@ -39,6 +46,10 @@ class RequestCallback(SupriyaObject):
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def future(self):
+        return self._future
+
     @property
     def is_one_shot(self):
         return self._is_one_shot
@@ -13,6 +13,8 @@ class BufferInfoResponse(Response):
         '_sample_rate',
         )
 
+    _discriminating_attribute = 'buffer_id'
+
     ### INITIALIZER ###
 
     def __init__(
@@ -12,6 +12,8 @@ class BufferSetContiguousResponse(Response, collections.Sequence):
         '_items',
         )
 
+    _discriminating_attribute = 'buffer_id'
+
     ### INITIALIZER ###
 
     def __init__(
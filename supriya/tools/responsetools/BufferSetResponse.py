@@ -12,6 +12,8 @@ class BufferSetResponse(Response, collections.Sequence):
         '_items',
         )
 
+    _discriminating_attribute = 'buffer_id'
+
     ### INITIALIZER ###
 
     def __init__(
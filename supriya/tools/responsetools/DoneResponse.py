@@ -10,6 +10,8 @@ class DoneResponse(Response):
         '_action',
         )
 
+    _discriminating_attribute = 'action'
+
     ### INITIALIZER ###
 
     def __init__(
@@ -11,6 +11,8 @@ class FailResponse(Response):
         '_failure_reason',
         )
 
+    _discriminating_attribute = 'failed_command'
+
     ### INITIALIZER ###
 
     def __init__(
@@ -17,6 +17,8 @@ class NodeInfoResponse(Response):
         '_tail_node_id',
         )
 
+    _discriminating_attribute = 'node_id'
+
     ### INITIALIZER ###
 
     def __init__(
@@ -11,6 +11,8 @@ class NodeSetContiguousResponse(Response):
         '_node_id',
         )
 
+    _discriminating_attribute = 'node_id'
+
     ### INITIALIZER ###
 
     def __init__(
@@ -12,6 +12,8 @@ class Response(SupriyaValueObject):
 
     _address = None
 
+    _discriminating_attribute = None
+
     ### INITIALIZER ###
 
     def __init__(
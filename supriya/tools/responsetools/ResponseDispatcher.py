@@ -19,6 +19,35 @@ class ResponseDispatcher(Dispatcher):
             response = (response,)
         return response
 
+    def _get_callback_keys(self, callback):
+        specification = getattr(callback, 'response_specification', None)
+        keys = []
+        for class_ in callback.prototype:
+            key = class_
+            attribute = getattr(class_, '_discriminating_attribute', None)
+            values = (specification or {}).get(class_) or {}
+            if attribute is not None and attribute in values:
+                try:
+                    key = (class_, values[attribute])
+                    hash(key)
+                except TypeError:
+                    key = class_
+            keys.append(key)
+        return tuple(keys)
+
+    def _get_input_keys(self, expr):
+        class_ = type(expr)
+        keys = [None, class_]
+        attribute = getattr(class_, '_discriminating_attribute', None)
+        if attribute is not None:
+            key = (class_, getattr(expr, attribute))
+            try:
+                hash(key)
+                keys.append(key)
+            except TypeError:
+                pass
+        return keys
+
     ### PUBLIC PROPERTIES ###
 
     @property
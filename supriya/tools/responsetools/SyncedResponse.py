@@ -10,6 +10,8 @@ class SyncedResponse(Response):
         '_sync_id',
         )
 
+    _discriminating_attribute = 'sync_id'
+
     ### INITIALIZER ###
 
     def __init__(
@@ -12,6 +12,8 @@ class TriggerResponse(Response):
         '_trigger_value',
         )
 
+    _discriminating_attribute = 'node_id'
+
     ### INITIALIZER ###
 
     def __init__(
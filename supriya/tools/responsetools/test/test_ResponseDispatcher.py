@@ -0,0 +1,68 @@
+# -*- encoding: utf-8 -*-
+import unittest
+from supriya.tools import osctools
+from supriya.tools import requesttools
+from supriya.tools import responsetools
+
+
+class Test(unittest.TestCase):
+
+    def test_01(self):
+        r'''Request callbacks are keyed by their discriminating attribute.
+        '''
+        dispatcher = responsetools.ResponseDispatcher()
+        requests = [requesttools.SyncRequest(sync_id=i) for i in range(100)]
+        for request in requests:
+            dispatcher.register_callback(request.response_callback)
+        assert len(dispatcher._callback_map) == 100
+        callbacks = dispatcher._collect_callbacks(
+            responsetools.SyncedResponse(sync_id=50))
+        assert [x.request for x in callbacks] == [requests[50]]
+        dispatcher(osctools.OscMessage('/synced', 50))
+        assert requests[50].response.sync_id == 50
+        assert all(x.response is None for x in requests if x is not requests[50])
+        assert len(dispatcher._callback_map) == 99
+
+    def test_02(self):
+        r'''Requests with several response types register under each one.
+        '''
+        dispatcher = responsetools.ResponseDispatcher()
+        request = requesttools.BufferGetRequest(buffer_id=23, indices=(0,))
+        dispatcher.register_callback(request.response_callback)
+        assert sorted(dispatcher._callback_map, key=repr) == sorted([
+            (responsetools.BufferSetResponse, 23),
+            (responsetools.FailResponse, '/b_get'),
+            ], key=repr)
+        dispatcher(osctools.OscMessage('/fail', '/b_get', 'no such buffer'))
+        assert isinstance(request.response, responsetools.FailResponse)
+        assert dispatcher._callback_map == {}
+
+    def test_03(self):
+        r'''Response callbacks without a specification receive every
+        response of their type.
+        '''
+        responses = []
+        dispatcher = responsetools.ResponseDispatcher()
+        callback = responsetools.ResponseCallback(
+            procedure=responses.append,
+            prototype=responsetools.SyncedResponse,
+            )
+        dispatcher.register_callback(callback)
+        request = requesttools.SyncRequest(sync_id=1)
+        dispatcher.register_callback(request.response_callback)
+        dispatcher(osctools.OscMessage('/synced', 1))
+        dispatcher(osctools.OscMessage('/synced', 2))
+        assert [x.sync_id for x in responses] == [1, 2]
+        assert request.response.sync_id == 1
+        dispatcher.unregister_callback(callback)
+        assert dispatcher._callback_map == {}
+
+    def test_04(self):
+        r'''Registration replaces the callback map rather than mutating it.
+        '''
+        dispatcher = responsetools.ResponseDispatcher()
+        callback_map = dispatcher._callback_map
+        request = requesttools.SyncRequest(sync_id=1)
+        dispatcher.register_callback(request.response_callback)
+        assert callback_map == {}
+        assert dispatcher._callback_map is not callback_map
@@ -0,0 +1,215 @@
+# -*- encoding: utf-8 -*-
+from __future__ import print_function
+try:
+    import asyncio
+    DatagramProtocol = asyncio.DatagramProtocol
+except ImportError:
+    asyncio = None
+    DatagramProtocol = object
+from supriya.tools.systemtools.SupriyaObject import SupriyaObject
+
+
+class AsyncServer(SupriyaObject, DatagramProtocol):
+    """
+    An asyncio-native scsynth server client.
+
+    Talks OSC to an already-running scsynth over a datagram endpoint on an
+    asyncio event loop. Requests sent via ``Request.communicate_async()``
+    return futures, resolved when a matching response arrives, so many
+    round trips can be in flight on one loop without blocking any threads.
+
+    ::
+
+        >>> import asyncio
+        >>> from supriya import requesttools
+        >>> from supriya import servertools
+        >>> server = servertools.Server().boot()
+        >>> loop = asyncio.get_event_loop()
+        >>> async_server = loop.run_until_complete(
+        ...     servertools.AsyncServer().connect())
+
+    ::
+
+        >>> requests = [
+        ...     requesttools.BufferQueryRequest(buffer_ids=[i])
+        ...     for i in range(4)
+        ...     ]
+        >>> responses = loop.run_until_complete(asyncio.gather(*[
+        ...     request.communicate_async(server=async_server)
+        ...     for request in requests
+        ...     ]))
+        >>> [response.buffer_id for response in responses]
+        [0, 1, 2, 3]
+
+    ::
+
+        >>> async_server.disconnect()
+        >>> server.quit()
+        <Server: offline>
+
+    Unlike ``Server``, it does not boot scsynth or mirror its node tree.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Main Classes'
+
+    __slots__ = (
+        '_ip_address',
+        '_loop',
+        '_osc_dispatcher',
+        '_port',
+        '_response_dispatcher',
+        '_sync_id',
+        '_transport',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        ip_address='127.0.0.1',
+        loop=None,
+        port=57751,
+        ):
+        from supriya.tools import osctools
+        from supriya.tools import responsetools
+        self._ip_address = ip_address
+        self._loop = loop
+        self._port = int(port)
+        self._osc_dispatcher = osctools.OscDispatcher()
+        self._response_dispatcher = responsetools.ResponseDispatcher()
+        self._sync_id = 0
+        self._transport = None
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        if not self.is_running:
+            return '<{}: offline>'.format(type(self).__name__)
+        return '<{}: udp://{}:{}>'.format(
+            type(self).__name__,
+            self.ip_address,
+            self.port,
+            )
+
+    ### PRIVATE METHODS ###
+
+    def _coerce_message(self, message):
+        from supriya.tools import osctools
+        if isinstance(message, str):
+            message = osctools.OscMessage(message)
+        elif isinstance(message, tuple):
+            assert len(message)
+            message = osctools.OscMessage(message[0], *message[1:])
+        assert isinstance(message, (osctools.OscMessage, osctools.OscBundle))
+        return message
+
+    ### PROTOCOL METHODS ###
+
+    def connection_lost(self, exception):
+        self._transport = None
+
+    def connection_made(self, transport):
+        self._transport = transport
+
+    def datagram_received(self, datagram, address):
+        from supriya.tools import osctools
+        message = osctools.OscMessage.from_datagram(datagram)
+        self._osc_dispatcher(message)
+        self._response_dispatcher(message)
+
+    def error_received(self, exception):
+        pass
+
+    ### PUBLIC METHODS ###
+
+    def connect(self):
+        """
+        Connects to scsynth.
+
+        Returns future resolving to the server.
+        """
+        assert asyncio is not None, 'asyncio is unavailable.'
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        future = asyncio.Future(loop=self.loop)
+
+        def on_connected(task):
+            if task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(self)
+
+        task = asyncio.ensure_future(
+            self.loop.create_datagram_endpoint(
+                lambda: self,
+                remote_addr=(self.ip_address, self.port),
+                ),
+            loop=self.loop,
+            )
+        task.add_done_callback(on_connected)
+        return future
+
+    def disconnect(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def register_osc_callback(self, osc_callback):
+        self._osc_dispatcher.register_callback(osc_callback)
+
+    def register_response_callback(self, response_callback):
+        self._response_dispatcher.register_callback(response_callback)
+
+    def send_message(self, message):
+        if not message or not self.is_running:
+            return
+        message = self._coerce_message(message)
+        self._transport.sendto(message.to_datagram())
+
+    def sync(self, sync_id=None, timeout=1.0):
+        """
+        Syncs with scsynth.
+
+        Returns future resolving to synced response.
+        """
+        from supriya.tools import requesttools
+        if sync_id is None:
+            sync_id = self.next_sync_id
+        request = requesttools.SyncRequest(sync_id=sync_id)
+        return request.communicate_async(server=self, timeout=timeout)
+
+    def unregister_osc_callback(self, osc_callback):
+        self._osc_dispatcher.unregister_callback(osc_callback)
+
+    def unregister_response_callback(self, response_callback):
+        self._response_dispatcher.unregister_callback(response_callback)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def ip_address(self):
+        return self._ip_address
+
+    @property
+    def is_running(self):
+        return self._transport is not None
+
+    @property
+    def loop(self):
+        return self._loop
+
+    @property
+    def next_sync_id(self):
+        sync_id = self._sync_id
+        self._sync_id += 1
+        return sync_id
+
+    @property
+    def port(self):
+        return self._port
+
+    @property
+    def response_dispatcher(self):
+        return self._response_dispatcher
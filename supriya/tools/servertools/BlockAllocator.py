@@ -1,6 +1,6 @@
 # -*- encoding: utf-8 -*-
+import collections
 import threading
-from abjad.tools.topleveltools import new
 from supriya.tools.systemtools.SupriyaObject import SupriyaObject
 
 
@@ -41,6 +41,41 @@ class BlockAllocator(SupriyaObject):
         >>> allocator.allocate(8)
         8
 
+    Free blocks are kept in two balanced trees: one keyed by offset, where
+    each node also records the largest free block beneath it, and one keyed
+    by size. The ``'first_fit'`` policy descends the first to the lowest
+    free block large enough, while the ``'best_fit'`` policy searches the
+    second for the smallest free block large enough, which fragments the
+    heap less under churn. Both take logarithmic time.
+
+    ::
+
+        >>> allocator = servertools.BlockAllocator(
+        ...     heap_maximum=16,
+        ...     policy='best_fit',
+        ...     )
+        >>> allocator.allocate_many([4, 2, 4])
+        [0, 4, 6]
+
+    ::
+
+        >>> allocator.free_many([0, 6])
+        >>> allocator.allocate(3)
+        0
+
+    ::
+
+        >>> for key, value in allocator.stats().items():
+        ...     print('{}: {}'.format(key, value))
+        ...
+        free_block_count: 2
+        free_size: 11
+        largest_free_block: 10
+        fragmentation: 0.09090909090909094
+        used_block_count: 2
+        used_size: 5
+        utilization: 0.3125
+
     """
 
     ### CLASS VARIABLES ###
@@ -48,11 +83,23 @@ class BlockAllocator(SupriyaObject):
     __documentation_section__ = 'Server Internals'
 
     __slots__ = (
-        '_free_heap',
+        '_free_size',
+        '_free_starts',
+        '_free_stops',
         '_heap_maximum',
         '_heap_minimum',
         '_lock',
-        '_used_heap',
+        '_offset_root',
+        '_policy',
+        '_size_root',
+        '_used_blocks',
+        '_used_root',
+        '_used_size',
+        )
+
+    _policies = (
+        'best_fit',
+        'first_fit',
         )
 
     ### INITIALIZER ###
@@ -61,122 +108,403 @@ class BlockAllocator(SupriyaObject):
         self,
         heap_maximum=None,
         heap_minimum=0,
+        policy='first_fit',
         ):
-        from supriya.tools import servertools
-        from supriya.tools import timetools
-        self._free_heap = timetools.TimespanCollection()
+        assert policy in self._policies
         self._heap_maximum = heap_maximum
         self._heap_minimum = heap_minimum
         self._lock = threading.Lock()
-        self._used_heap = timetools.TimespanCollection()
-        free_block = servertools.Block(
-            start_offset=heap_minimum,
-            stop_offset=heap_maximum,
-            used=False,
+        self._policy = policy
+        # Free blocks by start offset and by (size, start offset), maps from
+        # start to stop and stop to start for coalescing, and used blocks by
+        # start offset.
+        self._free_size = 0
+        self._free_starts = {}
+        self._free_stops = {}
+        self._offset_root = None
+        self._size_root = None
+        self._used_blocks = {}
+        self._used_root = None
+        self._used_size = 0
+        stop_offset = heap_maximum
+        if stop_offset is None:
+            stop_offset = float('inf')
+        self._insert_free_block(int(heap_minimum), stop_offset)
+
+    ### PRIVATE METHODS ###
+
+    def _allocate(self, desired_block_size):
+        desired_block_size = int(desired_block_size)
+        assert 0 < desired_block_size
+        start_offset = self._find_free_block(desired_block_size)
+        if start_offset is None:
+            return None
+        stop_offset = self._free_starts[start_offset]
+        split_offset = start_offset + desired_block_size
+        if split_offset < stop_offset:
+            self._resize_free_block(start_offset, split_offset, stop_offset)
+        else:
+            self._remove_free_block(start_offset)
+        self._insert_used_block(start_offset, split_offset)
+        return start_offset
+
+    @staticmethod
+    def _find_ceiling(node, key):
+        # Finds the node with the smallest key not less than `key`.
+        result = None
+        while node is not None:
+            if key <= node._key:
+                result = node
+                node = node._left_child
+            else:
+                node = node._right_child
+        return result
+
+    @staticmethod
+    def _find_floor(node, key):
+        # Finds the node with the largest key not greater than `key`.
+        result = None
+        while node is not None:
+            if node._key <= key:
+                result = node
+                node = node._right_child
+            else:
+                node = node._left_child
+        return result
+
+    def _find_free_block(self, desired_block_size):
+        if self._policy == 'best_fit':
+            node = self._find_ceiling(
+                self._size_root, (desired_block_size, -1))
+            if node is None:
+                return None
+            return node._key[1]
+        node = self._offset_root
+        if node is None or node._maximum_size < desired_block_size:
+            return None
+        while True:
+            left_child = node._left_child
+            if (
+                left_child is not None and
+                desired_block_size <= left_child._maximum_size
+                ):
+                node = left_child
+            elif desired_block_size <= node._size:
+                return node._key
+            else:
+                node = node._right_child
+
+    @staticmethod
+    def _find_path(node, key):
+        # Finds the nodes from `node` down to the node keyed `key`.
+        path = [node]
+        while node._key != key:
+            if key < node._key:
+                node = node._left_child
+            else:
+                node = node._right_child
+            path.append(node)
+        return path
+
+    def _free(self, block_id):
+        block_id = int(block_id)
+        start_offset = block_id
+        if start_offset not in self._used_blocks:
+            node = self._find_floor(self._used_root, block_id)
+            assert node is not None
+            assert block_id < self._used_blocks[node._key]
+            start_offset = node._key
+        stop_offset = self._used_blocks.pop(start_offset)
+        self._used_root = self._remove_node(self._used_root, start_offset)
+        self._used_size -= stop_offset - start_offset
+        # Coalesce with free neighbors, resizing one of them in place.
+        previous_start_offset = self._free_stops.get(start_offset)
+        if stop_offset in self._free_starts:
+            next_start_offset = stop_offset
+            stop_offset = self._free_starts[next_start_offset]
+            if previous_start_offset is None:
+                self._resize_free_block(
+                    next_start_offset, start_offset, stop_offset)
+                return
+            self._remove_free_block(next_start_offset)
+        if previous_start_offset is not None:
+            self._resize_free_block(
+                previous_start_offset, previous_start_offset, stop_offset)
+            return
+        self._insert_free_block(start_offset, stop_offset)
+
+    def _insert_free_block(self, start_offset, stop_offset):
+        from supriya.tools import servertools
+        size = stop_offset - start_offset
+        self._offset_root = self._insert_node(
+            self._offset_root,
+            servertools.BlockAllocatorNode(start_offset, size),
+            )
+        self._size_root = self._insert_node(
+            self._size_root,
+            servertools.BlockAllocatorNode((size, start_offset), size),
             )
-        self._free_heap.insert(free_block)
+        self._free_starts[start_offset] = stop_offset
+        self._free_stops[stop_offset] = start_offset
+        if size != float('inf'):
+            self._free_size += size
+
+    def _insert_node(self, root, new_node):
+        if root is None:
+            return new_node
+        key = new_node._key
+        path = []
+        node = root
+        while node is not None:
+            path.append(node)
+            if key < node._key:
+                node = node._left_child
+            else:
+                node = node._right_child
+        if key < path[-1]._key:
+            path[-1]._left_child = new_node
+        else:
+            path[-1]._right_child = new_node
+        return self._retrace(root, path)
+
+    def _insert_used_block(self, start_offset, stop_offset):
+        from supriya.tools import servertools
+        size = stop_offset - start_offset
+        self._used_blocks[start_offset] = stop_offset
+        self._used_root = self._insert_node(
+            self._used_root,
+            servertools.BlockAllocatorNode(start_offset, size),
+            )
+        self._used_size += size
+
+    def _rebalance(self, node):
+        if node is not None:
+            node._update()
+            if 1 < node._balance:
+                if 0 <= node._right_child._balance:
+                    node = self._rotate_right_right(node)
+                else:
+                    node = self._rotate_right_left(node)
+            elif node._balance < -1:
+                if node._left_child._balance <= 0:
+                    node = self._rotate_left_left(node)
+                else:
+                    node = self._rotate_left_right(node)
+        return node
+
+    def _remove_free_block(self, start_offset):
+        stop_offset = self._free_starts.pop(start_offset)
+        del(self._free_stops[stop_offset])
+        size = stop_offset - start_offset
+        self._offset_root = self._remove_node(self._offset_root, start_offset)
+        self._size_root = self._remove_node(
+            self._size_root, (size, start_offset))
+        if size != float('inf'):
+            self._free_size -= size
+        return stop_offset
+
+    def _remove_node(self, root, key):
+        path = self._find_path(root, key)
+        node = path.pop()
+        changed_index = len(path)
+        if node._left_child is not None and node._right_child is not None:
+            # Moves the successor's block here, then unlinks the successor.
+            path.append(node)
+            next_node = node._right_child
+            while next_node._left_child is not None:
+                path.append(next_node)
+                next_node = next_node._left_child
+            node._key = next_node._key
+            node._size = next_node._size
+            node = next_node
+        child = node._left_child
+        if child is None:
+            child = node._right_child
+        if not path:
+            return child
+        if path[-1]._left_child is node:
+            path[-1]._left_child = child
+        else:
+            path[-1]._right_child = child
+        return self._retrace(root, path, changed_index)
+
+    def _resize_free_block(self, start_offset, new_start_offset,
+        new_stop_offset):
+        # No other free block may lie between the old and new start offsets,
+        # so the offset tree keeps its order and only needs its maxima
+        # refreshed along the path to the resized node.
+        from supriya.tools import servertools
+        stop_offset = self._free_starts.pop(start_offset)
+        del(self._free_stops[stop_offset])
+        size = stop_offset - start_offset
+        new_size = new_stop_offset - new_start_offset
+        path = self._find_path(self._offset_root, start_offset)
+        path[-1]._key = new_start_offset
+        path[-1]._size = new_size
+        for node in reversed(path):
+            maximum_size = node._maximum_size
+            node._update()
+            if node._maximum_size == maximum_size:
+                break
+        if new_size == size:
+            # Only the unbounded block can keep its size while moving.
+            path = self._find_path(self._size_root, (size, start_offset))
+            path[-1]._key = (new_size, new_start_offset)
+        else:
+            self._size_root = self._remove_node(
+                self._size_root, (size, start_offset))
+            self._size_root = self._insert_node(
+                self._size_root,
+                servertools.BlockAllocatorNode(
+                    (new_size, new_start_offset), new_size),
+                )
+            if size != float('inf'):
+                self._free_size -= size
+            if new_size != float('inf'):
+                self._free_size += new_size
+        self._free_starts[new_start_offset] = new_stop_offset
+        self._free_stops[new_stop_offset] = new_start_offset
+
+    def _retrace(self, root, path, changed_index=None):
+        # Rebalances bottom-up along `path`, stopping early once a subtree's
+        # height and maximum size are unchanged above `changed_index`.
+        if changed_index is None:
+            changed_index = len(path) - 1
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            height = node._height
+            maximum_size = node._maximum_size
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                if not index:
+                    root = subtree
+                elif path[index - 1]._left_child is node:
+                    path[index - 1]._left_child = subtree
+                else:
+                    path[index - 1]._right_child = subtree
+            if (
+                index <= changed_index and
+                subtree._height == height and
+                subtree._maximum_size == maximum_size
+                ):
+                break
+        return root
+
+    def _rotate_left_left(self, node):
+        next_node = node._left_child
+        node._left_child = next_node._right_child
+        node._update()
+        next_node._right_child = node
+        next_node._update()
+        return next_node
+
+    def _rotate_left_right(self, node):
+        node._left_child = self._rotate_right_right(node._left_child)
+        return self._rotate_left_left(node)
+
+    def _rotate_right_left(self, node):
+        node._right_child = self._rotate_left_left(node._right_child)
+        return self._rotate_right_right(node)
+
+    def _rotate_right_right(self, node):
+        next_node = node._right_child
+        node._right_child = next_node._left_child
+        node._update()
+        next_node._left_child = node
+        next_node._update()
+        return next_node
 
     ### PUBLIC METHODS ###
 
     def allocate(self, desired_block_size=1):
-        desired_block_size = int(desired_block_size)
-        assert 0 < desired_block_size
-        block_id = None
         with self._lock:
-            free_block = None
-            for block in self._free_heap:
-                if desired_block_size <= block.duration:
-                    free_block = block
-                    break
-            if free_block is not None:
-                split_offset = free_block.start_offset + desired_block_size
-                self._free_heap.remove(free_block)
-                if desired_block_size < free_block.duration:
-                    new_free_block = new(
-                        free_block,
-                        start_offset=split_offset,
-                        used=False,
-                        )
-                    self._free_heap.insert(new_free_block)
-                    used_block = new(
-                        free_block,
-                        stop_offset=split_offset,
-                        used=True,
-                        )
-                else:
-                    used_block = new(
-                        free_block,
-                        used=True,
-                        )
-                self._used_heap.insert(used_block)
-                block_id = used_block.start_offset
-        return block_id
+            return self._allocate(desired_block_size)
 
     def allocate_at(self, index=None, desired_block_size=1):
-        from supriya.tools import servertools
         index = int(index)
         desired_block_size = int(desired_block_size)
-        block_id = None
+        start_offset = index
+        stop_offset = index + desired_block_size
         with self._lock:
-            start_offset = index
-            stop_offset = index + desired_block_size
-            start_cursor = self._free_heap.get_simultaneity_at(start_offset)
-            starting_blocks = sorted(
-                start_cursor.start_timespans +
-                start_cursor.overlap_timespans
-                )
-            stop_cursor = self._free_heap.get_simultaneity_at(stop_offset)
-            stop_blocks = sorted(
-                stop_cursor.overlap_timespans +
-                stop_cursor.stop_timespans
-                )
-            if starting_blocks == stop_blocks:
-                assert len(starting_blocks) == 1
-                free_block = starting_blocks[0]
-                used_block = servertools.Block(
-                    start_offset=start_offset,
-                    stop_offset=stop_offset,
-                    used=True,
-                    )
-                self._used_heap.insert(used_block)
-                self._free_heap.remove(free_block)
-                free_blocks = free_block - used_block
-                for free_block in free_blocks:
-                    self._free_heap.insert(free_block)
-                block_id = index
-        return block_id
+            node = self._find_floor(self._offset_root, index)
+            if node is None:
+                return None
+            free_start_offset = node._key
+            free_stop_offset = self._free_starts[free_start_offset]
+            if free_stop_offset < stop_offset:
+                return None
+            self._remove_free_block(free_start_offset)
+            if free_start_offset < start_offset:
+                self._insert_free_block(free_start_offset, start_offset)
+            if stop_offset < free_stop_offset:
+                self._insert_free_block(stop_offset, free_stop_offset)
+            self._insert_used_block(start_offset, stop_offset)
+        return index
+
+    def allocate_many(self, desired_block_sizes):
+        """
+        Allocates a block for each of `desired_block_sizes` under one lock.
+
+        Returns list of block IDs, with none for each failed allocation.
+        """
+        with self._lock:
+            return [self._allocate(x) for x in desired_block_sizes]
 
     def free(self, block_id):
-        from supriya.tools import servertools
-        block_id = int(block_id)
         with self._lock:
-            cursor = self._used_heap.get_simultaneity_at(block_id)
-            blocks = cursor.start_timespans + cursor.overlap_timespans
-            assert len(blocks) == 1
-            used_block = blocks[0]
-            self._used_heap.remove(used_block)
-            start_offset = used_block.start_offset
-            stopping_blocks = self._free_heap.find_timespans_stopping_at(
-                start_offset)
-            if stopping_blocks:
-                assert len(stopping_blocks) == 1
-                stopping_block = stopping_blocks[0]
-                self._free_heap.remove(stopping_block)
-                start_offset = stopping_block.start_offset
-            stop_offset = used_block.stop_offset
-            starting_blocks = self._free_heap.find_timespans_starting_at(
-                stop_offset)
-            if starting_blocks:
-                assert len(starting_blocks) == 1
-                starting_block = starting_blocks[0]
-                self._free_heap.remove(starting_block)
-                stop_offset = starting_block.stop_offset
-            free_block = servertools.Block(
-                start_offset=start_offset,
-                stop_offset=stop_offset,
-                used=False,
-                )
-            self._free_heap.insert(free_block)
+            self._free(block_id)
+
+    def free_many(self, block_ids):
+        """
+        Frees each of `block_ids` under one lock.
+
+        Returns none.
+        """
+        with self._lock:
+            for block_id in block_ids:
+                self._free(block_id)
+
+    def stats(self):
+        """
+        Gets allocation statistics.
+
+        `fragmentation` is the fraction of free space outside the largest
+        free block, and `utilization` the fraction of the heap in use. For
+        a heap without maximum, both disregard the unbounded free block at
+        the top of the heap.
+
+        Returns ordered dictionary.
+        """
+        with self._lock:
+            free_block_count = len(self._free_starts)
+            # Finite free space only; the unbounded block is counted apart.
+            free_size = self._free_size
+            used_size = self._used_size
+            largest_free_block = 0
+            if self._offset_root is not None:
+                largest_free_block = self._offset_root._maximum_size
+            largest_finite_free_block = 0
+            node = self._find_floor(self._size_root, (float('inf'), -1))
+            if node is not None:
+                largest_finite_free_block = node._size
+            fragmentation = 0.0
+            if free_size:
+                fragmentation = 1 - (
+                    float(largest_finite_free_block) / free_size)
+            utilization = 0.0
+            if free_size + used_size:
+                utilization = float(used_size) / (free_size + used_size)
+            if largest_free_block == float('inf'):
+                free_size = largest_free_block
+            return collections.OrderedDict([
+                ('free_block_count', free_block_count),
+                ('free_size', free_size),
+                ('largest_free_block', largest_free_block),
+                ('fragmentation', fragmentation),
+                ('used_block_count', len(self._used_blocks)),
+                ('used_size', used_size),
+                ('utilization', utilization),
+                ])
 
     ### PUBLIC PROPERTIES ###
 
@@ -193,3 +521,10 @@ class BlockAllocator(SupriyaObject):
         Minimum allocatable index.
         """
         return self._heap_minimum
+
+    @property
+    def policy(self):
+        """
+        Allocation policy.
+        """
+        return self._policy
@@ -0,0 +1,126 @@
+# -*- encoding: utf-8 -*-
+from supriya.tools.systemtools.SupriyaObject import SupriyaObject
+
+
+class BlockAllocatorNode(SupriyaObject):
+    """
+    A node in a block allocator tree.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Server Internals'
+
+    __slots__ = (
+        '_balance',
+        '_height',
+        '_key',
+        '_left_child',
+        '_maximum_size',
+        '_right_child',
+        '_size',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, key, size):
+        self._balance = 0
+        self._height = 0
+        self._key = key
+        self._left_child = None
+        self._maximum_size = size
+        self._right_child = None
+        self._size = size
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        """
+        Gets the repr of this block allocator node.
+        """
+        return '<Node: Key:{} Size:{} Maximum:{}>'.format(
+            self.key,
+            self.size,
+            self.maximum_size,
+            )
+
+    ### PRIVATE METHODS ###
+
+    def _update(self):
+        left_height = -1
+        right_height = -1
+        maximum_size = self._size
+        if self._left_child is not None:
+            left_height = self._left_child._height
+            if maximum_size < self._left_child._maximum_size:
+                maximum_size = self._left_child._maximum_size
+        if self._right_child is not None:
+            right_height = self._right_child._height
+            if maximum_size < self._right_child._maximum_size:
+                maximum_size = self._right_child._maximum_size
+        self._height = max(left_height, right_height) + 1
+        self._balance = right_height - left_height
+        self._maximum_size = maximum_size
+        return self._height
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def balance(self):
+        """
+        Gets the balance of this block allocator node.
+        """
+        return self._balance
+
+    @property
+    def height(self):
+        """
+        Gets the height of this block allocator node.
+        """
+        return self._height
+
+    @property
+    def key(self):
+        """
+        Gets the key of this block allocator node.
+        """
+        return self._key
+
+    @property
+    def left_child(self):
+        """
+        Gets and sets the left child of this block allocator node.
+        """
+        return self._left_child
+
+    @left_child.setter
+    def left_child(self, node):
+        self._left_child = node
+        self._update()
+
+    @property
+    def maximum_size(self):
+        """
+        Gets the largest block size in the subtree rooted on this block
+        allocator node.
+        """
+        return self._maximum_size
+
+    @property
+    def right_child(self):
+        """
+        Gets and sets the right child of this block allocator node.
+        """
+        return self._right_child
+
+    @right_child.setter
+    def right_child(self, node):
+        self._right_child = node
+        self._update()
+
+    @property
+    def size(self):
+        """
+        Gets the block size of this block allocator node.
+        """
+        return self._size
@@ -46,7 +46,7 @@ class GroupControl(BindingTarget):
         if event is None:
             return
         event = float(event)
-        self.set(event)
+        self.set(event, coalesce=True)
 
     def _set_to_number(self, value):
         pass
@@ -56,7 +56,7 @@ class GroupControl(BindingTarget):
 
     ### PUBLIC METHODS ###
 
-    def set(self, expr):
+    def set(self, expr, coalesce=False):
         from supriya.tools import requesttools
         from supriya.tools import servertools
         from supriya.tools import synthdeftools
@@ -73,11 +73,16 @@ class GroupControl(BindingTarget):
                     )
         else:
             expr = float(expr)
-            request = requesttools.NodeSetRequest(
-                self.node,
-                **{self.name: expr}
-                )
+            if self.node.is_allocated:
+                self.node.server.control_coalescer.set(
+                    self.node,
+                    self.name,
+                    expr,
+                    discrete=not coalesce,
+                    )
+            return
         if self.node.is_allocated:
+            self.node.server.control_coalescer.discard(self.node, self.name)
             request.communicate(server=self.node.server)
 
     ### PUBLIC PROPERTIES ###
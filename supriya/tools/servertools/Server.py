@@ -40,6 +40,7 @@ class Server(SupriyaObject):
         '_control_bus_allocator',
         '_control_buses',
         '_control_bus_proxies',
+        '_control_coalescer',
         '_debug_osc',
         '_debug_udp',
         '_default_group',
@@ -65,6 +66,8 @@ class Server(SupriyaObject):
 
     _default_server = None
 
+    _maximum_bundle_size = 8192
+
     _servers = {}
 
     ### CONSTRUCTOR ###
@@ -146,6 +149,7 @@ class Server(SupriyaObject):
         self._audio_output_bus_group = None
         self._default_group = None
         self._root_node = None
+        self._control_coalescer = servertools.ServerControlCoalescer(self)
         self._meters = servertools.ServerMeters(self)
         self._recorder = servertools.ServerRecorder(self)
 
@@ -243,6 +247,24 @@ class Server(SupriyaObject):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _bundle_messages(messages, maximum_bundle_size):
+        from supriya.tools import osctools
+        bundles = []
+        contents = []
+        size = 16
+        for message in messages:
+            message_size = 4 + len(message.to_datagram())
+            if contents and maximum_bundle_size < size + message_size:
+                bundles.append(osctools.OscBundle(contents=contents))
+                contents = []
+                size = 16
+            contents.append(message)
+            size += message_size
+        if contents:
+            bundles.append(osctools.OscBundle(contents=contents))
+        return bundles
+
     def _get_buffer_proxy(self, buffer_id):
         from supriya.tools import servertools
         buffer_proxy = self._buffer_proxies.get(buffer_id)
@@ -330,6 +352,7 @@ class Server(SupriyaObject):
         synthdeftools.SynthDef._allocate_synthdefs(system_synthdefs, self)
 
     def _teardown(self):
+        self._control_coalescer.reset()
         self._teardown_proxies()
         self._teardown_allocators()
         self._teardown_status_watcher()
@@ -398,6 +421,140 @@ class Server(SupriyaObject):
         PubSub.notify('server-booted')
         return self
 
+    def communicate_many(
+        self,
+        requests,
+        maximum_bundle_size=None,
+        timeout=1.0,
+        ):
+        """
+        Communicates `requests` to scsynth in as few round trips as possible.
+
+        ::
+
+            >>> from supriya import requesttools
+            >>> from supriya import servertools
+            >>> server = servertools.Server().boot()
+            >>> requests = [
+            ...     requesttools.BufferAllocateRequest(
+            ...         buffer_id=i,
+            ...         frame_count=8,
+            ...         )
+            ...     for i in range(4)
+            ...     ]
+            >>> requests.extend(
+            ...     requesttools.BufferQueryRequest(buffer_ids=[i])
+            ...     for i in range(4)
+            ...     )
+            >>> responses = server.communicate_many(requests)
+            >>> for response in responses:
+            ...     print(type(response).__name__)
+            ...
+            DoneResponse
+            DoneResponse
+            DoneResponse
+            DoneResponse
+            BufferInfoResponse
+            BufferInfoResponse
+            BufferInfoResponse
+            BufferInfoResponse
+
+        ::
+
+            >>> server.quit()
+            <Server: offline>
+
+        Response callbacks for every request are registered up front, and
+        the requests are sent as bundles of at most `maximum_bundle_size`
+        bytes followed by a single ``/sync``. Since scsynth replies in
+        order, all responses have arrived once the ``/sync`` is answered.
+
+        A ``/fail`` reply is attributed to the earliest unanswered request
+        with the failed command. Requests without a response specification
+        yield none.
+
+        Each request is given `timeout` seconds from the later of sending
+        and the reply to the request before it, so large batches do not
+        share one deadline. Requests still unanswered at their deadline
+        yield none and are each reported as timed out.
+
+        Returns list of responses, in the order of `requests`.
+        """
+        from supriya.tools import requesttools
+        from supriya.tools import responsetools
+        assert self.is_running
+        requests = list(requests)
+        assert all(isinstance(x, requesttools.Request) for x in requests)
+        maximum_bundle_size = maximum_bundle_size or self._maximum_bundle_size
+        failures = [None] * len(requests)
+        callbacks = {}
+        for i, request in enumerate(requests):
+            if request.response_specification is not None:
+                # A reused request must not report its previous response.
+                with request.condition:
+                    request._response = None
+                callbacks[i] = request.response_callback
+
+        def handle_fail(response):
+            for i, request in enumerate(requests):
+                with request.condition:
+                    if (
+                        i in callbacks and
+                        request.response is None and
+                        failures[i] is None and
+                        request.request_command == response.failed_command
+                        ):
+                        failures[i] = response
+                        self.unregister_response_callback(callbacks[i])
+                        request.condition.notify()
+                        return
+
+        fail_callback = responsetools.ResponseCallback(
+            procedure=handle_fail,
+            prototype=responsetools.FailResponse,
+            )
+        sync_request = requesttools.SyncRequest(sync_id=self.next_sync_id)
+        sync_callback = sync_request.response_callback
+        messages = [x.to_osc_message() for x in requests]
+        messages.append(sync_request.to_osc_message())
+        bundles = self._bundle_messages(messages, maximum_bundle_size)
+        self.register_response_callback(fail_callback)
+        for callback in callbacks.values():
+            self.register_response_callback(callback)
+        self.register_response_callback(sync_callback)
+        for bundle in bundles:
+            self.send_message(bundle)
+        # Waits on each request in turn, as scsynth replies in order.
+        start_time = time.time()
+        pending = [(i, requests[i]) for i in sorted(callbacks)]
+        pending.append((None, sync_request))
+        for i, request in pending:
+            with request.condition:
+                while request.response is None and (
+                    i is None or failures[i] is None
+                    ):
+                    delta_time = time.time() - start_time
+                    if timeout <= delta_time:
+                        break
+                    request.condition.wait(timeout - delta_time)
+                else:
+                    start_time = time.time()
+        self.unregister_response_callback(fail_callback)
+        self.unregister_response_callback(sync_callback)
+        responses = []
+        for i, request in enumerate(requests):
+            if i not in callbacks:
+                responses.append(None)
+            elif request.response is not None:
+                responses.append(request.response)
+            elif failures[i] is not None:
+                responses.append(failures[i])
+            else:
+                self.unregister_response_callback(callbacks[i])
+                print('TIMED OUT:', repr(request))
+                responses.append(None)
+        return responses
+
     @staticmethod
     def get_default_server():
         if Server._default_server is None:
@@ -609,6 +766,10 @@ class Server(SupriyaObject):
     def control_bus_allocator(self):
         return self._control_bus_allocator
 
+    @property
+    def control_coalescer(self):
+        return self._control_coalescer
+
     @property
     def debug_osc(self):
         return self._debug_osc
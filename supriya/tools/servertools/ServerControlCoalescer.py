@@ -0,0 +1,266 @@
+# -*- encoding: utf-8 -*-
+from __future__ import division
+import collections
+import math
+import threading
+from supriya.tools.systemtools.SupriyaObject import SupriyaObject
+
+
+class ServerControlCoalescer(SupriyaObject):
+    """
+    Coalesces node control updates into rate-limited ``/n_set`` messages.
+
+    ::
+
+        >>> from supriya.tools import servertools
+        >>> messages = []
+        >>> class Server(object):
+        ...     is_running = True
+        ...     def send_message(self, message):
+        ...         messages.append(message)
+        ...
+        >>> server = Server()
+        >>> class Node(object):
+        ...     is_allocated = True
+        ...     node_id = 1000
+        ...
+        >>> node = Node()
+        >>> coalescer = servertools.ServerControlCoalescer(server)
+        >>> for value in (0.1, 0.2, 0.3):
+        ...     coalescer.set(node, 'amplitude', value)
+        ...
+        >>> coalescer.set(node, 'frequency', 440.)
+        >>> coalescer.flush()
+        >>> messages
+        [OscMessage(15, 1000, 'amplitude', 0.3, 'frequency', 440.0)]
+
+    Only the latest value of each node control is kept. Once per `interval`
+    seconds, pending values are sent as one ``/n_set`` message per node,
+    bundled together when more than one node is pending.
+
+    When `smoothing` is set to a time constant in seconds, each tick moves
+    sent values exponentially towards their latest value rather than
+    jumping.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Server Internals'
+
+    __slots__ = (
+        '_clock',
+        '_interval',
+        '_is_scheduled',
+        '_lock',
+        '_pending',
+        '_sent_values',
+        '_server',
+        '_smoothing',
+        )
+
+    _epsilon = 1e-4
+
+    ### INITIALIZER ###
+
+    def __init__(self, server, interval=0.002, smoothing=None, clock=None):
+        self._server = server
+        self._clock = clock
+        self._interval = float(interval)
+        self._is_scheduled = False
+        self._lock = threading.RLock()
+        self._pending = collections.OrderedDict()
+        self._sent_values = {}
+        self.smoothing = smoothing
+
+    ### PRIVATE METHODS ###
+
+    def _get_messages(self):
+        from supriya.tools import requesttools
+        smoothing = self._smoothing
+        if smoothing:
+            coefficient = 1 - math.exp(-self._interval / smoothing)
+        messages = []
+        for node, controls in tuple(self._pending.items()):
+            if not node.is_allocated:
+                del(self._pending[node])
+                continue
+            pairs = {}
+            for name, target in tuple(controls.items()):
+                key = (node, name)
+                value = target
+                previous_value = self._sent_values.get(key)
+                if smoothing and previous_value is not None:
+                    delta = (target - previous_value) * coefficient
+                    value = previous_value + delta
+                    tolerance = self._epsilon * max(1., abs(target))
+                    if tolerance < abs(target - value):
+                        pairs[name] = value
+                        self._sent_values[key] = value
+                        continue
+                    value = target
+                pairs[name] = value
+                del(controls[name])
+                if smoothing:
+                    self._sent_values[key] = value
+            if not controls:
+                del(self._pending[node])
+            request = requesttools.NodeSetRequest(node.node_id, **pairs)
+            messages.append(request.to_osc_message())
+        if not self._pending:
+            for key in tuple(self._sent_values):
+                if not key[0].is_allocated:
+                    del(self._sent_values[key])
+        return messages
+
+    def _get_clock(self):
+        from supriya.tools import patterntools
+        return self._clock or patterntools.Clock.get_default_clock()
+
+    def _schedule(self):
+        self._get_clock().schedule(
+            self._tick,
+            scheduled_time=self._interval,
+            registry_key=self,
+            )
+
+    def _send_messages(self, messages):
+        from supriya.tools import servertools
+        if not self._server.is_running:
+            return
+        if len(messages) == 1:
+            self._server.send_message(messages[0])
+            return
+        bundles = servertools.Server._bundle_messages(
+            messages,
+            servertools.Server._maximum_bundle_size,
+            )
+        for bundle in bundles:
+            self._server.send_message(bundle)
+
+    def _tick(self, current_time, scheduled_time):
+        with self._lock:
+            self.flush()
+            if self._pending:
+                return self._interval
+            self._is_scheduled = False
+
+    ### PUBLIC METHODS ###
+
+    def discard(self, node, name):
+        """
+        Discards any pending or smoothed value of control `name` on `node`.
+
+        Returns none.
+        """
+        with self._lock:
+            controls = self._pending.get(node)
+            if controls is not None:
+                controls.pop(name, None)
+                if not controls:
+                    del(self._pending[node])
+            self._sent_values.pop((node, name), None)
+
+    def flush(self):
+        """
+        Sends pending control values immediately.
+
+        Returns none.
+        """
+        with self._lock:
+            messages = self._get_messages()
+            if messages:
+                self._send_messages(messages)
+
+    def reset(self):
+        """
+        Discards all pending and smoothed control values.
+
+        Returns none.
+        """
+        with self._lock:
+            self._pending.clear()
+            self._sent_values.clear()
+            self._is_scheduled = False
+        self._get_clock().cancel(self)
+
+    def set(self, node, name, value, discrete=False):
+        """
+        Sets control `name` on `node` to `value`.
+
+        Discrete values bypass coalescing and smoothing, and are sent
+        immediately, replacing any pending value of the same control.
+
+        Returns none.
+        """
+        from supriya.tools import requesttools
+        value = float(value)
+        with self._lock:
+            if discrete:
+                self.discard(node, name)
+                if self._smoothing:
+                    self._sent_values[(node, name)] = value
+                if node.is_allocated:
+                    request = requesttools.NodeSetRequest(
+                        node.node_id,
+                        **{name: value}
+                        )
+                    self._send_messages([request.to_osc_message()])
+                return
+            if node not in self._pending:
+                self._pending[node] = collections.OrderedDict()
+            self._pending[node][name] = value
+            if self._is_scheduled:
+                return
+            self._is_scheduled = True
+        # Scheduling happens outside the lock, as ticks run under the clock's.
+        self._schedule()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def interval(self):
+        """
+        Gets and sets flush interval of coalescer, in seconds.
+
+        Returns float.
+        """
+        return self._interval
+
+    @interval.setter
+    def interval(self, interval):
+        interval = float(interval)
+        assert 0 < interval
+        self._interval = interval
+
+    @property
+    def pending_count(self):
+        """
+        Gets number of node controls with pending values.
+
+        Returns integer.
+        """
+        with self._lock:
+            return sum(len(_) for _ in self._pending.values())
+
+    @property
+    def server(self):
+        return self._server
+
+    @property
+    def smoothing(self):
+        """
+        Gets and sets smoothing time constant of coalescer, in seconds.
+
+        Returns float or none.
+        """
+        return self._smoothing
+
+    @smoothing.setter
+    def smoothing(self, smoothing):
+        if smoothing is not None:
+            smoothing = float(smoothing)
+            assert 0 < smoothing
+        with self._lock:
+            self._smoothing = smoothing
+            if not smoothing:
+                self._sent_values.clear()
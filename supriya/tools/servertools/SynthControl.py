@@ -71,7 +71,7 @@ class SynthControl(BindingTarget):
         if event is None:
             return
         event = float(event)
-        self.set(event)
+        self.set(event, coalesce=True)
 
     def _set_to_number(self, value):
         self._value = float(value)
@@ -102,12 +102,15 @@ class SynthControl(BindingTarget):
         parameter,
         index=0,
         client=None,
+        calculation_rate=None,
         ):
         from supriya.tools import synthdeftools
         assert isinstance(parameter, synthdeftools.Parameter)
         name = parameter.name
         range_ = parameter.range_
-        calculation_rate = synthdeftools.CalculationRate.from_input(parameter)
+        if calculation_rate is None:
+            calculation_rate = synthdeftools.CalculationRate.from_input(
+                parameter)
         unit = parameter.unit
         value = parameter.value
         synth_control = SynthControl(
@@ -127,7 +130,7 @@ class SynthControl(BindingTarget):
     def reset(self):
         self._value = self._default_value
 
-    def set(self, expr):
+    def set(self, expr, coalesce=False):
         from supriya.tools import requesttools
         from supriya.tools import servertools
         from supriya.tools import synthdeftools
@@ -151,11 +154,16 @@ class SynthControl(BindingTarget):
                 )
         else:
             self._set_to_number(expr)
-            request = requesttools.NodeSetRequest(
-                self.node,
-                **{self.name: self._value}
-                )
+            if self.node.is_allocated:
+                self.node.server.control_coalescer.set(
+                    self.node,
+                    self.name,
+                    self._value,
+                    discrete=not coalesce,
+                    )
+            return
         if self.node.is_allocated:
+            self.node.server.control_coalescer.discard(self.node, self.name)
             request.communicate(server=self.node.server)
 
     ### PUBLIC PROPERTIES ###
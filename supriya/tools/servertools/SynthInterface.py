@@ -26,9 +26,11 @@ class SynthInterface(ControlInterface):
         synth_control_map = collections.OrderedDict()
         if synthdef is not None:
             assert isinstance(synthdef, synthdeftools.SynthDef)
+            calculation_rates = synthdef._parameter_calculation_rates
             for index, parameter in synthdef.indexed_parameters:
                 synth_control = servertools.SynthControl.from_parameter(
                     parameter,
+                    calculation_rate=calculation_rates[parameter.name],
                     client=self,
                     index=index,
                     )
@@ -0,0 +1,144 @@
+# -*- encoding: utf-8 -*-
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+import socket
+import struct
+import threading
+import unittest
+from supriya.tools import osctools
+from supriya.tools import requesttools
+from supriya.tools import servertools
+
+
+class FakeScsynth(threading.Thread):
+
+    def __init__(self, reverse=False):
+        threading.Thread.__init__(self)
+        self.setDaemon(True)
+        self.socket_instance = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket_instance.bind(('127.0.0.1', 0))
+        self.socket_instance.settimeout(0.1)
+        self.port = self.socket_instance.getsockname()[1]
+        self.received = []
+        self.reverse = reverse
+        self.running = True
+
+    def run(self):
+        pending = []
+        while self.running:
+            try:
+                data, address = self.socket_instance.recvfrom(8192)
+            except socket.timeout:
+                continue
+            command, = struct.unpack('>i', data[:4])
+            sync_id, = struct.unpack('>i', data[-4:])
+            self.received.append((command, sync_id))
+            if sync_id < 0:
+                continue
+            pending.append((sync_id, address))
+            if self.reverse and len(pending) < 4:
+                continue
+            if self.reverse:
+                pending.reverse()
+            for sync_id, address in pending:
+                message = osctools.OscMessage('/synced', sync_id)
+                self.socket_instance.sendto(message.to_datagram(), address)
+            pending[:] = []
+
+    def quit(self):
+        self.running = False
+        self.join(2)
+        self.socket_instance.close()
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is unavailable')
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def connect(self, fake_scsynth):
+        fake_scsynth.start()
+        server = servertools.AsyncServer(
+            loop=self.loop,
+            port=fake_scsynth.port,
+            )
+        assert isinstance(server, asyncio.DatagramProtocol)
+        assert repr(server) == '<AsyncServer: offline>'
+        result = self.loop.run_until_complete(server.connect())
+        assert result is server
+        assert server.is_running
+        return server
+
+    def test_01(self):
+        fake_scsynth = FakeScsynth()
+        server = self.connect(fake_scsynth)
+        try:
+            response = self.loop.run_until_complete(server.sync())
+            assert response.sync_id == 0
+            response = self.loop.run_until_complete(server.sync())
+            assert response.sync_id == 1
+        finally:
+            server.disconnect()
+            fake_scsynth.quit()
+        assert not server.is_running
+
+    def test_02(self):
+        """
+        Responses arriving out of order resolve the matching futures.
+        """
+        fake_scsynth = FakeScsynth(reverse=True)
+        server = self.connect(fake_scsynth)
+        try:
+            futures = [
+                requesttools.SyncRequest(sync_id=i).communicate_async(
+                    server=server)
+                for i in range(4)
+                ]
+            responses = self.loop.run_until_complete(
+                asyncio.gather(*futures, loop=self.loop))
+            assert [x.sync_id for x in responses] == [0, 1, 2, 3]
+            assert not server.response_dispatcher._callback_map
+        finally:
+            server.disconnect()
+            fake_scsynth.quit()
+
+    def test_03(self):
+        """
+        Unanswered requests resolve to none after the timeout, and
+        unregister their callbacks.
+        """
+        fake_scsynth = FakeScsynth()
+        server = self.connect(fake_scsynth)
+        try:
+            future = requesttools.SyncRequest(sync_id=-1).communicate_async(
+                server=server,
+                timeout=0.1,
+                )
+            assert self.loop.run_until_complete(future) is None
+            assert not server.response_dispatcher._callback_map
+        finally:
+            server.disconnect()
+            fake_scsynth.quit()
+
+    def test_04(self):
+        """
+        Unsynced requests resolve immediately.
+        """
+        fake_scsynth = FakeScsynth()
+        server = self.connect(fake_scsynth)
+        try:
+            future = requesttools.SyncRequest(sync_id=-2).communicate_async(
+                server=server,
+                sync=False,
+                )
+            assert future.done()
+            assert future.result() is None
+        finally:
+            server.disconnect()
+            fake_scsynth.quit()
@@ -0,0 +1,136 @@
+# -*- encoding: utf-8 -*-
+import random
+import unittest
+from supriya.tools import servertools
+
+
+class Test(unittest.TestCase):
+
+    def test_01(self):
+        allocator = servertools.BlockAllocator(heap_maximum=32)
+        assert allocator.allocate_many([8, 2, 3, 4]) == [0, 8, 10, 13]
+        allocator.free_many([0, 10])
+        assert allocator.allocate(2) == 0
+
+    def test_02(self):
+        allocator = servertools.BlockAllocator(
+            heap_maximum=32,
+            policy='best_fit',
+            )
+        assert allocator.allocate_many([8, 2, 3, 4]) == [0, 8, 10, 13]
+        allocator.free_many([0, 10])
+        assert allocator.allocate(2) == 10
+        assert allocator.allocate(8) == 0
+        assert allocator.allocate(8) == 17
+        assert allocator.allocate(8) is None
+        assert allocator.allocate(2) == 25
+        assert allocator.stats()['free_size'] == 6
+
+    def test_03(self):
+        allocator = servertools.BlockAllocator()
+        assert allocator.stats()['utilization'] == 0.0
+        assert allocator.allocate_many([4, 4, 4]) == [0, 4, 8]
+        allocator.free(4)
+        stats = allocator.stats()
+        assert stats['free_block_count'] == 2
+        assert stats['free_size'] == float('inf')
+        assert stats['fragmentation'] == 0.0
+        assert stats['used_size'] == 8
+        assert stats['utilization'] == 8 / 12.
+
+    def test_04(self):
+        for policy in ('best_fit', 'first_fit'):
+            rng = random.Random(0)
+            allocator = servertools.BlockAllocator(
+                heap_maximum=256,
+                policy=policy,
+                )
+            used = {}
+            for _ in range(2000):
+                if used and rng.random() < 0.5:
+                    block_id = rng.choice(sorted(used))
+                    del(used[block_id])
+                    allocator.free(block_id)
+                    continue
+                size = rng.randint(1, 16)
+                block_id = allocator.allocate(size)
+                if block_id is None:
+                    continue
+                for start, stop in used.items():
+                    assert block_id + size <= start or stop <= block_id
+                assert 0 <= block_id and block_id + size <= 256
+                used[block_id] = block_id + size
+            allocator.free_many(list(used))
+            stats = allocator.stats()
+            assert stats['free_block_count'] == 1
+            assert stats['free_size'] == 256
+            assert stats['used_block_count'] == 0
+
+    def test_05(self):
+        r'''Both policies match a linear scan of free blocks, and the trees
+        stay balanced.
+        '''
+        def check_tree(node, minimum_key=None, maximum_key=None):
+            if node is None:
+                return -1
+            assert minimum_key is None or minimum_key < node.key
+            assert maximum_key is None or node.key < maximum_key
+            left_height = check_tree(node.left_child, minimum_key, node.key)
+            right_height = check_tree(node.right_child, node.key, maximum_key)
+            assert abs(left_height - right_height) <= 1
+            maximum_size = max(
+                [node.size] +
+                [_.maximum_size for _ in (node.left_child, node.right_child)
+                    if _ is not None]
+                )
+            assert node.maximum_size == maximum_size
+            return max(left_height, right_height) + 1
+
+        for policy in ('best_fit', 'first_fit'):
+            rng = random.Random(1)
+            allocator = servertools.BlockAllocator(
+                heap_maximum=1024,
+                policy=policy,
+                )
+            used = {}
+            for i in range(1500):
+                free_blocks = []
+                offset = 0
+                for start in sorted(used) + [1024]:
+                    if offset < start:
+                        free_blocks.append((offset, start - offset))
+                    offset = used.get(start, start)
+                if used and rng.random() < 0.45:
+                    block_id = rng.choice(sorted(used))
+                    # Blocks can be freed by any ID inside them.
+                    allocator.free(rng.randint(block_id, used[block_id] - 1))
+                    del(used[block_id])
+                    continue
+                size = rng.randint(1, 24)
+                if rng.random() < 0.1:
+                    index = rng.randint(0, 1023)
+                    expected = None
+                    for start, free_size in free_blocks:
+                        stop = start + free_size
+                        if start <= index and index + size <= stop:
+                            expected = index
+                    assert allocator.allocate_at(index, size) == expected
+                else:
+                    candidates = [_ for _ in free_blocks if size <= _[1]]
+                    expected = None
+                    if candidates and policy == 'first_fit':
+                        expected = candidates[0][0]
+                    elif candidates:
+                        expected = min(candidates, key=lambda x: x[::-1])[0]
+                    assert allocator.allocate(size) == expected
+                if expected is not None:
+                    used[expected] = expected + size
+                if i % 10:
+                    continue
+                for root in (
+                    allocator._offset_root,
+                    allocator._size_root,
+                    allocator._used_root,
+                    ):
+                    check_tree(root)
+            assert allocator.stats()['used_block_count'] == len(used)
@@ -0,0 +1,141 @@
+# -*- encoding: utf-8 -*-
+import time
+from abjad.tools import systemtools
+from supriya.tools import osctools
+from supriya.tools import patterntools
+from supriya.tools import servertools
+
+
+class FakeServer(object):
+
+    def __init__(self, messages):
+        self.is_running = True
+        self.messages = messages
+
+    def send_message(self, message):
+        self.messages.append(message)
+
+
+class FakeNode(object):
+
+    def __init__(self, node_id):
+        self.is_allocated = True
+        self.node_id = node_id
+
+
+class TestCase(systemtools.TestCase):
+
+    def setUp(self):
+        super(TestCase, self).setUp()
+        self.messages = []
+        self.server = FakeServer(self.messages)
+        self.clock = patterntools.Clock()
+
+    def tearDown(self):
+        self.clock.reset()
+        super(TestCase, self).tearDown()
+
+    def test_01(self):
+        """
+        Latest values per node control are bundled into one packet per tick.
+        """
+        coalescer = servertools.ServerControlCoalescer(
+            self.server,
+            clock=self.clock,
+            )
+        node_a, node_b = FakeNode(1000), FakeNode(1001)
+        for i in range(100):
+            coalescer.set(node_a, 'amplitude', i / 100.)
+            coalescer.set(node_b, 'frequency', 440. + i)
+        coalescer.set(node_a, 'frequency', 220.)
+        assert coalescer.pending_count == 3
+        coalescer.flush()
+        assert coalescer.pending_count == 0
+        assert len(self.messages) == 1
+        bundle = self.messages[0]
+        assert isinstance(bundle, osctools.OscBundle)
+        assert [_.contents for _ in bundle.contents] == [
+            (1000, 'amplitude', 0.99, 'frequency', 220.0),
+            (1001, 'frequency', 539.0),
+            ]
+
+    def test_02(self):
+        """
+        Discrete values bypass coalescing and replace pending values.
+        """
+        coalescer = servertools.ServerControlCoalescer(
+            self.server,
+            clock=self.clock,
+            )
+        node = FakeNode(1000)
+        coalescer.set(node, 'amplitude', 0.25)
+        coalescer.set(node, 'amplitude', 0.5, discrete=True)
+        assert coalescer.pending_count == 0
+        assert [_.contents for _ in self.messages] == [
+            (1000, 'amplitude', 0.5),
+            ]
+        coalescer.flush()
+        assert len(self.messages) == 1
+
+    def test_03(self):
+        """
+        Unallocated nodes are skipped, and discarded values are not sent.
+        """
+        coalescer = servertools.ServerControlCoalescer(
+            self.server,
+            clock=self.clock,
+            )
+        node_a, node_b = FakeNode(1000), FakeNode(1001)
+        coalescer.set(node_a, 'amplitude', 0.25)
+        coalescer.set(node_a, 'frequency', 220.)
+        coalescer.set(node_b, 'amplitude', 0.5)
+        coalescer.discard(node_a, 'frequency')
+        node_b.is_allocated = False
+        coalescer.flush()
+        assert [_.contents for _ in self.messages] == [
+            (1000, 'amplitude', 0.25),
+            ]
+
+    def test_04(self):
+        """
+        Smoothing approaches the latest value over several ticks.
+        """
+        coalescer = servertools.ServerControlCoalescer(
+            self.server,
+            clock=self.clock,
+            interval=0.001,
+            smoothing=0.001,
+            )
+        node = FakeNode(1000)
+        coalescer.set(node, 'amplitude', 0., discrete=True)
+        coalescer.set(node, 'amplitude', 1.)
+        values = []
+        while coalescer.pending_count:
+            coalescer.flush()
+            values.append(self.messages[-1].contents[-1])
+        assert 1 < len(values)
+        assert values == sorted(values)
+        assert round(values[0], 6) == round(1 - 2.718281828459045 ** -1, 6)
+        assert values[-1] == 1.
+
+    def test_05(self):
+        """
+        Pending values flush on the clock, then the coalescer goes idle.
+        """
+        coalescer = servertools.ServerControlCoalescer(
+            self.server,
+            clock=self.clock,
+            interval=0.005,
+            )
+        node = FakeNode(1000)
+        for i in range(10):
+            coalescer.set(node, 'amplitude', i / 10.)
+        assert not self.messages
+        time.sleep(0.05)
+        assert [_.contents for _ in self.messages] == [
+            (1000, 'amplitude', 0.9),
+            ]
+        assert not coalescer._is_scheduled
+        coalescer.set(node, 'amplitude', 0.)
+        time.sleep(0.05)
+        assert len(self.messages) == 2
@@ -0,0 +1,17 @@
+# -*- encoding: utf-8 -*-
+import unittest
+from supriya import requesttools
+from supriya import servertools
+
+
+class Test(unittest.TestCase):
+
+    def test_01(self):
+        bundles = servertools.Server._bundle_messages(
+            [x.to_osc_message() for x in [
+                requesttools.BufferQueryRequest(buffer_ids=[i])
+                for i in range(10)
+                ]],
+            maximum_bundle_size=64,
+            )
+        assert [len(x.contents) for x in bundles] == [3, 3, 3, 1]
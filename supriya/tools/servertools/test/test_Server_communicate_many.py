@@ -0,0 +1,142 @@
+# -*- encoding: utf-8 -*-
+import os
+import threading
+import unittest
+from supriya import osctools
+from supriya import requesttools
+from supriya import responsetools
+from supriya import servertools
+
+
+class FakeOscController(object):
+    """
+    Answers buffer queries and syncs in order, `delay` seconds apart.
+    """
+
+    def __init__(self, server, delay=0.):
+        self.delay = delay
+        self.dropped_buffer_ids = set()
+        self.reply_count = 0
+        self.server = server
+
+    def send(self, bundle):
+        for message in bundle.contents:
+            if message.address == requesttools.RequestId.BUFFER_QUERY:
+                buffer_id = message.contents[0]
+                if buffer_id in self.dropped_buffer_ids:
+                    continue
+                reply = osctools.OscMessage('/b_info', buffer_id, 8, 1, 44100.)
+            elif message.address == requesttools.RequestId.SYNC:
+                reply = osctools.OscMessage('/synced', message.contents[0])
+            else:
+                continue
+            self.reply_count += 1
+            timer = threading.Timer(
+                self.delay * self.reply_count,
+                self.server.response_dispatcher,
+                [reply],
+                )
+            timer.start()
+
+
+class TestFakeServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = servertools.Server(port=57999)
+        self.controller = self.server._osc_controller
+        self.server._osc_controller = FakeOscController(self.server)
+        self.server._is_running = True
+        self.server._sync_id = 0
+
+    def tearDown(self):
+        self.server._is_running = False
+        self.server._osc_controller = self.controller
+
+    def test_01(self):
+        """
+        Reused requests do not report their previous response.
+        """
+        request = requesttools.BufferQueryRequest(buffer_ids=[0])
+        responses = self.server.communicate_many([request])
+        assert isinstance(responses[0], responsetools.BufferInfoResponse)
+        self.server._osc_controller.dropped_buffer_ids.add(0)
+        responses = self.server.communicate_many([request], timeout=0.05)
+        assert responses == [None]
+        assert request.response is None
+
+    def test_02(self):
+        """
+        Each request gets its own deadline, so slow batches complete.
+        """
+        self.server._osc_controller.delay = 0.02
+        requests = [
+            requesttools.BufferQueryRequest(buffer_ids=[i])
+            for i in range(25)
+            ]
+        callback_map = self.server.response_dispatcher._callback_map
+        responses = self.server.communicate_many(requests, timeout=0.25)
+        assert [x.buffer_id for x in responses] == list(range(25))
+        assert self.server.response_dispatcher._callback_map == callback_map
+
+    def test_03(self):
+        """
+        Only unanswered requests time out.
+        """
+        self.server._osc_controller.dropped_buffer_ids.add(2)
+        requests = [
+            requesttools.BufferQueryRequest(buffer_ids=[i])
+            for i in range(5)
+            ]
+        callback_map = self.server.response_dispatcher._callback_map
+        responses = self.server.communicate_many(requests, timeout=0.05)
+        assert responses[2] is None
+        assert [x.buffer_id for x in responses if x is not None] == [
+            0, 1, 3, 4]
+        assert self.server.response_dispatcher._callback_map == callback_map
+
+
+@unittest.skipIf(os.environ.get('TRAVIS') == 'true', 'No Scsynth on Travis-CI')
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        self.server = servertools.Server().boot()
+
+    def tearDown(self):
+        self.server.quit()
+
+    def test_01(self):
+        requests = [
+            requesttools.BufferAllocateRequest(
+                buffer_id=i,
+                frame_count=i + 1,
+                )
+            for i in range(200)
+            ]
+        requests.extend(
+            requesttools.BufferQueryRequest(buffer_ids=[i])
+            for i in reversed(range(200))
+            )
+        responses = self.server.communicate_many(
+            requests,
+            maximum_bundle_size=1024,
+            )
+        assert len(responses) == 400
+        for response in responses[:200]:
+            assert isinstance(response, responsetools.DoneResponse)
+        for i, response in enumerate(responses[200:]):
+            assert isinstance(response, responsetools.BufferInfoResponse)
+            assert response.buffer_id == 199 - i
+            assert response.frame_count == 200 - i
+        assert not self.server.response_dispatcher._callback_map
+
+    def test_02(self):
+        requests = [
+            requesttools.BufferAllocateRequest(buffer_id=0, frame_count=8),
+            requesttools.BufferZeroRequest(buffer_id=0),
+            requesttools.BufferQueryRequest(buffer_ids=[0]),
+            ]
+        responses = self.server.communicate_many(requests)
+        assert isinstance(responses[0], responsetools.DoneResponse)
+        assert isinstance(responses[1], responsetools.DoneResponse)
+        assert isinstance(responses[2], responsetools.BufferInfoResponse)
+        assert responses[2].frame_count == 8
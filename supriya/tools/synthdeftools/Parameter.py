@@ -55,6 +55,9 @@ class Parameter(UGenMethodMixin):
 
     def __eq__(self, expr):
         from abjad.tools import systemtools
+        # Ugen construction compares parameters against constants often.
+        if not isinstance(expr, Parameter):
+            return False
         return systemtools.TestManager.compare_objects(self, expr)
 
     def __getitem__(self, i):
@@ -63,11 +63,22 @@ class SynthDef(ServerObjectProxy):
     __documentation_section__ = 'Main Classes'
 
     __slots__ = (
+        '_anonymous_name',
+        '_compiled',
         '_compiled_ugen_graph',
+        '_constant_indices',
         '_constants',
         '_control_ugens',
+        '_has_gate',
         '_indexed_parameters',
         '_name',
+        '_optimized_ugen_count',
+        '_parameter_calculation_rates',
+        '_parameter_defaults',
+        '_parameter_name_set',
+        '_parameter_names',
+        '_parameters',
+        '_ugen_indices',
         '_ugens',
         )
 
@@ -90,17 +101,31 @@ class SynthDef(ServerObjectProxy):
         assert all(isinstance(_, ugentools.UGen) for _ in ugens)
         ugens = self._cleanup_pv_chains(ugens)
         ugens = self._cleanup_local_bufs(ugens)
+        ugen_count = len(ugens)
         if optimize:
             ugens = self._optimize_ugen_graph(ugens)
+        self._optimized_ugen_count = ugen_count - len(ugens)
         ugens = self._sort_ugens_topologically(ugens)
         self._ugens = tuple(ugens)
+        self._ugen_indices = self._build_indices(self._ugens)
         self._constants = self._collect_constants(self._ugens)
+        self._constant_indices = self._build_indices(self._constants)
         self._control_ugens = self._collect_control_ugens(self._ugens)
         self._indexed_parameters = self._collect_indexed_parameters(
             self._control_ugens,
             parameter_names=parameter_names,
             )
+        (
+            self._parameters,
+            self._parameter_names,
+            self._parameter_name_set,
+            self._parameter_defaults,
+            self._parameter_calculation_rates,
+            ) = self._build_parameter_tables(self._indexed_parameters)
+        self._has_gate = 'gate' in self._parameter_name_set
         self._compiled_ugen_graph = compiler.compile_ugen_graph(self)
+        self._anonymous_name = None
+        self._compiled = None
 
     ### SPECIAL METHODS ###
 
@@ -207,7 +232,7 @@ class SynthDef(ServerObjectProxy):
         Returns string.
         """
         def get_ugen_name(ugen):
-            ugen_index = self._ugens.index(ugen)
+            ugen_index = self._ugen_indices[ugen]
             ugen_class = type(ugen).__name__
             if isinstance(ugen, ugentools.BinaryOpUGen):
                 ugen_op = synthdeftools.BinaryOperator.from_expr(
@@ -241,7 +266,7 @@ class SynthDef(ServerObjectProxy):
                 if i < len(ugen._ordered_input_names):
                     argument_name = ugen._ordered_input_names[i]
                 if isinstance(input_, float):
-                    input_index = self._constants.index(input_)
+                    input_index = self._constant_indices[input_]
                     # 11 decimal places ensures some Py2/3 standardization.
                     input_ = '{:.11f}'.format(input_).rstrip('0')
                     if input_[-1] == '.':
@@ -275,7 +300,12 @@ class SynthDef(ServerObjectProxy):
         d_load_synthdefs = []
         if synthdefs:
             for synthdef in synthdefs:
+                # Skip sending (and syncing) defs the server already holds.
+                is_loaded = server._synthdefs.get(
+                    synthdef.actual_name) == synthdef
                 synthdef._register_with_local_server(server=server)
+                if is_loaded:
+                    continue
                 compiled = synthdef.compile()
                 if 8192 < len(compiled):
                     d_load_synthdefs.append(synthdef)
@@ -299,20 +329,13 @@ class SynthDef(ServerObjectProxy):
                 sync=True,
                 )
         if d_load_synthdefs:
-            temp_directory_path = tempfile.mkdtemp()
-            for synthdef in d_load_synthdefs:
-                file_name = '{}.scsyndef'.format(synthdef.actual_name)
-                file_path = os.path.join(temp_directory_path, file_name)
-                with open(file_path, 'wb') as file_pointer:
-                    file_pointer.write(synthdef.compile())
-            d_load_dir_request = requesttools.SynthDefLoadDirectoryRequest(
-                directory_path=temp_directory_path,
+            d_load_request = requesttools.SynthDefLoadRequest(
+                synthdef_path=SynthDef._cache_synthdefs(d_load_synthdefs),
                 )
-            d_load_dir_request.communicate(
+            d_load_request.communicate(
                 server=server,
                 sync=True,
                 )
-            shutil.rmtree(temp_directory_path)
 
     @staticmethod
     def _build_control_mapping(parameters):
@@ -400,6 +423,13 @@ class SynthDef(ServerObjectProxy):
         indexed_parameters = tuple(indexed_parameters)
         return control_ugens, control_mapping, indexed_parameters
 
+    @staticmethod
+    def _build_indices(items):
+        indices = {}
+        for i, item in enumerate(items):
+            indices.setdefault(item, i)
+        return indices
+
     @staticmethod
     def _build_input_mapping(ugens):
         from supriya.tools import synthdeftools
@@ -421,6 +451,81 @@ class SynthDef(ServerObjectProxy):
                 input_mapping[source].append((ugen, i))
         return input_mapping
 
+    @staticmethod
+    def _build_parameter_tables(indexed_parameters):
+        from supriya.tools import synthdeftools
+        parameters = {}
+        parameter_names = []
+        parameter_defaults = {}
+        parameter_calculation_rates = {}
+        for _, parameter in indexed_parameters:
+            name = parameter.name
+            parameters[name] = parameter
+            parameter_names.append(name)
+            parameter_defaults[name] = parameter.value
+            parameter_calculation_rates[name] = \
+                synthdeftools.CalculationRate.from_input(parameter)
+        return (
+            parameters,
+            tuple(parameter_names),
+            frozenset(parameter_names),
+            parameter_defaults,
+            parameter_calculation_rates,
+            )
+
+    @staticmethod
+    def _cache_synthdefs(synthdefs, directory_path=None):
+        # Files are keyed by the hash of each compiled synthdef, and reused
+        # across allocations. Several synthdefs are linked into a group
+        # directory, also keyed by hash, to load them via one /d_load glob.
+        from supriya import supriya_configuration
+        if directory_path is None:
+            directory_path = supriya_configuration.synthdef_cache_directory
+        file_paths = []
+        for synthdef in synthdefs:
+            compiled = synthdef.compile()
+            file_name = '{}.scsyndef'.format(
+                hashlib.md5(compiled).hexdigest())
+            file_path = os.path.join(directory_path, file_name)
+            if not os.path.exists(file_path) or \
+                os.path.getsize(file_path) != len(compiled):
+                SynthDef._write_atomically(file_path, compiled)
+            file_paths.append(file_path)
+        if len(file_paths) == 1:
+            return file_paths[0]
+        md5 = hashlib.md5()
+        for file_path in sorted(set(file_paths)):
+            md5.update(os.path.basename(file_path).encode('ascii'))
+        group_directory_path = os.path.join(
+            directory_path,
+            'groups',
+            md5.hexdigest(),
+            )
+        if not os.path.exists(group_directory_path):
+            groups_directory_path = os.path.dirname(group_directory_path)
+            if not os.path.exists(groups_directory_path):
+                try:
+                    os.makedirs(groups_directory_path)
+                except OSError:
+                    pass
+            temporary_directory_path = tempfile.mkdtemp(
+                dir=groups_directory_path)
+            for file_path in set(file_paths):
+                link_path = os.path.join(
+                    temporary_directory_path,
+                    os.path.basename(file_path),
+                    )
+                try:
+                    os.link(file_path, link_path)
+                except (AttributeError, OSError):
+                    shutil.copyfile(file_path, link_path)
+            try:
+                os.rename(temporary_directory_path, group_directory_path)
+            except OSError:
+                # Another process created the same group concurrently.
+                shutil.rmtree(temporary_directory_path)
+        return os.path.join(group_directory_path, '*.scsyndef')
+
     @staticmethod
     def _cleanup_local_bufs(ugens):
         from supriya.tools import ugentools
@@ -463,11 +568,13 @@ class SynthDef(ServerObjectProxy):
     @staticmethod
     def _collect_constants(ugens):
         constants = []
+        seen_constants = set()
         for ugen in ugens:
             for input_ in ugen._inputs:
                 if not isinstance(input_, float):
                     continue
-                if input_ not in constants:
+                if input_ not in seen_constants:
+                    seen_constants.add(input_)
                     constants.append(input_)
         return tuple(constants)
 
@@ -519,32 +626,35 @@ class SynthDef(ServerObjectProxy):
 
     @staticmethod
     def _flatten_ugens(ugens):
+        def append(ugen):
+            if ugen in seen_ugens:
+                return False
+            seen_ugens.add(ugen)
+            flattened_ugens.append(ugen)
+            return True
+
         def recurse(ugen):
-            if ugen not in flattened_ugens:
-                flattened_ugens.append(ugen)
+            append(ugen)
             if isinstance(ugen, synthdeftools.Parameter):
                 return
             elif isinstance(ugen, synthdeftools.OutputProxy):
                 source = ugen.source
-                if source not in flattened_ugens:
-                    flattened_ugens.append(source)
+                if append(source):
                     recurse(source)
                 return
             for input_ in ugen.inputs:
                 if isinstance(input_, synthdeftools.Parameter):
-                    if input_ not in flattened_ugens:
-                        flattened_ugens.append(input_)
+                    append(input_)
                 elif isinstance(input_, synthdeftools.OutputProxy):
-                    if input_.source not in flattened_ugens:
-                        flattened_ugens.append(input_.source)
+                    if append(input_.source):
                         recurse(input_.source)
                 elif isinstance(input_, ugentools.UGen):
-                    if input_ not in flattened_ugens:
-                        flattened_ugens.append(input_)
+                    if append(input_):
                         recurse(input_)
         from supriya.tools import synthdeftools
         from supriya.tools import ugentools
         flattened_ugens = []
+        seen_ugens = set()
         for ugen in ugens:
             recurse(ugen)
         return flattened_ugens
@@ -574,14 +684,12 @@ class SynthDef(ServerObjectProxy):
         for ugen in ugens:
             sort_bundle = sort_bundles[ugen]
             sort_bundle._initialize_topological_sort(sort_bundles)
-            sort_bundle.descendants[:] = sorted(
-                sort_bundles[ugen].descendants,
-                key=lambda x: ugens.index(ugen),
-                )
         return sort_bundles
 
     @staticmethod
     def _optimize_ugen_graph(ugens):
+        from supriya.tools import synthdeftools
+        ugens = synthdeftools.SynthDefOptimizer.optimize(ugens)
         sort_bundles = SynthDef._initialize_topological_sort(ugens)
         for ugen in ugens:
             ugen._optimize_graph(sort_bundles)
@@ -618,6 +726,22 @@ class SynthDef(ServerObjectProxy):
                 available_ugens, out_stack, sort_bundles)
         return out_stack
 
+    @staticmethod
+    def _write_atomically(file_path, contents):
+        directory_path = os.path.dirname(file_path)
+        if not os.path.exists(directory_path):
+            try:
+                os.makedirs(directory_path)
+            except OSError:
+                pass
+        file_descriptor, temporary_file_path = tempfile.mkstemp(
+            dir=directory_path)
+        with os.fdopen(file_descriptor, 'wb') as file_pointer:
+            file_pointer.write(contents)
+        if os.name == 'nt' and os.path.exists(file_path):
+            os.remove(file_path)
+        os.rename(temporary_file_path, file_path)
+
     ### PUBLIC METHODS ###
 
     def allocate(
@@ -629,9 +753,10 @@ class SynthDef(ServerObjectProxy):
 
     def compile(self):
         from supriya.tools.synthdeftools import SynthDefCompiler
-        synthdefs = [self]
-        result = SynthDefCompiler.compile_synthdefs(synthdefs)
-        return result
+        if self._compiled is None:
+            synthdefs = [self]
+            self._compiled = SynthDefCompiler.compile_synthdefs(synthdefs)
+        return self._compiled
 
     def free(self):
         from supriya.tools import requesttools
@@ -736,10 +861,11 @@ class SynthDef(ServerObjectProxy):
 
     @property
     def anonymous_name(self):
-        md5 = hashlib.md5()
-        md5.update(self._compiled_ugen_graph)
-        anonymous_name = md5.hexdigest()
-        return anonymous_name
+        if self._anonymous_name is None:
+            md5 = hashlib.md5()
+            md5.update(self._compiled_ugen_graph)
+            self._anonymous_name = md5.hexdigest()
+        return self._anonymous_name
 
     @property
     def audio_channel_count(self):
@@ -917,7 +1043,7 @@ class SynthDef(ServerObjectProxy):
 
     @property
     def has_gate(self):
-        return 'gate' in self.parameter_names
+        return self._has_gate
 
     @property
     def indexed_parameters(self):
@@ -937,18 +1063,40 @@ class SynthDef(ServerObjectProxy):
     def name(self):
         return self._name
 
+    @property
+    def optimized_ugen_count(self):
+        """
+        Gets number of ugens removed from synthdef's graph by optimization.
+
+        ::
+
+            >>> from supriya.tools import synthdeftools
+            >>> from supriya.tools import ugentools
+            >>> with synthdeftools.SynthDefBuilder() as builder:
+            ...     sin_one = ugentools.SinOsc.ar()
+            ...     sin_two = ugentools.SinOsc.ar()
+            ...     source = sin_one + sin_two
+            ...     out = ugentools.Out.ar(bus=0, source=source)
+            ...
+            >>> synthdef = builder.build()
+            >>> synthdef.optimized_ugen_count
+            1
+
+        Returns integer.
+        """
+        return self._optimized_ugen_count
+
     @property
     def output_ugens(self):
         return tuple(_ for _ in self.ugens if _.is_output_ugen)
 
     @property
     def parameters(self):
-        return {parameter.name: parameter
-            for index, parameter in self.indexed_parameters}
+        return self._parameters.copy()
 
     @property
     def parameter_names(self):
-        return [parameter.name for index, parameter in self.indexed_parameters]
+        return list(self._parameter_names)
 
     @property
     def ugens(self):
@@ -37,6 +37,7 @@ class SynthDefBuilder(SupriyaObject):
 
     __slots__ = (
         '_parameters',
+        '_ugen_set',
         '_ugens',
         )
 
@@ -51,6 +52,7 @@ class SynthDefBuilder(SupriyaObject):
         for key, value in kwargs.items():
             self.add_parameter(key, value)
         self._ugens = []
+        self._ugen_set = set()
 
     ### SPECIAL METHODS ###
 
@@ -124,7 +126,8 @@ class SynthDefBuilder(SupriyaObject):
             assert isinstance(ugen, prototype), type(ugen)
             if isinstance(ugen, synthdeftools.OutputProxy):
                 ugen = ugen.source
-            if ugen not in self._ugens:
+            if ugen not in self._ugen_set:
+                self._ugen_set.add(ugen)
                 self._ugens.append(ugen)
 
     def build(self, name=None, optimize=True):
@@ -99,13 +99,13 @@ class SynthDefCompiler(SupriyaObject):
         result = []
         if isinstance(input_, float):
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(0xffffffff))
-            constant_index = synthdef._constants.index(input_)
+            constant_index = synthdef._constant_indices[input_]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(
                 constant_index))
         elif isinstance(input_, synthdeftools.OutputProxy):
             ugen = input_.source
             output_index = input_.output_index
-            ugen_index = synthdef._ugens.index(ugen)
+            ugen_index = synthdef._ugen_indices[ugen]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(ugen_index))
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(output_index))
         else:
@@ -0,0 +1,266 @@
+# -*- encoding: utf-8 -*-
+from __future__ import division
+import math
+import struct
+from supriya.tools.systemtools.SupriyaObject import SupriyaObject
+
+
+class SynthDefOptimizer(SupriyaObject):
+    """
+    Optimizes ugen graphs.
+
+    ::
+
+        >>> from supriya.tools import synthdeftools
+        >>> from supriya.tools import ugentools
+        >>> with synthdeftools.SynthDefBuilder(frequency=440) as builder:
+        ...     sin_one = ugentools.SinOsc.ar(frequency=builder['frequency'])
+        ...     sin_two = ugentools.SinOsc.ar(frequency=builder['frequency'])
+        ...     source = (sin_one * 0.5) + (sin_two * 0.5)
+        ...     out = ugentools.Out.ar(bus=0, source=source)
+        ...
+        >>> synthdef = builder.build(name='optimized')
+
+    ::
+
+        >>> print(synthdef)
+        SynthDef optimized {
+            0_Control[0] -> 1_SinOsc[0:frequency]
+            const_0:0.0 -> 1_SinOsc[1:phase]
+            1_SinOsc[0] -> 2_BinaryOpUGen:MULTIPLICATION[0:left]
+            const_1:0.5 -> 2_BinaryOpUGen:MULTIPLICATION[1:right]
+            2_BinaryOpUGen:MULTIPLICATION[0] -> 3_BinaryOpUGen:ADDITION[0:left]
+            2_BinaryOpUGen:MULTIPLICATION[0] -> 3_BinaryOpUGen:ADDITION[1:right]
+            const_0:0.0 -> 4_Out[0:bus]
+            3_BinaryOpUGen:ADDITION[0] -> 4_Out[1:source]
+        }
+
+    ::
+
+        >>> synthdef.optimized_ugen_count
+        2
+
+    Binary and unary operators on constants are folded into constants,
+    algebraic identities such as ``x * 1`` and ``x + 0`` are removed, and
+    structurally identical side-effect-free ugens are merged. Random
+    operators, internally randomized ugens and ugens writing to buffers are
+    never merged.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'SynthDef Internals'
+
+    __slots__ = ()
+
+    _binary_folders = {
+        0: lambda a, b: a + b,  # ADDITION
+        1: lambda a, b: a - b,  # SUBTRACTION
+        2: lambda a, b: a * b,  # MULTIPLICATION
+        4: lambda a, b: a / b,  # FLOAT_DIVISION
+        12: lambda a, b: min(a, b),  # MINIMUM
+        13: lambda a, b: max(a, b),  # MAXIMUM
+        34: lambda a, b: a * a - b * b,  # DIFFERENCE_OF_SQUARES
+        35: lambda a, b: a * a + b * b,  # SUM_OF_SQUARES
+        36: lambda a, b: (a + b) ** 2,  # SQUARE_OF_SUM
+        37: lambda a, b: (a - b) ** 2,  # SQUARE_OF_DIFFERENCE
+        38: lambda a, b: abs(a - b),  # ABSOLUTE_DIFFERENCE
+        }
+
+    _unary_folders = {
+        0: lambda x: -x,  # NEGATIVE
+        5: lambda x: abs(x),  # ABSOLUTE_VALUE
+        12: lambda x: x * x,  # SQUARED
+        13: lambda x: x * x * x,  # CUBED
+        16: lambda x: 1 / x,  # RECIPROCAL
+        17: lambda x: 440. * 2 ** ((x - 69) / 12),  # MIDI_TO_HZ
+        18: lambda x: 12 * math.log(x / 440., 2) + 69,  # HZ_TO_MIDI
+        19: lambda x: 2 ** (x / 12),  # SEMITONES_TO_RATIO
+        20: lambda x: 12 * math.log(x, 2),  # RATIO_TO_SEMITONES
+        21: lambda x: 10 ** (x / 20),  # DB_TO_AMPLITUDE
+        22: lambda x: 20 * math.log10(x),  # AMPLITUDE_TO_DB
+        }
+
+    _random_binary_operators = frozenset((
+        47,  # RANDRANGE
+        48,  # EXPRANDRANGE
+        ))
+
+    _random_unary_operators = frozenset((
+        37,  # RAND
+        38,  # RAND2
+        39,  # LINRAND
+        40,  # BILINRAND
+        41,  # SUM3RAND
+        44,  # COIN
+        ))
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _build_postorder(ugens):
+        from supriya.tools import synthdeftools
+        visited = set()
+        postorder = []
+        for ugen in ugens:
+            if ugen in visited:
+                continue
+            visited.add(ugen)
+            stack = [(ugen, iter(ugen.inputs))]
+            while stack:
+                current, inputs = stack[-1]
+                for input_ in inputs:
+                    if not isinstance(input_, synthdeftools.OutputProxy):
+                        continue
+                    source = input_.source
+                    if source not in visited:
+                        visited.add(source)
+                        stack.append((source, iter(source.inputs)))
+                        break
+                else:
+                    stack.pop()
+                    postorder.append(current)
+        return postorder
+
+    @staticmethod
+    def _fold_constants(ugen):
+        from supriya.tools import ugentools
+        inputs = ugen.inputs
+        if not all(isinstance(_, float) for _ in inputs):
+            return None
+        if isinstance(ugen, ugentools.BinaryOpUGen):
+            folder = SynthDefOptimizer._binary_folders.get(
+                int(ugen.special_index))
+        elif isinstance(ugen, ugentools.UnaryOpUGen):
+            folder = SynthDefOptimizer._unary_folders.get(
+                int(ugen.special_index))
+        else:
+            return None
+        if folder is None:
+            return None
+        try:
+            value = float(folder(*inputs))
+        except (ArithmeticError, ValueError):
+            return None
+        if math.isinf(value) or math.isnan(value):
+            return None
+        return value
+
+    @staticmethod
+    def _get_merge_key(ugen):
+        from supriya.tools import synthdeftools
+        from supriya.tools import ugentools
+        pure_prototype = (
+            ugentools.MulAdd,
+            ugentools.PureMultiOutUGen,
+            ugentools.PureUGen,
+            ugentools.Sum3,
+            ugentools.Sum4,
+            )
+        impure_prototype = (
+            ugentools.BufAllpassN,  # writes to a shared buffer
+            ugentools.BufCombN,  # writes to a shared buffer
+            ugentools.BufDelayN,  # writes to a shared buffer
+            ugentools.Vibrato,  # randomizes its rate and depth internally
+            )
+        special_index = int(ugen.special_index)
+        if isinstance(ugen, ugentools.BinaryOpUGen):
+            if special_index in SynthDefOptimizer._random_binary_operators:
+                return None
+        elif isinstance(ugen, ugentools.UnaryOpUGen):
+            if special_index in SynthDefOptimizer._random_unary_operators:
+                return None
+        elif not isinstance(ugen, pure_prototype):
+            return None
+        elif isinstance(ugen, impure_prototype):
+            return None
+        inputs = []
+        for input_ in ugen.inputs:
+            if isinstance(input_, synthdeftools.OutputProxy):
+                inputs.append((id(input_.source), input_.output_index))
+            else:
+                # Constants compile to single-precision floats.
+                inputs.append(struct.pack('>f', input_))
+        return (
+            type(ugen),
+            int(ugen.calculation_rate),
+            special_index,
+            tuple(ugen._get_outputs()),
+            tuple(inputs),
+            )
+
+    @staticmethod
+    def _remove_identity(ugen):
+        from supriya.tools import synthdeftools
+        from supriya.tools import ugentools
+        if not isinstance(ugen, ugentools.BinaryOpUGen):
+            return None
+        operator = synthdeftools.BinaryOperator
+        left, right = ugen.inputs
+        special_index = int(ugen.special_index)
+        if special_index == operator.MULTIPLICATION:
+            if left == 0 or right == 0:
+                # Constants are scalar-rate, so only scalar products fold.
+                rate = synthdeftools.CalculationRate.SCALAR
+                if ugen.calculation_rate == rate:
+                    return 0.
+                return None
+            if left == 1:
+                return right
+            if right == 1:
+                return left
+        elif special_index == operator.ADDITION:
+            if left == 0:
+                return right
+            if right == 0:
+                return left
+        elif special_index == operator.SUBTRACTION:
+            if right == 0:
+                return left
+        elif special_index == operator.FLOAT_DIVISION:
+            if right == 1:
+                return left
+        return None
+
+    ### PUBLIC METHODS ###
+
+    @staticmethod
+    def optimize(ugens):
+        """
+        Folds constants, removes algebraic identities and merges identical
+        side-effect-free ugens in `ugens`.
+
+        Inputs of the remaining ugens are rewired in place.
+
+        Returns list of remaining ugens, in their original order.
+        """
+        from supriya.tools import synthdeftools
+        from supriya.tools import ugentools
+        replacements = {}
+        merge_keys = {}
+        for ugen in SynthDefOptimizer._build_postorder(ugens):
+            inputs = []
+            for input_ in ugen.inputs:
+                if isinstance(input_, synthdeftools.OutputProxy):
+                    source = input_.source
+                    if source in replacements:
+                        replacement = replacements[source]
+                        if isinstance(replacement, ugentools.UGen):
+                            replacement = replacement[input_.output_index]
+                        input_ = replacement
+                inputs.append(input_)
+            ugen._inputs = tuple(inputs)
+            replacement = SynthDefOptimizer._fold_constants(ugen)
+            if replacement is None:
+                replacement = SynthDefOptimizer._remove_identity(ugen)
+            if replacement is not None:
+                replacements[ugen] = replacement
+                continue
+            merge_key = SynthDefOptimizer._get_merge_key(ugen)
+            if merge_key is None:
+                continue
+            if merge_key in merge_keys:
+                replacements[ugen] = merge_keys[merge_key]
+            else:
+                merge_keys[merge_key] = ugen
+        return [_ for _ in ugens if _ not in replacements]
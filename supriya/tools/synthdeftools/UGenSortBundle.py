@@ -34,22 +34,21 @@ class UGenSortBundle(SupriyaObject):
                 input_ = input_.source
             elif not isinstance(input_, ugentools.UGen):
                 continue
-            input_sort_bundle = sort_bundles[input_]
+            # Antecedents and descendants are paired, so checking the
+            # (short) antecedents list suffices.
             if input_ not in self.antecedents:
                 self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+                sort_bundles[input_].descendants.append(self.ugen)
         for input_ in self.width_first_antecedents:
-            input_sort_bundle = sort_bundles[input_]
             if input_ not in self.antecedents:
                 self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+                sort_bundles[input_].descendants.append(self.ugen)
 
     def _make_available(self, available_ugens):
+        # A ugen's antecedents empty exactly once, so it cannot already be
+        # available.
         if not self.antecedents:
-            if self.ugen not in available_ugens:
-                available_ugens.append(self.ugen)
+            available_ugens.append(self.ugen)
 
     def _schedule(self, available_ugens, out_stack, sort_bundles):
         for ugen in reversed(self.descendants):
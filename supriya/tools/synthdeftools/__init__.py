@@ -3,9 +3,9 @@
 Tools for constructing and compiling synthesizer definitions (SynthDefs).
 """
 
-from abjad.tools import systemtools
+from supriya.tools.systemtools.LazyImportManager import LazyImportManager
 
-systemtools.ImportManager.import_structured_package(
+LazyImportManager.import_structured_package(
     __path__[0],
     globals(),
     )
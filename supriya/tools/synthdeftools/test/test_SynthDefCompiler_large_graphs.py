@@ -0,0 +1,50 @@
+# -*- encoding: utf-8 -*-
+import unittest
+from supriya.tools import synthdeftools
+from supriya.tools import ugentools
+
+
+class Test(unittest.TestCase):
+
+    def build_synthdef(self, oscillator_count):
+        with synthdeftools.SynthDefBuilder(
+            amplitude=0.1,
+            frequency=440,
+            ) as builder:
+            oscillators = []
+            for i in range(oscillator_count):
+                oscillator = ugentools.SinOsc.ar(
+                    frequency=builder['frequency'] * (i + 1),
+                    )
+                oscillators.append(oscillator * (1. / (i + 1)))
+            source = ugentools.Mix.new(oscillators) * builder['amplitude']
+            ugentools.Out.ar(bus=0, source=source)
+        return builder.build()
+
+    def test_indices(self):
+        synthdef = self.build_synthdef(50)
+        for i, ugen in enumerate(synthdef.ugens):
+            assert synthdef._ugen_indices[ugen] == i
+        for constant in synthdef.constants:
+            assert synthdef._constant_indices[constant] == \
+                synthdef.constants.index(constant)
+        assert len(synthdef.constants) == len(set(synthdef.constants))
+
+    def test_compile_is_cached(self):
+        synthdef = self.build_synthdef(10)
+        compiled = synthdef.compile()
+        assert synthdef.compile() is compiled
+        assert compiled == synthdeftools.SynthDefCompiler.compile_synthdefs(
+            [synthdef])
+        decompiled = synthdeftools.SynthDefDecompiler.decompile_synthdefs(
+            compiled)[0]
+        assert decompiled.compile() == compiled
+
+    def test_large_graph(self):
+        synthdef = self.build_synthdef(1000)
+        compiled = synthdef.compile()
+        assert len(synthdef.ugens) == 3335
+        assert len(synthdef.constants) == 1999
+        decompiled = synthdeftools.SynthDefDecompiler.decompile_synthdefs(
+            compiled)[0]
+        assert decompiled.compile() == compiled
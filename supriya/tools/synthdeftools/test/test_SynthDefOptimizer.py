@@ -0,0 +1,88 @@
+# -*- encoding: utf-8 -*-
+from abjad.tools import stringtools
+from supriya.tools import synthdeftools
+from supriya.tools import ugentools
+
+
+def test_SynthDefOptimizer_01():
+    r'''Operators on constants fold, cascading into identities.'''
+    with synthdeftools.SynthDefBuilder() as builder:
+        frequency = synthdeftools.UGenMethodMixin._compute_unary_op(
+            69., synthdeftools.UnaryOperator.MIDI_TO_HZ)
+        one = synthdeftools.UGenMethodMixin._compute_binary_op(
+            3., 2., synthdeftools.BinaryOperator.SUBTRACTION)
+        sine = ugentools.SinOsc.ar(frequency=frequency) * one
+        ugentools.Out.ar(bus=0, source=sine)
+    synthdef = builder.build()
+    assert str(synthdef) == stringtools.normalize('''
+        SynthDef d719856d7deff2696a3f807f5dc79809 {
+            const_0:440.0 -> 0_SinOsc[0:frequency]
+            const_1:0.0 -> 0_SinOsc[1:phase]
+            const_1:0.0 -> 1_Out[0:bus]
+            0_SinOsc[0] -> 1_Out[1:source]
+        }
+        ''')
+    assert synthdef.optimized_ugen_count == 3
+    unoptimized_synthdef = builder.build(optimize=False)
+    assert len(unoptimized_synthdef.ugens) == 5
+    assert unoptimized_synthdef.optimized_ugen_count == 0
+
+
+def test_SynthDefOptimizer_02():
+    r'''Identical pure ugens merge; random and impure ugens do not.'''
+    with synthdeftools.SynthDefBuilder(frequency=440) as builder:
+        sines = [
+            ugentools.SinOsc.ar(frequency=builder['frequency'].midi_to_hz())
+            for _ in range(3)
+            ]
+        noises = [ugentools.WhiteNoise.ar() for _ in range(2)]
+        randoms = [
+            synthdeftools.UGenMethodMixin._compute_unary_op(
+                sines[0], synthdeftools.UnaryOperator.RAND)
+            for _ in range(2)
+            ]
+        source = ugentools.Mix.new(sines + noises + randoms)
+        ugentools.Out.ar(bus=0, source=source)
+    synthdef = builder.build()
+    ugen_names = [type(_).__name__ for _ in synthdef.ugens]
+    assert ugen_names.count('SinOsc') == 1
+    assert ugen_names.count('WhiteNoise') == 2
+    assert ugen_names.count('UnaryOpUGen') == 3
+    assert synthdef.optimized_ugen_count == 4
+
+
+def test_SynthDefOptimizer_03():
+    r'''Internally randomized ugens do not merge.'''
+    with synthdeftools.SynthDefBuilder() as builder:
+        source = (
+            ugentools.Vibrato.ar(frequency=440) +
+            ugentools.Vibrato.ar(frequency=440)
+            )
+        ugentools.Out.ar(bus=0, source=source)
+    synthdef = builder.build()
+    ugen_names = [type(_).__name__ for _ in synthdef.ugens]
+    assert ugen_names.count('Vibrato') == 2
+    assert synthdef.optimized_ugen_count == 0
+
+
+def test_SynthDefOptimizer_04():
+    r'''Products with zero fold only when they are scalar-rate.'''
+    with synthdeftools.SynthDefBuilder() as builder:
+        zero = synthdeftools.UGenMethodMixin._compute_binary_op(
+            3., 3., synthdeftools.BinaryOperator.SUBTRACTION)
+        ugentools.Out.ar(bus=0, source=ugentools.WhiteNoise.ar() * zero)
+        ugentools.Out.ar(bus=1, source=ugentools.Rand.ir() * zero)
+    synthdef = builder.build()
+    assert str(synthdef) == stringtools.normalize('''
+        SynthDef de1d96714a93e07eacd6633efd2de0ce {
+            0_WhiteNoise[0] -> 1_BinaryOpUGen:MULTIPLICATION[0:left]
+            const_0:0.0 -> 1_BinaryOpUGen:MULTIPLICATION[1:right]
+            const_0:0.0 -> 2_Out[0:bus]
+            1_BinaryOpUGen:MULTIPLICATION[0] -> 2_Out[1:source]
+            const_0:0.0 -> 3_Rand[0:minimum]
+            const_1:1.0 -> 3_Rand[1:maximum]
+            const_1:1.0 -> 4_Out[0:bus]
+            const_0:0.0 -> 4_Out[1:source]
+        }
+        ''')
+    assert synthdef.optimized_ugen_count == 2
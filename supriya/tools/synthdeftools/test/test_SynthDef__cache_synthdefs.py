@@ -0,0 +1,58 @@
+# -*- encoding: utf-8 -*-
+import glob
+import os
+import shutil
+import tempfile
+from supriya.tools import synthdeftools
+from supriya.tools import ugentools
+
+
+def make_synthdef(oscillator_count):
+    with synthdeftools.SynthDefBuilder() as builder:
+        oscillators = [
+            ugentools.SinOsc.ar(frequency=100 + i)
+            for i in range(oscillator_count)
+            ]
+        ugentools.Out.ar(bus=0, source=ugentools.Mix.new(oscillators))
+    return builder.build()
+
+
+def test_SynthDef__cache_synthdefs_01():
+    directory_path = tempfile.mkdtemp()
+    try:
+        synthdef = make_synthdef(100)
+        file_path = synthdeftools.SynthDef._cache_synthdefs(
+            [synthdef], directory_path)
+        assert os.path.dirname(file_path) == directory_path
+        with open(file_path, 'rb') as file_pointer:
+            assert file_pointer.read() == synthdef.compile()
+        modification_time = os.path.getmtime(file_path)
+        os.utime(file_path, (0, 0))
+        assert synthdeftools.SynthDef._cache_synthdefs(
+            [make_synthdef(100)], directory_path) == file_path
+        assert os.path.getmtime(file_path) == 0
+        assert modification_time != 0
+    finally:
+        shutil.rmtree(directory_path)
+
+
+def test_SynthDef__cache_synthdefs_02():
+    directory_path = tempfile.mkdtemp()
+    try:
+        synthdefs = [make_synthdef(100), make_synthdef(101)]
+        glob_path = synthdeftools.SynthDef._cache_synthdefs(
+            synthdefs, directory_path)
+        assert glob_path.endswith('*.scsyndef')
+        file_paths = sorted(glob.glob(glob_path))
+        assert len(file_paths) == 2
+        compiled_synthdefs = []
+        for file_path in file_paths:
+            with open(file_path, 'rb') as file_pointer:
+                compiled_synthdefs.append(file_pointer.read())
+        assert sorted(compiled_synthdefs) == sorted(
+            _.compile() for _ in synthdefs)
+        assert synthdeftools.SynthDef._cache_synthdefs(
+            list(reversed(synthdefs)), directory_path) == glob_path
+        assert len(glob.glob(os.path.join(directory_path, '*.scsyndef'))) == 2
+    finally:
+        shutil.rmtree(directory_path)
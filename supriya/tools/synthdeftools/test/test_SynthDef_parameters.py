@@ -0,0 +1,39 @@
+# -*- encoding: utf-8 -*-
+from supriya.tools import synthdeftools
+from supriya.tools import ugentools
+
+
+def test_SynthDef_parameters_01():
+    with synthdeftools.SynthDefBuilder(
+        a_input=0,
+        frequency=(440, 443),
+        gate=1,
+        t_trigger=0,
+        ) as builder:
+        source = ugentools.SinOsc.ar(frequency=builder['frequency'])
+        source *= ugentools.Linen.kr(gate=builder['gate'])
+        source += builder['a_input'] * builder['t_trigger']
+        ugentools.Out.ar(bus=0, source=source)
+    synthdef = builder.build()
+    assert synthdef.parameter_names == [
+        'a_input', 'frequency', 'gate', 't_trigger',
+        ]
+    # Callers get copies, so the cached tables cannot be mutated.
+    synthdef.parameters.clear()
+    synthdef.parameter_names.append('foo')
+    assert sorted(synthdef.parameters) == synthdef.parameter_names
+    assert len(synthdef.parameter_names) == 4
+    assert synthdef.has_gate
+    assert synthdef._parameter_name_set == frozenset(synthdef.parameter_names)
+    assert synthdef._parameter_defaults == {
+        'a_input': 0.,
+        'frequency': (440., 443.),
+        'gate': 1.,
+        't_trigger': 0.,
+        }
+    assert synthdef._parameter_calculation_rates == {
+        name: synthdeftools.CalculationRate.from_input(parameter)
+        for name, parameter in synthdef.parameters.items()
+        }
+    assert not synthdeftools.SynthDef.from_ugens(
+        ugentools.Out.ar(source=ugentools.SinOsc.ar())).has_gate
@@ -6,6 +6,14 @@ from supriya.tools.systemtools.SupriyaObject import SupriyaObject
 
 
 class Dispatcher(SupriyaObject):
+    """
+    Abstract base class for dispatchers.
+
+    Callbacks are stored in a map from dispatch key to a tuple of callbacks.
+    Registering and unregistering replace the map rather than mutating it,
+    so dispatching reads the current map without taking the lock. The lock
+    only serializes writers, and the consumption of one-shot callbacks.
+    """
 
     ### CLASS VARIABLES ###
 
@@ -31,13 +39,14 @@ class Dispatcher(SupriyaObject):
             print('RECV', type(self))
             for line in repr(input_).splitlines():
                 print('    ' + line)
-        with self.lock:
-            for x in input_:
-                callbacks = self._collect_callbacks(x)
-                for callback in callbacks:
-                    callback_pairs.append((callback, x))
-                    if callback.is_one_shot:
-                        self._unregister_one_callback(callback)
+        for x in input_:
+            for callback in self._collect_callbacks(x):
+                if callback.is_one_shot:
+                    with self.lock:
+                        if not self._unregister_one_callback(callback):
+                            # Already consumed by another dispatch.
+                            continue
+                callback_pairs.append((callback, x))
         for callback, x in callback_pairs:
             callback(x)
 
@@ -48,36 +57,51 @@ class Dispatcher(SupriyaObject):
         raise NotImplementedError
 
     def _collect_callbacks(self, expr):
+        callback_map = self._callback_map
         callbacks = []
-        for callback in self._callback_map.get(None, []):
-            if callback not in callbacks:
-                if callback.matches(expr):
-                    callbacks.append(callback)
-        for callback in self._callback_map.get(type(expr), []):
-            if callback not in callbacks:
+        seen = set()
+        for key in self._get_input_keys(expr):
+            for callback in callback_map.get(key, ()):
+                if id(callback) in seen:
+                    continue
+                seen.add(id(callback))
                 if callback.matches(expr):
                     callbacks.append(callback)
         return callbacks
 
+    def _get_callback_keys(self, callback):
+        return tuple(callback.prototype)
+
+    def _get_input_keys(self, expr):
+        return (None, type(expr))
+
     def _unregister_one_callback(self, callback):
-        prototype = callback.prototype
-        for class_ in prototype:
-            if class_ in self._callback_map:
-                if callback in self._callback_map[class_]:
-                    self._callback_map[class_].remove(callback)
-                if not self._callback_map[class_]:
-                    del(self._callback_map[class_])
+        callback_map = None
+        for key in self._get_callback_keys(callback):
+            callbacks = self._callback_map.get(key, ())
+            if callback not in callbacks:
+                continue
+            if callback_map is None:
+                callback_map = self._callback_map.copy()
+            callbacks = tuple(x for x in callbacks if x is not callback)
+            if callbacks:
+                callback_map[key] = callbacks
+            else:
+                del(callback_map[key])
+        if callback_map is None:
+            return False
+        self._callback_map = callback_map
+        return True
 
     ### PUBLIC METHODS ###
 
     def register_callback(self, callback):
         assert isinstance(callback, self.callback_class)
-        prototype = callback.prototype
         with self.lock:
-            for class_ in prototype:
-                if class_ not in self._callback_map:
-                    self._callback_map[class_] = []
-                self._callback_map[class_].append(callback)
+            callback_map = self._callback_map.copy()
+            for key in self._get_callback_keys(callback):
+                callback_map[key] = callback_map.get(key, ()) + (callback,)
+            self._callback_map = callback_map
 
     def unregister_callback(self, callback):
         assert isinstance(callback, self.callback_class)
@@ -0,0 +1,181 @@
+# -*- encoding: utf-8 -*-
+import importlib
+import os
+import sys
+import types
+from supriya.tools.systemtools.SupriyaObject import SupriyaObject
+
+
+class LazyImportManager(SupriyaObject):
+    """
+    Imports structured packages, optionally on demand.
+
+    By default, packages are imported eagerly through abjad's
+    ``ImportManager``.
+
+    When the ``SUPRIYA_LAZY_IMPORT`` environment variable is set to a value
+    other than ``0``, each package instead indexes the modules and
+    subpackages on its path by name, and imports one the first time its
+    name is looked up on the package. Touching ``ugentools.SinOsc`` then
+    loads ``SinOsc`` and its dependencies, rather than every ugen.
+
+    Lazy import requires assignable module classes, available from Python
+    3.5. Earlier interpreters import eagerly regardless.
+    """
+
+    ### CLASS VARIABLES ###
+
+    _environment_variable = 'SUPRIYA_LAZY_IMPORT'
+
+    _ignored_directory_names = ('.git', '.svn', '__pycache__', 'test')
+
+    class LazyModule(types.ModuleType):
+
+        def __dir__(self):
+            names = set(self.__dict__)
+            names.update(self.__dict__.get('_lazy_index', ()))
+            return sorted(names)
+
+        def __getattr__(self, name):
+            index = self.__dict__.get('_lazy_index', {})
+            if name not in index:
+                message = 'module {!r} has no attribute {!r}'
+                message = message.format(self.__name__, name)
+                raise AttributeError(message)
+            module_name, attribute_name = index[name]
+            module = importlib.import_module(module_name)
+            if attribute_name is None:
+                value = module
+            elif hasattr(module, attribute_name):
+                value = getattr(module, attribute_name)
+            else:
+                message = 'module {!r} has no attribute {!r}'
+                message = message.format(self.__name__, name)
+                raise AttributeError(message)
+            types.ModuleType.__setattr__(self, name, value)
+            return value
+
+        def __setattr__(self, name, value):
+            # The import system binds each imported submodule onto its
+            # package. Bind the submodule's eponymous object instead, as
+            # eager import does.
+            index = self.__dict__.get('_lazy_index', {})
+            module_name, attribute_name = index.get(name, (None, None))
+            if (
+                attribute_name is not None and
+                isinstance(value, types.ModuleType) and
+                value.__name__ == module_name
+                ):
+                if not hasattr(value, attribute_name):
+                    return
+                value = getattr(value, attribute_name)
+            types.ModuleType.__setattr__(self, name, value)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _index_path(path, package_name, ignored_names=None):
+        index = {}
+        ignored_names = ignored_names or ()
+        for name in os.listdir(path):
+            if name in ignored_names or name.startswith(('.', '_')):
+                continue
+            if name in LazyImportManager._ignored_directory_names:
+                continue
+            full_path = os.path.join(path, name)
+            if os.path.isfile(full_path):
+                if not name.endswith('.py'):
+                    continue
+                name = name[:-3]
+                module_name = '.'.join((package_name, name))
+                index[name] = (module_name, name)
+            elif os.path.exists(os.path.join(full_path, '__init__.py')):
+                module_name = '.'.join((package_name, name))
+                index[name] = (module_name, None)
+        return index
+
+    @staticmethod
+    def _install_index(namespace, index):
+        module = sys.modules[namespace['__name__']]
+        if not isinstance(module, LazyImportManager.LazyModule):
+            try:
+                module.__class__ = LazyImportManager.LazyModule
+            except TypeError:
+                return False
+        if '__all__' in namespace:
+            names = set(namespace['__all__'])
+        else:
+            names = set(x for x in namespace if not x.startswith('_'))
+        names.update(index)
+        names.discard(LazyImportManager.__name__)
+        namespace['__all__'] = sorted(names)
+        namespace.setdefault('_lazy_index', {}).update(index)
+        return True
+
+    ### PUBLIC METHODS ###
+
+    @staticmethod
+    def import_names(namespace, index):
+        """
+        Imports `index`, a mapping of names to pairs of module name and
+        attribute name, into `namespace`.
+
+        An attribute name of none imports the module itself.
+
+        Returns none.
+        """
+        is_lazy = False
+        if LazyImportManager.is_lazy():
+            is_lazy = LazyImportManager._install_index(namespace, index)
+        if not is_lazy:
+            for name, (module_name, attribute_name) in sorted(index.items()):
+                module = importlib.import_module(module_name)
+                if attribute_name is None:
+                    namespace[name] = module
+                else:
+                    namespace[name] = getattr(module, attribute_name)
+        if LazyImportManager.__name__ in namespace:
+            del(namespace[LazyImportManager.__name__])
+
+    @staticmethod
+    def import_structured_package(
+        path,
+        namespace,
+        delete_systemtools=True,
+        ignored_names=None,
+        ):
+        """
+        Imports public names from `path` into `namespace`.
+
+        Returns none.
+        """
+        is_lazy = False
+        if LazyImportManager.is_lazy():
+            index = LazyImportManager._index_path(
+                path,
+                namespace['__name__'],
+                ignored_names=ignored_names,
+                )
+            is_lazy = LazyImportManager._install_index(namespace, index)
+        if not is_lazy:
+            from abjad.tools import systemtools
+            systemtools.ImportManager.import_structured_package(
+                path,
+                namespace,
+                delete_systemtools=delete_systemtools,
+                ignored_names=ignored_names,
+                )
+        if delete_systemtools and 'systemtools' in namespace:
+            del(namespace['systemtools'])
+        if LazyImportManager.__name__ in namespace:
+            del(namespace[LazyImportManager.__name__])
+
+    @staticmethod
+    def is_lazy():
+        """
+        Is true when lazy import is requested. Otherwise false.
+
+        Returns boolean.
+        """
+        value = os.environ.get(LazyImportManager._environment_variable, '')
+        return value not in ('', '0')
@@ -46,6 +46,13 @@ class SupriyaConfiguration(Configuration):
             'output'
             )
 
+    @property
+    def render_cache_directory(self):
+        return os.path.join(
+            self.configuration_directory_path,
+            'render_cache'
+            )
+
     @property
     def scsynth_path(self):
         from abjad.tools import systemtools
@@ -60,3 +67,10 @@ class SupriyaConfiguration(Configuration):
                     scsynth_path = path
                     found_scsynth = True
         return scsynth_path
+
+    @property
+    def synthdef_cache_directory(self):
+        return os.path.join(
+            self.configuration_directory_path,
+            'synthdef_cache'
+            )
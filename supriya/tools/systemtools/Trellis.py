@@ -81,6 +81,30 @@ class Trellis(SupriyaObject):
                 return False
         return True
 
+    def levels(self):
+        """
+        Groups elements into levels, each depending only on earlier levels.
+
+        Elements without children come first. Elements within a level do
+        not depend on one another.
+
+        Returns list of lists.
+        """
+        levels = []
+        trellis = self.copy()
+        while len(trellis):
+            level = [
+                parent
+                for parent, children in trellis._parents_to_children.items()
+                if not children
+                ]
+            if not level:
+                raise ValueError('Trellis contains cycles.')
+            for expr in level:
+                trellis.remove(expr)
+            levels.append(level)
+        return levels
+
     def parents(self, expr):
         if expr not in self:
             raise ValueError('{!r} not in {}'.format(expr, type(self)))
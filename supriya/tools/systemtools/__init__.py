@@ -7,6 +7,7 @@ Low-level system tools and various base classes.
 from supriya.tools.systemtools.Assets import Assets
 from supriya.tools.systemtools.Dispatcher import Dispatcher
 from supriya.tools.systemtools.Enumeration import Enumeration
+from supriya.tools.systemtools.LazyImportManager import LazyImportManager
 from supriya.tools.systemtools.PubSub import PubSub
 from supriya.tools.systemtools.SupriyaConfiguration import SupriyaConfiguration
 from supriya.tools.systemtools.SupriyaObject import SupriyaObject
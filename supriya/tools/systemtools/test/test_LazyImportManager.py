@@ -0,0 +1,54 @@
+# -*- encoding: utf-8 -*-
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+
+class Test(unittest.TestCase):
+
+    script = '\n'.join((
+        'import json, sys',
+        'import supriya',
+        'from supriya import ugentools',
+        'ugentools.SinOsc',
+        'names = [x for x in sys.modules if x.startswith("supriya.")]',
+        'print(json.dumps(names))',
+        ))
+
+    def run_script(self, is_lazy):
+        environment = os.environ.copy()
+        environment['SUPRIYA_LAZY_IMPORT'] = '1' if is_lazy else '0'
+        output = subprocess.check_output(
+            [sys.executable, '-c', self.script],
+            env=environment,
+            )
+        output = output.decode('utf-8').splitlines()[-1]
+        return json.loads(output)
+
+    def test_01(self):
+        lazy_names = self.run_script(is_lazy=True)
+        eager_names = self.run_script(is_lazy=False)
+        assert 'supriya.tools.ugentools.SinOsc' in lazy_names
+        assert 'supriya.tools.ugentools.Pan2' not in lazy_names
+        assert 'supriya.tools.nonrealtimetools.Session' not in lazy_names
+        assert len(lazy_names) < 100
+        assert len(lazy_names) * 4 < len(eager_names)
+
+    def test_02(self):
+        script = '\n'.join((
+            'import supriya',
+            'from supriya import servertools, ugentools',
+            'from supriya.tools.ugentools.Out import Out',
+            'assert ugentools.Out is Out',
+            'assert issubclass(ugentools.SinOsc, ugentools.UGen)',
+            'assert supriya.Server is servertools.Server',
+            'assert "Pan2" in dir(ugentools)',
+            'assert not hasattr(ugentools, "Nonexistent")',
+            'from supriya.tools.ugentools import *',
+            'assert isinstance(Pan2, type)',
+            ))
+        environment = os.environ.copy()
+        environment['SUPRIYA_LAZY_IMPORT'] = '1'
+        subprocess.check_call([sys.executable, '-c', script], env=environment)
@@ -129,6 +129,20 @@ class TestCase(unittest.TestCase):
         trellis.remove('B')
         assert trellis.is_acyclic()
 
+    def test_levels(self):
+        trellis = systemtools.Trellis()
+        trellis.add('A')
+        trellis.add('B', parent='A')
+        trellis.add('C', parent='A')
+        trellis.add('D', parent='B')
+        trellis.add('D', parent='C')
+        trellis.add('E', parent='A')
+        assert trellis.levels() == [['D', 'E'], ['B', 'C'], ['A']]
+        assert len(trellis) == 5
+        trellis.add('A', parent='D')
+        with self.assertRaises(ValueError):
+            trellis.levels()
+
     def test_parents(self):
         trellis = systemtools.Trellis()
         trellis.add('B', parent='A')
@@ -19,6 +19,7 @@ class TimespanCollection(SupriyaObject):
         ...     )
         >>> timespan_collection = timetools.TimespanCollection(timespans)
 
+    Timespans passed on instantiation are bulk-loaded into a balanced tree.
     """
 
     ### CLASS VARIABLES ###
@@ -35,7 +36,7 @@ class TimespanCollection(SupriyaObject):
         ):
         self._root_node = None
         if timespans is not None and timespans:
-            self.insert(timespans)
+            self._bulk_load(timespans)
 
     ### SPECIAL METHODS ###
 
@@ -112,41 +113,50 @@ class TimespanCollection(SupriyaObject):
         Returns timespan or timespans.
         """
         def recurse_by_index(node, index):
-            if node.node_start_index <= index < node.node_stop_index:
-                return node.payload[index - node.node_start_index]
-            elif node.left_child and index < node.node_start_index:
+            node_start_index = self._get_left_count(node)
+            node_stop_index = node_start_index + len(node.payload)
+            if node_start_index <= index < node_stop_index:
+                return node.payload[index - node_start_index]
+            elif node.left_child and index < node_start_index:
                 return recurse_by_index(node.left_child, index)
-            elif node.right_child and node.node_stop_index <= index:
-                return recurse_by_index(node.right_child, index)
+            elif node.right_child and node_stop_index <= index:
+                return recurse_by_index(
+                    node.right_child, index - node_stop_index)
 
         def recurse_by_slice(node, start, stop):
             result = []
             if node is None:
                 return result
-            if start < node.node_start_index and node.left_child:
+            node_start_index = self._get_left_count(node)
+            node_stop_index = node_start_index + len(node.payload)
+            if start < node_start_index and node.left_child:
                 result.extend(recurse_by_slice(node.left_child, start, stop))
-            if start < node.node_stop_index and node.node_start_index < stop:
-                node_start = start - node.node_start_index
+            if start < node_stop_index and node_start_index < stop:
+                node_start = start - node_start_index
                 if node_start < 0:
                     node_start = 0
-                node_stop = stop - node.node_start_index
+                node_stop = stop - node_start_index
                 result.extend(node.payload[node_start:node_stop])
-            if node.node_stop_index <= stop and node.right_child:
-                result.extend(recurse_by_slice(node.right_child, start, stop))
+            if node_stop_index <= stop and node.right_child:
+                result.extend(recurse_by_slice(
+                    node.right_child,
+                    start - node_stop_index,
+                    stop - node_stop_index,
+                    ))
             return result
 
         if isinstance(i, int):
             if self._root_node is None:
                 raise IndexError
             if i < 0:
-                i = self._root_node.subtree_stop_index + i
-            if i < 0 or self._root_node.subtree_stop_index <= i:
+                i = self._root_node.subtree_count + i
+            if i < 0 or self._root_node.subtree_count <= i:
                 raise IndexError
             return recurse_by_index(self._root_node, i)
         elif isinstance(i, slice):
             if self._root_node is None:
                 return []
-            indices = i.indices(self._root_node.subtree_stop_index)
+            indices = i.indices(self._root_node.subtree_count)
             start, stop = indices[0], indices[1]
             return recurse_by_slice(self._root_node, start, stop)
 
@@ -217,7 +227,7 @@ class TimespanCollection(SupriyaObject):
         """
         if self._root_node is None:
             return 0
-        return self._root_node.subtree_stop_index
+        return self._root_node.subtree_count
 
     def __setitem__(self, i, new):
         """
@@ -301,6 +311,34 @@ class TimespanCollection(SupriyaObject):
 
     ### PRIVATE METHODS ###
 
+    def _bulk_load(self, timespans):
+        from supriya.tools import timetools
+
+        def recurse(start, stop):
+            if stop <= start:
+                return None
+            middle = (start + stop) // 2
+            node = timetools.TimespanCollectionNode(start_offsets[middle])
+            node._payload = payloads[middle]
+            node._left_child = recurse(start, middle)
+            node._right_child = recurse(middle + 1, stop)
+            node._update()
+            return node
+
+        if self._is_timespan(timespans):
+            timespans = [timespans]
+        timespans = sorted(
+            (_ for _ in timespans if self._is_timespan(_)),
+            key=lambda x: (x.start_offset, x.stop_offset),
+            )
+        start_offsets, payloads = [], []
+        for timespan in timespans:
+            if not start_offsets or start_offsets[-1] != timespan.start_offset:
+                start_offsets.append(timespan.start_offset)
+                payloads.append([])
+            payloads[-1].append(timespan)
+        self._root_node = recurse(0, len(start_offsets))
+
     def _get_format_specification(self):
         from abjad.tools import systemtools
         return systemtools.FormatSpecification(
@@ -319,6 +357,12 @@ class TimespanCollection(SupriyaObject):
             node.right_child = self._insert_node(node.right_child, start_offset)
         return self._rebalance(node)
 
+    @staticmethod
+    def _get_left_count(node):
+        if node.left_child is None:
+            return 0
+        return node.left_child.subtree_count
+
     def _insert_timespan(self, timespan):
         self._root_node = self._insert_node(
             self._root_node,
@@ -327,6 +371,7 @@ class TimespanCollection(SupriyaObject):
         node = self._search(self._root_node, timespan.start_offset)
         node.payload.append(timespan)
         node.payload.sort(key=lambda x: x.stop_offset)
+        self._update_path(timespan.start_offset)
 
     @staticmethod
     def _is_timespan(expr):
@@ -390,6 +435,8 @@ class TimespanCollection(SupriyaObject):
                 self._root_node,
                 start_offset,
                 )
+        else:
+            self._update_path(start_offset)
         if isinstance(timespan, TimespanCollection):
             timespan._parents.remove(self)
 
@@ -425,66 +472,21 @@ class TimespanCollection(SupriyaObject):
                 return self._search(node.right_child, start_offset)
         return None
 
-    def _update_indices(
-        self,
-        node,
-        ):
-        def recurse(
-            node,
-            parent_stop_index=None,
-            ):
-            if node is None:
-                return
-            if node.left_child is not None:
-                recurse(
-                    node.left_child,
-                    parent_stop_index=parent_stop_index,
-                    )
-                node._node_start_index = node.left_child.subtree_stop_index
-                node._subtree_start_index = node.left_child.subtree_start_index
-            elif parent_stop_index is None:
-                node._node_start_index = 0
-                node._subtree_start_index = 0
+    def _update_path(self, start_offset):
+        # Refreshes subtree counts and stop offset bounds on the path from the
+        # root to the node starting at `start_offset`, bottom-up.
+        path = []
+        node = self._root_node
+        while node is not None:
+            path.append(node)
+            if start_offset < node.start_offset:
+                node = node.left_child
+            elif node.start_offset < start_offset:
+                node = node.right_child
             else:
-                node._node_start_index = parent_stop_index
-                node._subtree_start_index = parent_stop_index
-            node._node_stop_index = node.node_start_index + len(node.payload)
-            node._subtree_stop_index = node.node_stop_index
-            if node.right_child is not None:
-                recurse(
-                    node.right_child,
-                    parent_stop_index=node.node_stop_index,
-                    )
-                node._subtree_stop_index = node.right_child.subtree_stop_index
-        recurse(node)
-
-    def _update_offsets(
-        self,
-        node,
-        ):
-        if node is None:
-            return
-        stop_offset_low = min(x.stop_offset for x in node.payload)
-        stop_offset_high = max(x.stop_offset for x in node.payload)
-        if node.left_child:
-            left_child = self._update_offsets(
-                node.left_child,
-                )
-            if left_child.stop_offset_low < stop_offset_low:
-                stop_offset_low = left_child.stop_offset_low
-            if stop_offset_high < left_child.stop_offset_high:
-                stop_offset_high = left_child.stop_offset_high
-        if node.right_child:
-            right_child = self._update_offsets(
-                node.right_child,
-                )
-            if right_child.stop_offset_low < stop_offset_low:
-                stop_offset_low = right_child.stop_offset_low
-            if stop_offset_high < right_child.stop_offset_high:
-                stop_offset_high = right_child.stop_offset_high
-        node._stop_offset_low = stop_offset_low
-        node._stop_offset_high = stop_offset_high
-        return node
+                break
+        for node in reversed(path):
+            node._update()
 
     ### PUBLIC METHODS ###
 
@@ -637,6 +639,31 @@ class TimespanCollection(SupriyaObject):
             )
         return simultaneity
 
+    def get_snapshot(self):
+        """
+        Gets a columnar snapshot of this timespan collection.
+
+        ::
+
+            >>> timespans = (
+            ...     timespantools.Timespan(0, 3),
+            ...     timespantools.Timespan(1, 3),
+            ...     timespantools.Timespan(1, 2),
+            ...     timespantools.Timespan(2, 5),
+            ...     timespantools.Timespan(6, 9),
+            ...     )
+            >>> timespan_collection = timetools.TimespanCollection(timespans)
+            >>> snapshot = timespan_collection.get_snapshot()
+            >>> len(snapshot)
+            5
+
+        The snapshot does not reflect later changes to this collection.
+
+        Returns timespan collection snapshot.
+        """
+        from supriya.tools import timetools
+        return timetools.TimespanCollectionSnapshot(self)
+
     def get_start_offset_after(self, offset):
         """
         Gets start offst in this timespan collection after `offset`.
@@ -752,7 +779,15 @@ class TimespanCollection(SupriyaObject):
         node = self._search(self._root_node, timespan.start_offset)
         if node is None or timespan not in node.payload:
             raise ValueError('{} not in timespan collection.'.format(timespan))
-        index = node.payload.index(timespan) + node.node_start_index
+        index = node.payload.index(timespan) + self._get_left_count(node)
+        current_node = self._root_node
+        while current_node is not node:
+            if timespan.start_offset < current_node.start_offset:
+                current_node = current_node.left_child
+            else:
+                index += self._get_left_count(current_node)
+                index += len(current_node.payload)
+                current_node = current_node.right_child
         return index
 
     def insert(self, timespans):
@@ -783,12 +818,83 @@ class TimespanCollection(SupriyaObject):
         """
         if self._is_timespan(timespans):
             timespans = [timespans]
+        if self._root_node is None:
+            self._bulk_load(timespans)
+            return
         for timespan in timespans:
             if not self._is_timespan(timespan):
                 continue
             self._insert_timespan(timespan)
-        self._update_indices(self._root_node)
-        self._update_offsets(self._root_node)
+
+    def iterate_offset_sweep(self, offsets):
+        """
+        Iterates timespans starting, stopping and overlapping each of
+        `offsets`, in one sweep.
+
+        ::
+
+            >>> timespans = (
+            ...     timespantools.Timespan(0, 3),
+            ...     timespantools.Timespan(1, 3),
+            ...     timespantools.Timespan(1, 2),
+            ...     timespantools.Timespan(2, 5),
+            ...     timespantools.Timespan(6, 9),
+            ...     )
+            >>> timespan_collection = timetools.TimespanCollection(timespans)
+
+        ::
+
+            >>> for offset, starting, stopping, overlapping in \\
+            ...     timespan_collection.iterate_offset_sweep([1, 3]):
+            ...     offset, len(starting), len(stopping), len(overlapping)
+            ...
+            (1, 2, 0, 1)
+            (3, 0, 2, 1)
+
+        Equivalent to calling ``find_timespans_starting_at()``,
+        ``find_timespans_stopping_at()`` and
+        ``find_timespans_overlapping_offset()`` at each offset, in ascending
+        offset order, but walks the collection only once.
+
+        Returns generator of (offset, starting, stopping, overlapping)
+        tuples.
+        """
+        import heapq
+        # Heap entries are (stop offset, collection index, timespan); the
+        # index breaks ties and restores collection order.
+        iterator = enumerate(self)
+        pending = next(iterator, None)
+        active = []
+        previous_offset = None
+        for offset in sorted(offsets):
+            # Offsets may compare equal without hashing equal.
+            if previous_offset is not None and offset == previous_offset:
+                continue
+            previous_offset = offset
+            starting = []
+            while pending is not None and pending[1].start_offset <= offset:
+                index, timespan = pending
+                if timespan.start_offset == offset:
+                    starting.append(pending)
+                else:
+                    heapq.heappush(
+                        active, (timespan.stop_offset, index, timespan))
+                pending = next(iterator, None)
+            stopping = []
+            while active and active[0][0] <= offset:
+                stop_offset, index, timespan = heapq.heappop(active)
+                if stop_offset == offset:
+                    stopping.append((index, timespan))
+            stopping.sort(key=lambda x: x[0])
+            stopping.extend(x for x in starting if x[1].stop_offset == offset)
+            yield (
+                offset,
+                tuple(x for _, x in starting),
+                tuple(x for _, x in stopping),
+                tuple(x for _, _, x in sorted(active, key=lambda x: x[1])),
+                )
+            for index, timespan in starting:
+                heapq.heappush(active, (timespan.stop_offset, index, timespan))
 
     def iterate_simultaneities(
         self,
@@ -947,8 +1053,6 @@ class TimespanCollection(SupriyaObject):
             if not self._is_timespan(timespan):
                 continue
             self._remove_timespan(timespan)
-        self._update_indices(self._root_node)
-        self._update_offsets(self._root_node)
 
     ### PUBLIC PROPERTIES ###
 
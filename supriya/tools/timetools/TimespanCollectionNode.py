@@ -14,15 +14,12 @@ class TimespanCollectionNode(SupriyaObject):
         '_balance',
         '_height',
         '_left_child',
-        '_node_start_index',
-        '_node_stop_index',
         '_payload',
         '_right_child',
         '_start_offset',
         '_stop_offset_high',
         '_stop_offset_low',
-        '_subtree_start_index',
-        '_subtree_stop_index',
+        '_subtree_count',
         )
 
     ### INITIALIZER ###
@@ -31,15 +28,12 @@ class TimespanCollectionNode(SupriyaObject):
         self._balance = 0
         self._height = 0
         self._left_child = None
-        self._node_start_index = -1
-        self._node_stop_index = -1
         self._payload = []
         self._right_child = None
         self._start_offset = start_offset
         self._stop_offset_high = None
         self._stop_offset_low = None
-        self._subtree_start_index = -1
-        self._subtree_stop_index = -1
+        self._subtree_count = 0
 
     ### SPECIAL METHODS ###
 
@@ -47,12 +41,9 @@ class TimespanCollectionNode(SupriyaObject):
         """
         Gets the repr of this timespan collection node.
         """
-        return '<Node: Start:{} Indices:({}:{}:{}:{}) Length:{{{}}}>'.format(
+        return '<Node: Start:{} Count:{} Length:{{{}}}>'.format(
             self.start_offset,
-            self.subtree_start_index,
-            self.node_start_index,
-            self.node_stop_index,
-            self.subtree_stop_index,
+            self.subtree_count,
             len(self.payload),
             )
 
@@ -77,12 +68,33 @@ class TimespanCollectionNode(SupriyaObject):
     def _update(self):
         left_height = -1
         right_height = -1
-        if self.left_child is not None:
-            left_height = self.left_child.height
-        if self.right_child is not None:
-            right_height = self.right_child.height
+        subtree_count = len(self._payload)
+        stop_offset_low = stop_offset_high = None
+        if self._payload:
+            # Payloads are kept sorted by stop offset.
+            stop_offset_low = self._payload[0].stop_offset
+            stop_offset_high = self._payload[-1].stop_offset
+        for child in (self._left_child, self._right_child):
+            if child is None:
+                continue
+            subtree_count += child._subtree_count
+            if child._stop_offset_low is None:
+                continue
+            if stop_offset_low is None or \
+                child._stop_offset_low < stop_offset_low:
+                stop_offset_low = child._stop_offset_low
+            if stop_offset_high is None or \
+                stop_offset_high < child._stop_offset_high:
+                stop_offset_high = child._stop_offset_high
+        if self._left_child is not None:
+            left_height = self._left_child._height
+        if self._right_child is not None:
+            right_height = self._right_child._height
         self._height = max(left_height, right_height) + 1
         self._balance = right_height - left_height
+        self._stop_offset_high = stop_offset_high
+        self._stop_offset_low = stop_offset_low
+        self._subtree_count = subtree_count
         return self.height
 
     ### PUBLIC PROPERTIES ###
@@ -113,20 +125,6 @@ class TimespanCollectionNode(SupriyaObject):
         self._left_child = node
         self._update()
 
-    @property
-    def node_start_index(self):
-        """
-        Gets the node start index of this timespan collection node.
-        """
-        return self._node_start_index
-
-    @property
-    def node_stop_index(self):
-        """
-        Gets the node stop index of this timespan collection node.
-        """
-        return self._node_stop_index
-
     @property
     def payload(self):
         """
@@ -170,20 +168,12 @@ class TimespanCollectionNode(SupriyaObject):
         return self._stop_offset_low
 
     @property
-    def subtree_start_index(self):
-        """
-        Gets the start index of the subtree rooted on this timespan
-        collection node.
-        """
-        return self._subtree_start_index
-
-    @property
-    def subtree_stop_index(self):
+    def subtree_count(self):
         """
-        Gets the stop index of the subtree rooted on this timespan
+        Gets the number of timespans in the subtree rooted on this timespan
         collection node.
         """
-        return self._subtree_stop_index
+        return self._subtree_count
 
     @property
     def timespan(self):
@@ -0,0 +1,183 @@
+# -*- encoding: utf-8 -*-
+from supriya.tools.systemtools.SupriyaObject import SupriyaObject
+
+
+class TimespanCollectionSnapshot(SupriyaObject):
+    """
+    An immutable columnar snapshot of timespans.
+
+    ::
+
+        >>> from abjad import timespantools
+        >>> from supriya import timetools
+        >>> timespans = (
+        ...     timespantools.Timespan(0, 3),
+        ...     timespantools.Timespan(1, 3),
+        ...     timespantools.Timespan(1, 2),
+        ...     timespantools.Timespan(2, 5),
+        ...     timespantools.Timespan(6, 9),
+        ...     )
+        >>> snapshot = timetools.TimespanCollectionSnapshot(timespans)
+
+    ::
+
+        >>> for x in snapshot.find_timespans_overlapping_offset(1.5):
+        ...     x
+        ...
+        Timespan(start_offset=Offset(0, 1), stop_offset=Offset(3, 1))
+        Timespan(start_offset=Offset(1, 1), stop_offset=Offset(2, 1))
+        Timespan(start_offset=Offset(1, 1), stop_offset=Offset(3, 1))
+
+    Start and stop offsets are held in NumPy arrays, sorted by start offset,
+    and queries narrow their candidates with ``searchsorted()`` and array
+    comparisons rather than tree recursion. Candidates are then checked
+    against the exact offsets, so results match those of
+    ``TimespanCollection``.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_sorted_stop_offsets',
+        '_start_offsets',
+        '_stop_offsets',
+        '_stop_order',
+        '_timespans',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, timespans=None):
+        import numpy
+        timespans = tuple(sorted(
+            timespans or (),
+            key=lambda x: (x.start_offset, x.stop_offset),
+            ))
+        self._timespans = timespans
+        self._start_offsets = numpy.array(
+            [float(_.start_offset) for _ in timespans],
+            dtype=numpy.float64,
+            )
+        self._stop_offsets = numpy.array(
+            [float(_.stop_offset) for _ in timespans],
+            dtype=numpy.float64,
+            )
+        self._stop_order = numpy.argsort(self._stop_offsets, kind='mergesort')
+        self._sorted_stop_offsets = self._stop_offsets[self._stop_order]
+
+    ### SPECIAL METHODS ###
+
+    def __iter__(self):
+        return iter(self._timespans)
+
+    def __len__(self):
+        return len(self._timespans)
+
+    ### PRIVATE METHODS ###
+
+    def _select(self, indices, predicate):
+        timespans = self._timespans
+        return tuple(
+            timespans[index] for index in sorted(indices)
+            if predicate(timespans[index])
+            )
+
+    ### PUBLIC METHODS ###
+
+    def find_timespans_intersecting_timespan(self, timespan):
+        """
+        Finds timespans intersecting `timespan`.
+
+        Returns tuple of 0 or more timespans.
+        """
+        import numpy
+        start_offset = float(timespan.start_offset)
+        stop_offset = float(timespan.stop_offset)
+        stop_index = numpy.searchsorted(
+            self._start_offsets, max(start_offset, stop_offset), 'right')
+        indices = numpy.flatnonzero(
+            start_offset <= self._stop_offsets[:stop_index])
+        return self._select(
+            indices.tolist(),
+            lambda x: x.intersects_timespan(timespan),
+            )
+
+    def find_timespans_overlapping_offset(self, offset):
+        """
+        Finds timespans overlapping `offset`.
+
+        Returns tuple of 0 or more timespans.
+        """
+        import numpy
+        float_offset = float(offset)
+        stop_index = numpy.searchsorted(
+            self._start_offsets, float_offset, 'right')
+        indices = numpy.flatnonzero(
+            float_offset <= self._stop_offsets[:stop_index])
+        return self._select(
+            indices.tolist(),
+            lambda x: x.start_offset < offset < x.stop_offset,
+            )
+
+    def find_timespans_starting_at(self, offset):
+        """
+        Finds timespans starting at `offset`.
+
+        Returns tuple of 0 or more timespans.
+        """
+        import numpy
+        float_offset = float(offset)
+        start_index = numpy.searchsorted(
+            self._start_offsets, float_offset, 'left')
+        stop_index = numpy.searchsorted(
+            self._start_offsets, float_offset, 'right')
+        return self._select(
+            range(start_index, stop_index),
+            lambda x: x.start_offset == offset,
+            )
+
+    def find_timespans_stopping_at(self, offset):
+        """
+        Finds timespans stopping at `offset`.
+
+        Returns tuple of 0 or more timespans.
+        """
+        import numpy
+        float_offset = float(offset)
+        start_index = numpy.searchsorted(
+            self._sorted_stop_offsets, float_offset, 'left')
+        stop_index = numpy.searchsorted(
+            self._sorted_stop_offsets, float_offset, 'right')
+        return self._select(
+            self._stop_order[start_index:stop_index].tolist(),
+            lambda x: x.stop_offset == offset,
+            )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def start_offsets(self):
+        """
+        Gets start offsets of timespans in this snapshot, as floats.
+
+        Returns NumPy array.
+        """
+        return self._start_offsets
+
+    @property
+    def stop_offsets(self):
+        """
+        Gets stop offsets of timespans in this snapshot, as floats.
+
+        Returns NumPy array.
+        """
+        return self._stop_offsets
+
+    @property
+    def timespans(self):
+        """
+        Gets timespans in this snapshot, sorted by start and stop offset.
+
+        Returns tuple.
+        """
+        return self._timespans
@@ -0,0 +1,44 @@
+# -*- encoding: utf-8 -*-
+import random
+from abjad.tools import durationtools
+from abjad.tools import timespantools
+from supriya import timetools
+
+
+def test_TimespanCollectionSnapshot_01():
+    random.seed(2)
+    timespans = []
+    for _ in range(200):
+        start_offset = durationtools.Offset(random.randint(0, 120), 3)
+        stop_offset = start_offset + durationtools.Offset(
+            random.randint(0, 40), random.choice([1, 3, 7]))
+        timespans.append(timespantools.Timespan(start_offset, stop_offset))
+    timespan_collection = timetools.TimespanCollection(timespans)
+    snapshot = timespan_collection.get_snapshot()
+    assert snapshot.timespans == tuple(timespan_collection)
+    assert len(snapshot.start_offsets) == len(snapshot.stop_offsets) == 200
+    offsets = timespan_collection.all_offsets + (-1, 1. / 3, 0.33, 1000)
+    for offset in offsets:
+        assert snapshot.find_timespans_starting_at(offset) == \
+            timespan_collection.find_timespans_starting_at(offset)
+        assert snapshot.find_timespans_stopping_at(offset) == \
+            timespan_collection.find_timespans_stopping_at(offset)
+        assert snapshot.find_timespans_overlapping_offset(offset) == \
+            timespan_collection.find_timespans_overlapping_offset(offset)
+    for _ in range(100):
+        start_offset, stop_offset = sorted(random.sample(offsets[:-4], 2))
+        timespan = timespantools.Timespan(start_offset, stop_offset)
+        expected = timespan_collection.find_timespans_intersecting_timespan(
+            timespan)
+        assert snapshot.find_timespans_intersecting_timespan(timespan) == \
+            expected
+        assert expected == tuple(
+            _ for _ in timespan_collection if _.intersects_timespan(timespan))
+
+
+def test_TimespanCollectionSnapshot_02():
+    snapshot = timetools.TimespanCollectionSnapshot()
+    assert len(snapshot) == 0
+    assert snapshot.find_timespans_overlapping_offset(0) == ()
+    assert snapshot.find_timespans_starting_at(0) == ()
+    assert snapshot.find_timespans_stopping_at(0) == ()
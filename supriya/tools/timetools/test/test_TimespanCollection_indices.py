@@ -0,0 +1,76 @@
+# -*- encoding: utf-8 -*-
+import random
+from abjad.tools import timespantools
+from supriya import timetools
+
+
+def check_collection(timespan_collection, timespans):
+    expected = sorted(timespans, key=lambda x: (x.start_offset, x.stop_offset))
+    assert len(timespan_collection) == len(expected)
+    assert list(timespan_collection) == expected
+    assert [timespan_collection[i] for i in range(len(expected))] == expected
+    assert timespan_collection[3:-3] == expected[3:-3]
+    for timespan in set(expected):
+        assert timespan_collection.index(timespan) == expected.index(timespan)
+    if expected:
+        assert timespan_collection.earliest_stop_offset == \
+            min(_.stop_offset for _ in expected)
+        assert timespan_collection.latest_stop_offset == \
+            max(_.stop_offset for _ in expected)
+
+    def recurse(node):
+        if node is None:
+            return 0, -1
+        left_count, left_height = recurse(node.left_child)
+        right_count, right_height = recurse(node.right_child)
+        assert node.subtree_count == \
+            left_count + right_count + len(node.payload)
+        assert node.balance == right_height - left_height
+        assert -1 <= node.balance <= 1
+        return node.subtree_count, max(left_height, right_height) + 1
+
+    recurse(timespan_collection._root_node)
+
+
+def test_TimespanCollection_indices_01():
+    """
+    Incremental inserts and removals.
+    """
+    random.seed(1)
+    timespans = []
+    timespan_collection = timetools.TimespanCollection()
+    for _ in range(300):
+        start_offset = random.randint(0, 50)
+        timespan = timespantools.Timespan(
+            start_offset=start_offset,
+            stop_offset=start_offset + random.randint(1, 10),
+            )
+        timespans.append(timespan)
+        timespan_collection.insert(timespan)
+    check_collection(timespan_collection, timespans)
+    random.shuffle(timespans)
+    for timespan in timespans[:200]:
+        timespan_collection.remove(timespan)
+    check_collection(timespan_collection, timespans[200:])
+
+
+def test_TimespanCollection_indices_02():
+    """
+    Bulk loading.
+    """
+    random.seed(2)
+    timespans = []
+    for _ in range(300):
+        start_offset = random.randint(0, 50)
+        timespans.append(timespantools.Timespan(
+            start_offset=start_offset,
+            stop_offset=start_offset + random.randint(1, 10),
+            ))
+    timespan_collection = timetools.TimespanCollection(timespans)
+    check_collection(timespan_collection, timespans)
+    timespan_collection.insert(timespantools.Timespan(-1, 100))
+    timespan_collection.remove(timespans[:10])
+    check_collection(
+        timespan_collection,
+        timespans[10:] + [timespantools.Timespan(-1, 100)],
+        )
@@ -0,0 +1,39 @@
+# -*- encoding: utf-8 -*-
+import random
+from abjad.tools import durationtools
+from abjad.tools import timespantools
+from supriya import timetools
+
+
+def make_timespans(seed):
+    random.seed(seed)
+    timespans = []
+    for _ in range(200):
+        start_offset = durationtools.Offset(random.randint(0, 120), 4)
+        stop_offset = start_offset + durationtools.Offset(
+            random.randint(0, 40), random.choice([1, 3, 4]))
+        timespans.append(timespantools.Timespan(start_offset, stop_offset))
+    return timespans
+
+
+def test_TimespanCollection_iterate_offset_sweep_01():
+    timespan_collection = timetools.TimespanCollection(make_timespans(1))
+    offsets = sorted(timespan_collection.all_offsets + (-1, 5.5, 1000))
+    random.shuffle(offsets)
+    results = list(timespan_collection.iterate_offset_sweep(offsets))
+    assert len(results) == len(offsets) - 1
+    for offset, starting, stopping, overlapping in results:
+        assert starting == \
+            timespan_collection.find_timespans_starting_at(offset)
+        assert stopping == \
+            timespan_collection.find_timespans_stopping_at(offset)
+        assert overlapping == \
+            timespan_collection.find_timespans_overlapping_offset(offset)
+
+
+def test_TimespanCollection_iterate_offset_sweep_02():
+    timespan_collection = timetools.TimespanCollection()
+    assert list(timespan_collection.iterate_offset_sweep([0, 1])) == [
+        (0, (), (), ()),
+        (1, (), (), ()),
+        ]
@@ -22,6 +22,10 @@ class UGen(UGenMethodMixin):
         '_special_index',
         )
 
+    _expandable_types = {}
+
+    _metadata = {}
+
     _ordered_input_names = ()
 
     _signal_range = SignalRange.BIPOLAR
@@ -42,8 +46,9 @@ class UGen(UGenMethodMixin):
         from supriya import synthdeftools
         assert isinstance(calculation_rate, synthdeftools.CalculationRate), \
             calculation_rate
-        if self._valid_rates is not None:
-            assert calculation_rate in self._valid_rates
+        _, unexpanded_input_names, valid_rates = self._get_metadata()
+        if valid_rates is not None:
+            assert calculation_rate in valid_rates
         self._calculation_rate = calculation_rate
         self._inputs = []
         self._special_index = special_index
@@ -51,16 +56,12 @@ class UGen(UGenMethodMixin):
             UGen,
             synthdeftools.Parameter,
             )
-        for i in range(len(self._ordered_input_names)):
-            input_name = self._ordered_input_names[i]
-            input_value = kwargs.get(input_name, None)
-            if input_name in kwargs:
-                input_value = kwargs[input_name]
-                del(kwargs[input_name])
+        for input_name in self._ordered_input_names:
+            input_value = kwargs.pop(input_name, None)
             if isinstance(input_value, ugenlike_prototype):
                 assert len(input_value) == 1
                 input_value = input_value[0]
-            if self._is_unexpanded_input_name(input_name):
+            if input_name in unexpanded_input_names:
                 if isinstance(input_value, collections.Sequence):
                     input_value = tuple(input_value)
                 elif not self._is_valid_input(input_value):
@@ -289,7 +290,6 @@ class UGen(UGenMethodMixin):
             [('bus', 9), ('source', (1, 2, 3))]
 
         """
-        from supriya.tools import synthdeftools
         dictionary = dictionary.copy()
         cached_unexpanded_inputs = {}
         if unexpanded_input_names is not None:
@@ -299,28 +299,22 @@ class UGen(UGenMethodMixin):
                 cached_unexpanded_inputs[input_name] = \
                     dictionary[input_name]
                 del(dictionary[input_name])
+        expanded_items = []
         maximum_length = 1
-        result = []
-        prototype = (
-            collections.Sequence,
-            UGen,
-            synthdeftools.Parameter,
-            )
         for name, value in dictionary.items():
-            if isinstance(value, prototype) and \
-                not isinstance(value, six.string_types):
+            if UGen._is_expandable(value):
+                expanded_items.append((name, value, len(value)))
                 maximum_length = max(maximum_length, len(value))
+        if not expanded_items:
+            dictionary.update(cached_unexpanded_inputs)
+            return [dictionary]
+        result = []
         for i in range(maximum_length):
-            result.append({})
-            for name, value in dictionary.items():
-                if isinstance(value, prototype) and \
-                    not isinstance(value, six.string_types):
-                    value = value[i % len(value)]
-                    result[i][name] = value
-                else:
-                    result[i][name] = value
-        for expanded_inputs in result:
+            expanded_inputs = dictionary.copy()
+            for name, value, length in expanded_items:
+                expanded_inputs[name] = value[i % length]
             expanded_inputs.update(cached_unexpanded_inputs)
+            result.append(expanded_inputs)
         return result
 
     @staticmethod
@@ -338,20 +332,63 @@ class UGen(UGenMethodMixin):
             return cls.kr
         return cls.new
 
+    @classmethod
+    def _get_metadata(cls):
+        # Construction metadata is fixed per class, so compute it once rather
+        # than inspecting the initializer's signature on every instantiation.
+        try:
+            return UGen._metadata[cls]
+        except KeyError:
+            pass
+        signature = cls._get_signature(cls.__init__)
+        valid_rates = cls._valid_rates
+        if valid_rates is not None:
+            valid_rates = frozenset(valid_rates)
+        metadata = (
+            'special_index' in signature.parameters,
+            frozenset(cls._unexpanded_input_names or ()),
+            valid_rates,
+            )
+        UGen._metadata[cls] = metadata
+        return metadata
+
     def _get_output_number(self):
         return 0
 
     def _get_outputs(self):
         return [self.calculation_rate] * len(self)
 
+    @staticmethod
+    def _get_signature(function):
+        import sys
+        if sys.version_info[0] == 2:
+            import funcsigs
+            return funcsigs.signature(function)
+        import inspect
+        return inspect.signature(function)
+
     def _get_source(self):
         return self
 
-    def _is_unexpanded_input_name(self, input_name):
-        if self._unexpanded_input_names:
-            if input_name in self._unexpanded_input_names:
-                return True
-        return False
+    @staticmethod
+    def _is_expandable(value):
+        value_type = type(value)
+        try:
+            return UGen._expandable_types[value_type]
+        except KeyError:
+            pass
+        from supriya.tools import synthdeftools
+        prototype = (
+            collections.Sequence,
+            UGen,
+            synthdeftools.Parameter,
+            )
+        is_expandable = (
+            issubclass(value_type, prototype) and
+            not issubclass(value_type, six.string_types)
+            )
+        UGen._expandable_types[value_type] = is_expandable
+        return is_expandable
 
     def _is_valid_input(self, input_value):
         from supriya import synthdeftools
@@ -367,19 +404,12 @@ class UGen(UGenMethodMixin):
         special_index=0,
         **kwargs
         ):
-        import sys
         from supriya import synthdeftools
-        if sys.version_info[0] == 2:
-            import funcsigs
-            get_signature = funcsigs.signature
-        else:
-            import inspect
-            get_signature = inspect.signature
-        signature = get_signature(cls.__init__)
+        has_custom_special_index, unexpanded_input_names, _ = \
+            cls._get_metadata()
         input_dicts = UGen._expand_dictionary(
-            kwargs, unexpanded_input_names=cls._unexpanded_input_names)
+            kwargs, unexpanded_input_names=unexpanded_input_names)
         ugens = []
-        has_custom_special_index = 'special_index' in signature.parameters
         for input_dict in input_dicts:
             if has_custom_special_index:
                 ugen = cls._new_single(
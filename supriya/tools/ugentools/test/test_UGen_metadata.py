@@ -0,0 +1,52 @@
+# -*- encoding: utf-8 -*-
+import inspect
+from supriya.tools import documentationtools
+from supriya.tools import synthdeftools
+from supriya.tools import ugentools
+
+
+def test_UGen_metadata_01():
+    classes = documentationtools.list_all_supriya_classes(
+        bases=ugentools.UGen,
+        )
+    for cls in classes:
+        if inspect.isabstract(cls):
+            continue
+        has_special_index, unexpanded_input_names, valid_rates = \
+            cls._get_metadata()
+        assert cls._get_metadata() is cls._get_metadata()
+        signature = ugentools.UGen._get_signature(cls.__init__)
+        assert has_special_index == ('special_index' in signature.parameters)
+        assert unexpanded_input_names == \
+            frozenset(cls._unexpanded_input_names or ())
+        if cls._valid_rates is None:
+            assert valid_rates is None
+        else:
+            assert valid_rates == frozenset(cls._valid_rates)
+
+
+def test_UGen_metadata_02():
+    r'''Constructs a graph of about 10k ugens.'''
+    with synthdeftools.SynthDefBuilder(
+        amplitude=0.1,
+        frequency=440,
+        ) as builder:
+        sources = []
+        for i in range(1050):
+            sine = ugentools.SinOsc.ar(
+                frequency=[builder['frequency'] * (i + 1), i + 2],
+                )
+            pan = ugentools.Pan2.ar(
+                position=ugentools.LFNoise1.kr(frequency=i + 0.5),
+                source=sine[0],
+                )
+            filtered = ugentools.LPF.ar(frequency=(1000, 2000), source=pan)
+            sources.append(filtered * builder['amplitude'])
+        ugentools.Out.ar(
+            bus=0,
+            source=[
+                ugentools.Mix.new([_[0] for _ in sources]),
+                ugentools.Mix.new([_[1] for _ in sources]),
+                ],
+            )
+    assert 10000 < len(builder._ugens)